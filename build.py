@@ -0,0 +1,53 @@
+"""
+Build script that compiles the color models with mypyc.
+
+Compilation is skipped when mypyc or a C compiler is not available,
+or when `PINKIE_COMPILE=0` is set, producing a pure Python package.
+"""
+import os
+import shutil
+import sys
+
+
+MODULES = [
+    'pinkie/rgba.py',
+    'pinkie/hsla.py',
+    'pinkie/cmyk.py',
+    'pinkie/blend.py',
+    'pinkie/gamma.py',
+]
+
+
+def build() -> None:
+    if os.environ.get('PINKIE_COMPILE', '1') == '0':
+        return
+
+    try:
+        from mypyc.build import mypycify
+        from setuptools import Distribution
+        from setuptools.command.build_ext import build_ext
+    except ImportError:
+        print("mypyc is not available, building pure Python package", file=sys.stderr)
+        return
+
+    try:
+        distribution = Distribution({
+            'name': 'pinkie',
+            # keep the shared runtime library inside the package
+            'ext_modules': mypycify(
+                MODULES, 
+                opt_level='3', 
+                separate=[(MODULES, 'pinkie._compiled')]
+            ),
+        })
+        command = build_ext(distribution)
+        command.inplace = True
+        command.ensure_finalized()
+        command.run()
+    except (Exception, SystemExit) as e:
+        print(f"Compilation failed, building pure Python package: {e}", file=sys.stderr)
+        shutil.rmtree('build', ignore_errors=True)
+
+
+if __name__ == '__main__':
+    build()
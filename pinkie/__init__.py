@@ -1,4 +1,117 @@
-from .rgba import *
-from .hsla import *
-from .blend import *
-from .palette import *
+import importlib
+import os
+import sys
+
+
+# modules are imported on first attribute access (PEP 562)
+# to keep the package cheap to import
+_exports = {
+    'RGBA': 'rgba',
+    'Color': 'rgba',
+    'HSLA': 'hsla',
+    'CMYK': 'cmyk',
+    'RGBAF': 'rgbaf',
+    'RGBAFArray': 'rgbaf',
+    'BlendMode': 'blend',
+    'Normal': 'blend',
+    'Darken': 'blend',
+    'Multiply': 'blend',
+    'ColorBurn': 'blend',
+    'Lighten': 'blend',
+    'Screen': 'blend',
+    'ColorDodge': 'blend',
+    'Overlay': 'blend',
+    'SoftLight': 'blend',
+    'HardLight': 'blend',
+    'Difference': 'blend',
+    'Exclusion': 'blend',
+    'Palette': 'palette',
+    'Adjust': 'adjust',
+    'LUT3D': 'lut',
+    'OctreeQuantizer': 'quantize',
+    'ColorStats': 'histogram',
+    'ColorPool': 'pool',
+    'TileCompositor': 'tiles',
+    'pairwise_distances': 'cluster',
+    'distance': 'utils',
+    'stats': 'profiling',
+    'profile': 'profiling',
+    'set_num_threads': 'parallel',
+    'get_num_threads': 'parallel',
+}
+
+_submodules = {
+    'adjust',
+    'aio',
+    'batch',
+    'blend',
+    'cluster',
+    'cmyk',
+    'contrast',
+    'gamma',
+    'generate',
+    'histogram',
+    'hsl',
+    'hsla',
+    'interop',
+    'lut',
+    'palette',
+    'parallel',
+    'pool',
+    'profiling',
+    'quantize',
+    'rgba',
+    'rgbaf',
+    'swatch',
+    'tiles',
+    'utils',
+}
+
+__all__ = list(_exports)
+
+
+class _SourceFinder:
+    """Import finder that skips compiled modules of the package."""
+
+    @staticmethod
+    def find_spec(name, path=None, target=None):
+        if not name.startswith(f'{__name__}.') or not path:
+            return None
+        
+        filename = os.path.join(path[0], f'{name.rpartition(".")[2]}.py')
+        if not os.path.exists(filename):
+            return None
+
+        from importlib.util import spec_from_file_location
+
+        return spec_from_file_location(name, filename)
+
+
+# compiled modules are picked automatically if they are built,
+# this variable forces pure Python ones
+if os.environ.get('PINKIE_PURE_PYTHON'):
+    sys.meta_path.insert(0, _SourceFinder)
+
+
+def is_compiled() -> bool:
+    """Check if the color models use the compiled backend."""
+    from . import rgba
+
+    return not rgba.__file__.endswith('.py')
+
+
+def __getattr__(name: str):
+    if name in _submodules:
+        return importlib.import_module(f'.{name}', __name__)
+
+    if name not in _exports:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+    module = importlib.import_module(f'.{_exports[name]}', __name__)
+    value = getattr(module, name)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> list[str]:
+    return sorted({*globals(), *_exports, *_submodules})
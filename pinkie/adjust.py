@@ -0,0 +1,197 @@
+import functools
+from collections.abc import Callable, MutableSequence, Sequence
+
+from .hsl import hsl_to_rgb, rgb_to_hsl
+from .hsla import _rgb
+from .parallel import map_chunks
+from .rgba import RGBA, _hsl
+
+
+_Step = Callable[[int, int, int], tuple[int, int, int]]
+
+
+def _clamp(value: int) -> int:
+    return min(max(value, 0), 100)
+
+
+class Adjust:
+    """
+    Chain of hue, saturation and lightness adjustments.
+
+    Adjustments follow `HSLA` semantics: the color is converted
+    by `RGBA.to_hsla`, changed like `HSLA` attributes and converted
+    back by `HSLA.to_rgba`, except that bit count and alpha are kept.
+    The whole chain runs in one pass, and packed values convert
+    each unique color once.
+
+    ```
+    Adjust().hue(30).saturation(1.2).lightness(-5)
+    ```
+    """
+
+    __slots__ = ('_steps',)
+
+    def __init__(self) -> None:
+        self._steps: tuple[_Step, ...] = ()
+
+    def __len__(self) -> int:
+        return len(self._steps)
+
+    def _then(self, step: _Step) -> "Adjust":
+        obj = Adjust()
+        obj._steps = self._steps + (step,)
+        return obj
+
+    def hue(self, degrees: int) -> "Adjust":
+        """
+        Rotate hue.
+
+        Parameters
+        ----------
+        degrees: `int`
+            Hue shift in degrees.
+        """
+        return self._then(lambda h, s, l: ((h + degrees) % 360, s, l))
+
+    def saturation(self, factor: float) -> "Adjust":
+        """
+        Scale saturation.
+
+        Parameters
+        ----------
+        factor: `float`
+            Saturation multiplier. The result is rounded.
+        """
+        return self._then(lambda h, s, l: (h, _clamp(round(s * factor)), l))
+
+    def lightness(self, delta: int) -> "Adjust":
+        """
+        Change lightness.
+
+        Parameters
+        ----------
+        delta: `int`
+            Lightness change in range `-100-100`.
+        """
+        return self._then(lambda h, s, l: (h, s, _clamp(l + delta)))
+
+    def colorize(self, hue: int, saturation: int | None = None) -> "Adjust":
+        """
+        Replace hue and optionally saturation, keeping lightness.
+
+        Parameters
+        ----------
+        hue: `int`
+            New hue in degrees.
+        saturation: `int` | `None`
+            New saturation in range `0-100`.
+        """
+        hue %= 360
+        if saturation is None:
+            return self._then(lambda h, s, l: (hue, s, l))
+
+        saturation = _clamp(saturation)
+        return self._then(lambda h, s, l: (hue, saturation, l))
+
+    def _compile(
+        self, 
+        fast: bool, 
+        max_one: int = 255
+    ) -> Callable[[int, int, int], tuple[int, int, int]]:
+        steps = self._steps
+
+        def _adjust(r: int, g: int, b: int) -> tuple[int, int, int]:
+            if fast:
+                h, s, l = rgb_to_hsl(r, g, b, max_one)
+            else:
+                hf, sf, lf = _hsl(r / max_one, g / max_one, b / max_one)
+                h, s, l = round(hf) % 360, round(sf * 100), round(lf * 100)
+
+            for step in steps:
+                h, s, l = step(h, s, l)
+
+            return hsl_to_rgb(h, s, l) if fast else _rgb(h, s, l)
+
+        return _adjust
+
+    def __call__(self, color: RGBA, fast: bool = False) -> RGBA:
+        """
+        Get an adjusted copy of the color.
+
+        Parameters
+        ----------
+        color: `RGBA`
+            Color to adjust.
+        fast: `bool`
+            Whether to use integer math and lookup tables. Hue, saturation
+            and lightness may differ from the exact path by 1 unit.
+        """
+        return self.apply_inplace(color.copy(), fast)
+
+    def apply_inplace(self, color: RGBA, fast: bool = False) -> RGBA:
+        """
+        Adjust the color in place.
+
+        Parameters
+        ----------
+        color: `RGBA`
+            Color to adjust.
+        fast: `bool`
+            Whether to use integer math and lookup tables. Hue, saturation
+            and lightness may differ from the exact path by 1 unit.
+        """
+        bits = color.bits
+        max_one = (1 << bits) - 1
+        rgb = self._compile(fast, max_one)(*color.rgb)
+
+        value = color.a
+        for num, c in zip((3, 2, 1), rgb):
+            if bits != 8:
+                c = (c * max_one * 2 + 255) // 510
+            value |= c << (num * bits)
+
+        return color._assign(value, bits)
+
+    def apply(
+        self,
+        values: Sequence[int],
+        fast: bool = False,
+        out: MutableSequence[int] | None = None
+    ) -> MutableSequence[int]:
+        """
+        Adjust packed 8-bit RGBA values.
+
+        Large inputs are split between threads of `pinkie.parallel`.
+
+        Parameters
+        ----------
+        values: `Sequence[int]`
+            Packed values.
+        fast: `bool`
+            Whether to use integer math and lookup tables. Hue, saturation
+            and lightness may differ from the exact path by 1 unit.
+        out: `MutableSequence[int]` | `None`
+            List or array to write the results to instead of creating
+            a new list. May be `values` to work in place.
+
+        Raises
+        ------
+        `ValueError`
+            If the output has a different length.
+        """
+        return map_chunks(functools.partial(self._apply, fast=fast), values, out=out)
+
+    def _apply(self, values: Sequence[int], fast: bool) -> list[int]:
+        adjust = self._compile(fast)
+        adjusted: dict[int, int] = {}
+        result = []
+
+        for value in values:
+            rgb = value >> 8
+            if rgb not in adjusted:
+                r, g, b = adjust(rgb >> 16, rgb >> 8 & 0xFF, rgb & 0xFF)
+                adjusted[rgb] = r << 24 | g << 16 | b << 8
+
+            result.append(adjusted[rgb] | value & 0xFF)
+
+        return result
@@ -0,0 +1,277 @@
+import asyncio
+import functools
+from collections import Counter
+from collections.abc import AsyncIterator, Callable, Sequence
+from concurrent.futures import Executor
+
+from . import batch
+from .blend import BlendMode
+from .palette import Palette
+
+
+DEFAULT_CHUNK_SIZE = 65536
+
+_executor: Executor | None = None
+
+
+def set_executor(executor: Executor | None) -> None:
+    """
+    Set an executor used by default.
+
+    Parameters
+    ----------
+    executor: `Executor` | `None`
+        Thread or process pool. If `None`, the default executor
+        of the event loop is used.
+    """
+    global _executor
+    _executor = executor
+
+
+async def iter_chunks(
+    func: Callable[..., object],
+    values: Sequence,
+    *args,
+    chunk_size: int = DEFAULT_CHUNK_SIZE,
+    max_pending: int = 2,
+    executor: Executor | None = None
+) -> AsyncIterator:
+    """
+    Apply the function to chunks of values in an executor
+    and yield the results in order.
+
+    At most `max_pending` chunks are processed at once, so a slow consumer
+    pauses the work. Pending chunks are cancelled when the iterator is closed.
+
+    Parameters
+    ----------
+    func: `Callable`
+        Function that takes a chunk and the arguments.
+        Must be picklable for process pools.
+    values: `Sequence`
+        Values to split into chunks.
+    *args:
+        Additional arguments of the function.
+    chunk_size: `int`
+        Number of values in a chunk.
+    max_pending: `int`
+        Maximum number of chunks processed at once.
+    executor: `Executor` | `None`
+        Executor to use instead of the default one.
+
+    Raises
+    ------
+    `ValueError`
+        If the chunk size or the number of pending chunks is not positive.
+    """
+    if chunk_size < 1 or max_pending < 1:
+        raise ValueError("Chunk size and number of pending chunks must be positive")
+
+    loop = asyncio.get_running_loop()
+    executor = executor or _executor
+    pending: list[asyncio.Future] = []
+
+    def _submit(start: int) -> None:
+        chunk = values[start:start + chunk_size]
+        if isinstance(chunk, memoryview):
+            chunk = chunk.tolist()
+
+        pending.append(loop.run_in_executor(executor, func, chunk, *args))
+
+    starts = iter(range(0, len(values), chunk_size))
+
+    try:
+        for start in starts:
+            _submit(start)
+            if len(pending) >= max_pending:
+                break
+
+        while pending:
+            result = await pending.pop(0)
+
+            for start in starts:
+                _submit(start)
+                break
+
+            yield result
+    finally:
+        for future in pending:
+            future.cancel()
+
+
+async def _gather(func, values, *args, **kwargs) -> list:
+    result = []
+    async for chunk in iter_chunks(func, values, *args, **kwargs):
+        result.extend(chunk)
+    return result
+
+
+async def compose(
+    mode: BlendMode,
+    bg: Sequence[int],
+    fg: Sequence[int],
+    bits: int = 8,
+    *,
+    chunk_size: int = DEFAULT_CHUNK_SIZE,
+    executor: Executor | None = None
+) -> list[int]:
+    """
+    Compose sequences of packed RGBA values pairwise without blocking the event loop.
+
+    Parameters
+    ----------
+    mode: `BlendMode`
+        Blending mode.
+    bg: `Sequence[int]`
+        Background values.
+    fg: `Sequence[int]`
+        Foreground values.
+    bits: `int`
+        Number of bits per channel.
+    chunk_size: `int`
+        Number of values processed at once.
+    executor: `Executor` | `None`
+        Executor to use instead of the default one.
+
+    Raises
+    ------
+    `ValueError`
+        If the sequences have different lengths.
+    """
+    if len(bg) != len(fg):
+        raise ValueError("Cannot blend sequences of different length")
+
+    return await _gather(
+        _compose_pairs, _Pairs(bg, fg), mode, bits,
+        chunk_size=chunk_size, executor=executor
+    )
+
+
+class _Pairs:
+    # slices both sequences at once, so each job gets only its chunk
+    # and the sequences are never zipped as a whole
+
+    __slots__ = ('_bg', '_fg')
+
+    def __init__(self, bg: Sequence[int], fg: Sequence[int]) -> None:
+        self._bg = bg
+        self._fg = fg
+
+    def __len__(self) -> int:
+        return len(self._bg)
+
+    def __getitem__(self, index: slice) -> tuple[Sequence[int], Sequence[int]]:
+        bg = self._bg[index]
+        fg = self._fg[index]
+        # memoryviews cannot be sent to process pools
+        if isinstance(bg, memoryview):
+            bg = bg.tolist()
+        if isinstance(fg, memoryview):
+            fg = fg.tolist()
+        return bg, fg
+
+
+def _compose_pairs(
+    pair: tuple[Sequence[int], Sequence[int]],
+    mode: BlendMode,
+    bits: int
+) -> list[int]:
+    bg, fg = pair
+    return mode.compose_packed(bg, fg, bits)
+
+
+async def quantize(
+    values: Sequence[int],
+    palette: Palette | Sequence[int],
+    bits: int = 8,
+    *,
+    chunk_size: int = DEFAULT_CHUNK_SIZE,
+    executor: Executor | None = None
+) -> list[int]:
+    """
+    Replace packed RGBA values with the closest colors
+    of the palette without blocking the event loop.
+
+    Parameters
+    ----------
+    values: `Sequence[int]`
+        Packed values.
+    palette: `Palette` | `Sequence[int]`
+        Palette or its packed values.
+    bits: `int`
+        Number of bits per channel.
+    chunk_size: `int`
+        Number of values processed at once.
+    executor: `Executor` | `None`
+        Executor to use instead of the default one.
+
+    Raises
+    ------
+    `ValueError`
+        If the palette is empty.
+    """
+    if isinstance(palette, Palette):
+        palette = list(palette._live())
+
+    if len(palette) == 0:
+        raise ValueError("Specify at least 1 color")
+
+    return await _gather(
+        batch.quantize, values, palette, bits,
+        chunk_size=chunk_size, executor=executor
+    )
+
+
+async def extract(
+    values: Sequence[int],
+    num: int,
+    bits: int = 8,
+    *,
+    chunk_size: int = DEFAULT_CHUNK_SIZE,
+    executor: Executor | None = None
+) -> Palette:
+    """
+    Get a palette of the most common colors without blocking the event loop.
+
+    Parameters
+    ----------
+    values: `Sequence[int]`
+        Packed values.
+    num: `int`
+        Maximum number of colors.
+    bits: `int`
+        Number of bits per channel.
+    chunk_size: `int`
+        Number of values processed at once.
+    executor: `Executor` | `None`
+        Executor to use instead of the default one.
+    """
+    counts: Counter = Counter()
+    async for chunk in iter_chunks(
+        batch.count, values, chunk_size=chunk_size, executor=executor
+    ):
+        counts.update(chunk)
+
+    return batch.extract(counts, num, bits)
+
+
+async def run(func: Callable[..., object], *args, executor: Executor | None = None, **kwargs):
+    """
+    Run any function in an executor without blocking the event loop.
+
+    Parameters
+    ----------
+    func: `Callable`
+        Function to run.
+    *args:
+        Positional arguments of the function.
+    executor: `Executor` | `None`
+        Executor to use instead of the default one.
+    **kwargs:
+        Keyword arguments of the function.
+    """
+    loop = asyncio.get_running_loop()
+    return await loop.run_in_executor(
+        executor or _executor,
+        functools.partial(func, *args, **kwargs)
+    )
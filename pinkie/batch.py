@@ -0,0 +1,352 @@
+import functools
+from array import array
+from collections import Counter
+from collections.abc import Iterable, MutableSequence, Sequence
+
+from .adjust import Adjust
+from .blend import BlendMode
+from .cmyk import _pack_cmyk
+from .hsl import rgb_to_hsl
+from .hsla import _pack_hsla
+from .palette import Palette
+from .parallel import map_chunks
+from .rgba import _hsl
+from .utils import packed_typecode
+
+
+def _channels(value: int, bits: int) -> tuple[int, int, int, int]:
+    max_one = (1 << bits) - 1
+    return (
+        value >> (bits * 3) & max_one,
+        value >> (bits * 2) & max_one,
+        value >> bits & max_one,
+        value & max_one
+    )
+
+
+def compose(
+    mode: BlendMode,
+    bg: Sequence[int],
+    fg: Sequence[int],
+    bits: int = 8,
+    out: MutableSequence[int] | None = None
+) -> MutableSequence[int]:
+    """
+    Compose sequences of packed RGBA values pairwise.
+
+    Large inputs are split between threads of `pinkie.parallel`.
+
+    Parameters
+    ----------
+    mode: `BlendMode`
+        Blending mode.
+    bg: `Sequence[int]`
+        Background values.
+    fg: `Sequence[int]`
+        Foreground values.
+    bits: `int`
+        Number of bits per channel.
+    out: `MutableSequence[int]` | `None`
+        List or array to write the results to instead of creating 
+        a new list. May be one of the inputs to work in place.
+
+    Raises
+    ------
+    `ValueError`
+        If the sequences or the output have different lengths.
+    """
+    if len(bg) != len(fg):
+        raise ValueError("Cannot blend sequences of different length")
+
+    return map_chunks(
+        functools.partial(mode.compose_packed, bits=bits), 
+        bg, fg, 
+        out=out
+    )
+
+
+def _packed_array(num: int) -> array:
+    # packed HSLA and CMYK values take 30 bits
+    typecode = packed_typecode(8)
+    assert typecode is not None
+    return array(typecode, bytes(num * array(typecode).itemsize))
+
+
+def to_hsla(
+    values: Sequence[int], 
+    bits: int = 8, 
+    fast: bool = False,
+    packed: bool = False
+) -> MutableSequence:
+    """
+    Convert packed RGBA values to `(h, s, l, a)` tuples.
+
+    Results match `RGBA.to_hsla`. Large inputs are split 
+    between threads of `pinkie.parallel`.
+
+    Parameters
+    ----------
+    values: `Sequence[int]`
+        Packed values.
+    bits: `int`
+        Number of bits per channel.
+    fast: `bool`
+        Whether to use integer math only. Components may 
+        differ from the exact result by 1 unit.
+    packed: `bool`
+        Whether to return an array of packed values like `HSLA.decimal`
+        instead of a list of tuples. Packed values are plain integers,
+        so they hash, compare and deduplicate quickly.
+    """
+    func = _to_hsla_fast if fast else _to_hsla
+    if not packed:
+        return map_chunks(functools.partial(func, bits=bits), values)
+
+    return map_chunks(
+        functools.partial(_pack_chunk, func=func, pack=_pack_hsla, bits=bits),
+        values,
+        out=_packed_array(len(values))
+    )
+
+
+def _pack_chunk(values: Sequence[int], func, pack, bits: int) -> list[int]:
+    return [pack(*color) for color in func(values, bits)]
+
+
+def _to_hsla_fast(values: Sequence[int], bits: int) -> list[tuple[int, int, int, int]]:
+    max_one = (1 << bits) - 1
+    result = []
+
+    for value in values:
+        r, g, b, a = _channels(value, bits)
+        h, s, l = rgb_to_hsl(r, g, b, max_one)
+        result.append((h, s, l, (a * 200 + max_one) // (2 * max_one)))
+
+    return result
+
+
+def _to_hsla(values: Sequence[int], bits: int) -> list[tuple[int, int, int, int]]:
+    max_one = (1 << bits) - 1
+    result = []
+
+    for value in values:
+        r, g, b, a = _channels(value, bits)
+        h, s, l = _hsl(r / max_one, g / max_one, b / max_one)
+        result.append((
+            round(h) % 360, 
+            round(s * 100), 
+            round(l * 100), 
+            round(a / max_one * 100)
+        ))
+
+    return result
+
+
+def shift_hue(
+    values: Sequence[int], 
+    degrees: int, 
+    fast: bool = False,
+    out: MutableSequence[int] | None = None
+) -> MutableSequence[int]:
+    """
+    Rotate hue of packed 8-bit RGBA values.
+
+    Matches `RGBA.to_hsla()` with a changed hue converted back 
+    by `HSLA.to_rgba()`, except that alpha is kept as is.
+    Large inputs are split between threads of `pinkie.parallel`.
+
+    Parameters
+    ----------
+    values: `Sequence[int]`
+        Packed values.
+    degrees: `int`
+        Hue shift in degrees.
+    fast: `bool`
+        Whether to use integer math and lookup tables. Hue, saturation 
+        and lightness may differ from the exact path by 1 unit before
+        converting back.
+    out: `MutableSequence[int]` | `None`
+        List or array to write the results to instead of creating 
+        a new list. May be one of the inputs to work in place.
+
+    Raises
+    ------
+    `ValueError`
+        If the output has a different length.
+    """
+    return Adjust().hue(degrees).apply(values, fast, out)
+
+
+def to_cmyk(
+    values: Sequence[int], 
+    bits: int = 8, 
+    packed: bool = False
+) -> MutableSequence:
+    """
+    Convert packed RGBA values to `(c, m, y, k)` tuples.
+
+    Results match `RGBA.to_cmyk`. Large inputs are split 
+    between threads of `pinkie.parallel`.
+
+    Parameters
+    ----------
+    values: `Sequence[int]`
+        Packed values.
+    bits: `int`
+        Number of bits per channel.
+    packed: `bool`
+        Whether to return an array of packed values like `CMYK.decimal`
+        instead of a list of tuples.
+    """
+    if not packed:
+        return map_chunks(functools.partial(_to_cmyk, bits=bits), values)
+
+    return map_chunks(
+        functools.partial(_pack_chunk, func=_to_cmyk, pack=_pack_cmyk, bits=bits),
+        values,
+        out=_packed_array(len(values))
+    )
+
+
+def _to_cmyk(values: Sequence[int], bits: int) -> list[tuple[int, int, int, int]]:
+    max_one = (1 << bits) - 1
+    result = []
+
+    for value in values:
+        rgb = _channels(value, bits)[:3]
+        k = 1 - max(rgb) / max_one
+
+        if k == 1:
+            result.append((0, 0, 0, 100))
+            continue
+
+        c, m, y = ((1 - i / max_one - k) / (1 - k) for i in rgb)
+        result.append((round(c * 100), round(m * 100), round(y * 100), round(k * 100)))
+
+    return result
+
+
+def quantize(
+    values: Sequence[int],
+    palette: Palette | Sequence[int],
+    bits: int = 8,
+    out: MutableSequence[int] | None = None
+) -> MutableSequence[int]:
+    """
+    Replace packed RGBA values with the closest colors of the palette.
+
+    Uses the same Euclidean distance as `RGBA.closest`.
+    Each unique value is matched once per chunk. 
+    Large inputs are split between threads of `pinkie.parallel`.
+
+    Parameters
+    ----------
+    values: `Sequence[int]`
+        Packed values.
+    palette: `Palette` | `Sequence[int]`
+        Palette or its packed values.
+    bits: `int`
+        Number of bits per channel.
+    out: `MutableSequence[int]` | `None`
+        List or array to write the results to instead of creating 
+        a new list. May be one of the inputs to work in place.
+
+    Raises
+    ------
+    `ValueError`
+        If the palette is empty or the output has a different length.
+    """
+    if isinstance(palette, Palette):
+        palette = list(palette._live())
+
+    if len(palette) == 0:
+        raise ValueError("Specify at least 1 color")
+
+    candidates = [(v, _channels(v, bits)) for v in palette]
+    return map_chunks(
+        functools.partial(_quantize, candidates=candidates, bits=bits), 
+        values,
+        out=out
+    )
+
+
+def _quantize(
+    values: Sequence[int], 
+    candidates: list[tuple[int, tuple[int, int, int, int]]], 
+    bits: int
+) -> list[int]:
+    matched: dict[int, int] = {}
+    result = []
+
+    for value in values:
+        if value not in matched:
+            r, g, b, a = _channels(value, bits)
+            matched[value] = min(
+                candidates,
+                key=lambda c: (
+                    (c[1][0] - r) ** 2 + (c[1][1] - g) ** 2
+                    + (c[1][2] - b) ** 2 + (c[1][3] - a) ** 2
+                )
+            )[0]
+
+        result.append(matched[value])
+
+    return result
+
+
+def count(values: Iterable[int]) -> Counter:
+    """
+    Count occurrences of packed values.
+
+    Counters of separate chunks can be added together.
+
+    Parameters
+    ----------
+    values: `Iterable[int]`
+        Packed values.
+    """
+    return Counter(values)
+
+
+def unique(values: Iterable[int]) -> MutableSequence[int]:
+    """
+    Remove duplicates of packed values, keeping the first occurrences.
+
+    Works with packed `RGBA`, `HSLA` and `CMYK` values alike.
+
+    Parameters
+    ----------
+    values: `Iterable[int]`
+        Packed values.
+
+    Returns
+    -------
+    `MutableSequence[int]`
+        Array of the same type if the values are an array, otherwise a list.
+    """
+    result = dict.fromkeys(values)
+    if isinstance(values, array):
+        return array(values.typecode, result)
+    return list(result)
+
+
+def extract(
+    values: Iterable[int] | Counter,
+    num: int,
+    bits: int = 8
+) -> Palette:
+    """
+    Get a palette of the most common colors.
+
+    Parameters
+    ----------
+    values: `Iterable[int]` | `Counter`
+        Packed values or their counts.
+    num: `int`
+        Maximum number of colors.
+    bits: `int`
+        Number of bits per channel.
+    """
+    counts = values if isinstance(values, Counter) else count(values)
+    common = [value for value, _ in counts.most_common(num)]
+    return Palette._from_values(common, bits if common else None)
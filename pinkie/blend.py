@@ -1,8 +1,31 @@
+from collections.abc import Callable, Sequence
+
+from . import gamma
+from .utils import TYPE_CHECKING, mypyc_attr
+
+if TYPE_CHECKING:
+    from .rgbaf import RGBAF
+
+
+@mypyc_attr(allow_interpreted_subclasses=True)
 class BlendMode:
     """
     Base class of blending modes.
     """
 
+    linear: bool = False
+
+    def __init__(self, *, linear: bool = False) -> None:
+        """
+        Parameters
+        ----------
+        linear: `bool`
+            Whether to blend in linear light instead of gamma-encoded sRGB.
+            Channels are decoded and encoded through cached lookup tables,
+            so colors must have at most 16 bits per channel.
+        """
+        self.linear = linear
+
     def _alpha(
         self, 
         bg: tuple[float, float, float, float], 
@@ -10,6 +33,12 @@ class BlendMode:
     ) -> float:
         return bg[3] + fg[3] * (1 - bg[3])
     
+    def _decoder(self, bits: int) -> Callable[[int], tuple[float, float, float, float]]:
+        return gamma.dequantizer(bits, self.linear)
+
+    def _encoder(self, bits: int) -> Callable[[Sequence[float]], int]:
+        return gamma.quantizer(bits, self.linear)
+
     def blend(
         self, 
         bg: tuple[float, float, float, float], 
@@ -27,7 +56,7 @@ class BlendMode:
         """
         raise NotImplementedError("Blend method is not implemented")
    
-    def compose(self, bg, fg):
+    def compose(self, bg: "RGBA", fg: "RGBA", out: "RGBA | None" = None) -> "RGBA":
         """
         Compose background and foreground colors.
 
@@ -37,27 +66,247 @@ class BlendMode:
             Background color.
         fg: `RGBA`
             Foreground color.
+        out: `RGBA` | `None`
+            Color to write the result to instead of creating a new one.
+            May be one of the composed colors.
 
         Raises
         ------
         `ValueError` 
             If bit counts of the colors do not match.
         """
-        from .rgba import RGBA
-
-        bg: RGBA = bg
-        fg: RGBA = fg
-
         if bg.bits != fg.bits:
             raise ValueError(f"Cannot blend colors with different size")
 
         bits = bg.bits
-        max_one = (1 << bits) - 1
+        decode = self._decoder(bits)
+        blended = self.blend(decode(bg._data), decode(fg._data))
+
+        if out is None:
+            out = RGBA.__new__(RGBA)
+
+        return out._assign(self._encoder(bits)(blended), bits)
+    
+    def compose_float(self, bg: "RGBAF", fg: "RGBAF") -> "RGBAF":
+        """
+        Compose floating-point colors without quantizing.
+
+        Channels are blended as they are, so `linear` does not apply.
+
+        Parameters
+        ----------
+        bg: `RGBAF`
+            Background color.
+        fg: `RGBAF`
+            Foreground color.
+        """
+        from .rgbaf import RGBAF
+
+        return RGBAF(self.blend(bg.rgba, fg.rgba))
+
+    def compose_many(self, bg: Sequence["RGBA"], fg: Sequence["RGBA"]) -> list["RGBA"]:
+        """
+        Compose sequences of background and foreground colors pairwise.
+
+        Parameters
+        ----------
+        bg: `Sequence[RGBA]`
+            Background colors.
+        fg: `Sequence[RGBA]`
+            Foreground colors.
+
+        Raises
+        ------
+        `ValueError` 
+            If the sequences have different lengths 
+            or bit counts of the colors do not match.
+        """
+        if len(bg) != len(fg):
+            raise ValueError("Cannot blend sequences of different length")
+        
+        if len(bg) == 0:
+            return []
+
+        bits = bg[0].bits
+        if any(c.bits != bits for c in bg) or any(c.bits != bits for c in fg):
+            raise ValueError(f"Cannot blend colors with different size")
+
+        composed = self.compose_packed(
+            [c._data for c in bg], 
+            [c._data for c in fg], 
+            bits
+        )
+        return [RGBA(i, bits=bits) for i in composed]
+    
+    def compose_packed(
+        self, 
+        bg: Sequence[int], 
+        fg: Sequence[int], 
+        bits: int = 8
+    ) -> list[int]:
+        """
+        Compose sequences of packed RGBA values pairwise.
+
+        Parameters
+        ----------
+        bg: `Sequence[int]`
+            Background values.
+        fg: `Sequence[int]`
+            Foreground values.
+        bits: `int`
+            Number of bits per channel.
+
+        Raises
+        ------
+        `ValueError` 
+            If the sequences have different lengths.
+        """
+        if len(bg) != len(fg):
+            raise ValueError("Cannot blend sequences of different length")
+
+        decode = self._decoder(bits)
+        encode = self._encoder(bits)
+        blend = self.blend
+
+        return [encode(blend(decode(b), decode(f))) for b, f in zip(bg, fg)]
+
+
+# lookup tables of separable modes for opaque 8-bit colors,
+# keyed by mode class and linear flag
+_luts: dict[tuple[type, bool], list[int]] = {}
+
+
+@mypyc_attr(allow_interpreted_subclasses=True)
+class SeparableBlendMode(BlendMode):
+    """
+    Base class of blending modes defined by a channel function.
+
+    Use `separable_blend` decorator to create them.
+    """
+
+    lut: bool = False
+
+    def __init__(self, *, linear: bool = False, lut: bool = False) -> None:
+        """
+        Parameters
+        ----------
+        linear: `bool`
+            Whether to blend in linear light instead of gamma-encoded sRGB.
+        lut: `bool`
+            Whether to compose opaque 8-bit colors with a lookup table
+            of all channel pairs. The table is built on first use 
+            and shared by all instances of the mode.
+        """
+        super().__init__(linear=linear)
+        self.lut = lut
+
+    def channel(self, cb: float, cs: float, ab: float, as_: float) -> float:
+        """
+        Blend a channel of normalized colors.
 
-        blended = self.blend(bg.normalize(), fg.normalize())
+        Parameters
+        ----------
+        cb: `float`
+            Background channel.
+        cs: `float`
+            Foreground channel.
+        ab: `float`
+            Background alpha.
+        as_: `float`
+            Foreground alpha.
+        """
+        raise NotImplementedError("Channel method is not implemented")
 
-        return RGBA([round(i * max_one) for i in blended], bits=bits)
+    def blend(
+        self, 
+        bg: tuple[float, float, float, float], 
+        fg: tuple[float, float, float, float]
+    ) -> tuple[float, float, float, float]:
+        channel = self.channel
+        ab = bg[3]
+        as_ = fg[3]
+
+        return (
+            channel(bg[0], fg[0], ab, as_),
+            channel(bg[1], fg[1], ab, as_),
+            channel(bg[2], fg[2], ab, as_),
+            self._alpha(bg, fg)
+        )
+    
+    def _table(self) -> list[int]:
+        key = (type(self), self.linear)
+        if key not in _luts:
+            decode = self._decoder(8)
+            encode = self._encoder(8)
+            channel = self.channel
+
+            # a channel value in the red position of an opaque color
+            values = [decode(i << 24 | 0xFF)[0] for i in range(256)]
+            _luts[key] = [
+                encode((channel(cb, cs, 1.0, 1.0), 0.0, 0.0, 0.0)) >> 24
+                for cb in values
+                for cs in values
+            ]
         
+        return _luts[key]
+
+    def compose_packed(
+        self, 
+        bg: Sequence[int], 
+        fg: Sequence[int], 
+        bits: int = 8
+    ) -> list[int]:
+        if not self.lut or bits != 8:
+            return super().compose_packed(bg, fg, bits)
+        
+        if len(bg) != len(fg):
+            raise ValueError("Cannot blend sequences of different length")
+        
+        table = self._table()
+        decode = self._decoder(bits)
+        encode = self._encoder(bits)
+        blend = self.blend
+        result = []
+
+        for b, f in zip(bg, fg):
+            if b & f & 0xFF == 0xFF:
+                result.append(
+                    table[(b >> 16 & 0xFF00) | (f >> 24)] << 24
+                    | table[(b >> 8 & 0xFF00) | (f >> 16 & 0xFF)] << 16
+                    | table[(b & 0xFF00) | (f >> 8 & 0xFF)] << 8
+                    | 0xFF
+                )
+            else:
+                result.append(encode(blend(decode(b), decode(f))))
+
+        return result
+
+
+def separable_blend(
+    func: Callable[[float, float, float, float], float]
+) -> type[SeparableBlendMode]:
+    """
+    Create a blending mode from a channel function.
+
+    The function takes normalized background and foreground channels
+    and their alphas `(cb, cs, ab, as_)` and returns the blended channel.
+    The mode composes single colors and sequences of colors,
+    and can use a lookup table for opaque 8-bit colors.
+
+    Parameters
+    ----------
+    func: `Callable[[float, float, float, float], float]`
+        Channel function.
+    """
+    def channel(self, cb: float, cs: float, ab: float, as_: float) -> float:
+        return func(cb, cs, ab, as_)
+
+    return type(func.__name__, (SeparableBlendMode,), {
+        '__doc__': func.__doc__,
+        '__module__': func.__module__,
+        'channel': channel,
+    })
+
 
 class Normal(BlendMode):
     """
@@ -351,4 +600,6 @@ class Exclusion(BlendMode):
             )
         
         return _ch(0), _ch(1), _ch(2), self._alpha(bg, fg)
-    
\ No newline at end of file
+
+
+from .rgba import RGBA
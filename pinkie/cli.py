@@ -0,0 +1,455 @@
+import argparse
+import contextlib
+import os
+import sys
+import time
+
+
+# pinkie modules are imported by the commands,
+# so the script starts without loading them
+
+CHUNK_SIZE = 1 << 16
+
+MODES = (
+    'normal', 'darken', 'multiply', 'color-burn', 'lighten', 'screen', 'color-dodge',
+    'overlay', 'soft-light', 'hard-light', 'difference', 'exclusion'
+)
+
+MODELS = ('rgba', 'hsla', 'cmyk')
+
+PPM_EXTENSIONS = ('.ppm', '.pnm')
+
+# seconds spent in each phase of a command, filled only with --profile
+_phases: dict[str, float] | None = None
+
+
+@contextlib.contextmanager
+def _phase(name: str):
+    if _phases is None:
+        yield
+        return
+
+    start = time.perf_counter()
+    try:
+        yield
+    finally:
+        _phases[name] = _phases.get(name, 0.0) + time.perf_counter() - start
+
+
+class _Image:
+    """Stream of pixels of a binary PPM or raw RGBA8888 file."""
+
+    __slots__ = ('file', 'ppm', 'width', 'height')
+
+    def __init__(self, file, size: tuple[int, int] | None = None) -> None:
+        self.file = file
+        self.ppm = file.peek(2)[:2] == b'P6'
+        if self.ppm:
+            size = self._read_header()
+
+        self.width: int | None = size[0] if size else None
+        self.height: int | None = size[1] if size else None
+
+    def _token(self) -> bytes:
+        token = b''
+        while True:
+            char = self.file.read(1)
+            if char == b'#' and not token:
+                self.file.readline()
+            elif char.isspace() or not char:
+                if token or not char:
+                    return token
+            else:
+                token += char
+
+    def _read_header(self) -> tuple[int, int]:
+        self.file.read(2)
+        width, height, maxval = (self._token() for _ in range(3))
+        if not (width.isdigit() and height.isdigit() and maxval.isdigit()):
+            raise ValueError("Invalid PPM header")
+        if int(maxval) != 255:
+            raise ValueError("Only 8-bit PPM images are supported")
+        return int(width), int(height)
+
+    def chunks(self, size: int = CHUNK_SIZE):
+        from .interop import from_bytes
+
+        step = size * (3 if self.ppm else 4)
+        while True:
+            with _phase('read'):
+                data = self.file.read(step)
+                if not data:
+                    return
+                if self.ppm:
+                    if len(data) % 3:
+                        raise ValueError("PPM data is truncated")
+                    data = _expand(data)
+                values = from_bytes(data)
+            yield values
+
+    def write_header(self, file, ppm: bool) -> None:
+        if ppm:
+            if self.width is None:
+                raise ValueError("Specify --size of raw input to write PPM")
+            file.write(f"P6\n{self.width} {self.height}\n255\n".encode())
+
+
+def _expand(rgb: bytes) -> bytearray:
+    # RGB to opaque RGBA bytes
+    num = len(rgb) // 3
+    rgba = bytearray(b'\xff') * (num * 4)
+    for c in range(3):
+        rgba[c::4] = rgb[c::3]
+    return rgba
+
+
+def _write(file, values, ppm: bool) -> None:
+    from .interop import to_bytes
+
+    with _phase('write'):
+        data = to_bytes(values)
+        if ppm:
+            rgb = bytearray(len(data) // 4 * 3)
+            for c in range(3):
+                rgb[c::3] = data[c::4]
+            file.write(rgb)
+        else:
+            file.write(data)
+
+
+def _size(value: str) -> tuple[int, int]:
+    try:
+        width, height = map(int, value.lower().split('x'))
+    except ValueError:
+        raise argparse.ArgumentTypeError(f"invalid size: {value}") from None
+    return width, height
+
+
+def _open(path: str, mode: str):
+    if path == '-':
+        stream = sys.stdin if 'r' in mode else sys.stdout
+        # standard streams stay open when the block exits
+        return contextlib.nullcontext(stream.buffer if 'b' in mode else stream)
+    return open(path, mode)
+
+
+def _output_ppm(args, image: _Image) -> bool:
+    if args.output == '-':
+        return image.ppm
+    return os.path.splitext(args.output)[1].lower() in PPM_EXTENSIONS
+
+
+def _blend_mode(args):
+    from . import blend
+
+    cls = getattr(blend, ''.join(part.title() for part in args.mode.split('-')))
+    return cls(linear=args.linear)
+
+
+def _parse_color(line: str, model: str) -> int:
+    from .cmyk import CMYK
+    from .hsla import HSLA
+    from .rgba import RGBA
+
+    if ',' not in line:
+        if model != 'rgba':
+            raise ValueError(f"Hex values are RGBA, use CSV for {model.upper()}")
+        return RGBA(line).decimal
+
+    channels = [int(c) for c in line.split(',')]
+    if model == 'hsla':
+        return HSLA(channels).to_rgba().decimal
+    if model == 'cmyk':
+        return CMYK(channels).to_rgba().decimal
+    return RGBA(channels).decimal
+
+
+def _format_colors(values: list[int], to: str, fast: bool) -> list[str]:
+    from . import batch
+
+    if to == 'hex':
+        return [f"{v >> 8:06X}" if v & 0xFF == 0xFF else f"{v:08X}" for v in values]
+    if to == 'hsla':
+        colors = batch.to_hsla(values, fast=fast)
+    elif to == 'cmyk':
+        colors = batch.to_cmyk(values)
+    else:
+        colors = [(v >> 24, v >> 16 & 0xFF, v >> 8 & 0xFF, v & 0xFF) for v in values]
+
+    return [",".join(map(str, color)) for color in colors]
+
+
+def _write_colors(file, values: list[int], args) -> None:
+    with _phase('convert'):
+        text = "".join(f"{c}\n" for c in _format_colors(values, args.to, args.fast))
+    with _phase('write'):
+        file.write(text)
+
+
+def _convert(args) -> None:
+    with _open(args.input, 'r') as src, _open(args.output, 'w') as dst:
+        values: list[int] = []
+
+        for number, line in enumerate(src, 1):
+            line = line.strip()
+            if not line:
+                continue
+
+            try:
+                with _phase('parse'):
+                    values.append(_parse_color(line, args.source))
+            except ValueError as e:
+                raise ValueError(f"line {number}: {e}") from None
+
+            if len(values) >= CHUNK_SIZE:
+                _write_colors(dst, values, args)
+                values.clear()
+
+        _write_colors(dst, values, args)
+
+
+def _quantize(args) -> None:
+    from . import batch
+    from .palette import Palette
+    from .quantize import OctreeQuantizer
+
+    with _open(args.input, 'rb') as src, _open(args.output, 'wb') as dst:
+        image = _Image(src, args.size)
+
+        if args.palette:
+            palette = Palette.load(args.palette)
+        else:
+            if not src.seekable():
+                raise ValueError("Quantizing to --colors reads the input twice, use a file or --palette")
+
+            start = src.tell()
+            quantizer = OctreeQuantizer(args.colors)
+            for chunk in image.chunks():
+                with _phase('octree'):
+                    quantizer.feed(chunk)
+
+            palette = quantizer.palette()
+            src.seek(start)
+
+        ppm = _output_ppm(args, image)
+        image.write_header(dst, ppm)
+        for chunk in image.chunks():
+            with _phase('quantize'):
+                batch.quantize(chunk, palette, out=chunk)
+            _write(dst, chunk, ppm)
+
+
+def _blend(args) -> None:
+    from . import batch
+
+    mode = _blend_mode(args)
+
+    with _open(args.background, 'rb') as bg_src, _open(args.foreground, 'rb') as fg_src, \
+            _open(args.output, 'wb') as dst:
+        bg = _Image(bg_src, args.size)
+        fg = _Image(fg_src, args.size)
+        if bg.ppm and fg.ppm and (bg.width, bg.height) != (fg.width, fg.height):
+            raise ValueError("Images have different sizes")
+
+        ppm = _output_ppm(args, bg)
+        bg.write_header(dst, ppm)
+        fg_chunks = fg.chunks()
+
+        for bg_chunk in bg.chunks():
+            fg_chunk = next(fg_chunks, None)
+            if fg_chunk is None or len(fg_chunk) != len(bg_chunk):
+                raise ValueError("Images have different sizes")
+            with _phase('blend'):
+                batch.compose(mode, bg_chunk, fg_chunk, out=bg_chunk)
+            _write(dst, bg_chunk, ppm)
+
+        if next(fg_chunks, None) is not None:
+            raise ValueError("Images have different sizes")
+
+
+def _extract(args) -> None:
+    from .histogram import ColorStats
+    from .quantize import OctreeQuantizer
+
+    with _open(args.input, 'rb') as src:
+        image = _Image(src, args.size)
+
+        if args.method == 'octree':
+            quantizer = OctreeQuantizer(args.colors)
+            for chunk in image.chunks():
+                with _phase('octree'):
+                    quantizer.feed(chunk)
+            palette = quantizer.palette()
+        else:
+            stats = ColorStats()
+            for chunk in image.chunks():
+                with _phase('count'):
+                    stats.update(chunk)
+            palette = stats.most_common(args.colors)
+
+    if args.output == '-':
+        sys.stdout.write("".join(f"{c}\n" for c in _format_colors(list(palette._live()), 'hex', False)))
+    else:
+        palette.save(args.output)
+
+
+def _print_profile(elapsed: float) -> None:
+    from . import profiling
+
+    snapshot = profiling.stats()
+    lines = [f"total: {elapsed:.3f} s"]
+    for name, seconds in (_phases or {}).items():
+        lines.append(f"  {name}: {seconds:.3f} s")
+
+    calls = sorted(snapshot['calls'].items(), key=lambda item: -item[1]['seconds'])
+    for name, call in calls:
+        lines.append(f"  {name}: {call['count']} calls, {call['seconds']:.3f} s")
+
+    for name, cache in snapshot['caches'].items():
+        if cache['hits'] or cache['misses']:
+            lines.append(f"  {name}: {cache['hits']} hits, {cache['misses']} misses")
+
+    if snapshot['skipped']:
+        lines.append(f"  not instrumented: {', '.join(snapshot['skipped'])}")
+
+    print("\n".join(lines), file=sys.stderr)
+
+
+def _add_options(parser: argparse.ArgumentParser, default=None) -> None:
+    parser.add_argument(
+        '--workers', type=int, metavar='N', default=default,
+        help="number of threads for batch work"
+    )
+    parser.add_argument(
+        '--profile', action='store_true', default=default or False,
+        help="print timings of phases and pinkie calls to stderr"
+    )
+
+
+def _parser() -> argparse.ArgumentParser:
+    # options are accepted before and after the command, defaults are only
+    # set by the main parser so the command does not overwrite them
+    common = argparse.ArgumentParser(add_help=False)
+    _add_options(common, argparse.SUPPRESS)
+
+    image = argparse.ArgumentParser(add_help=False)
+    image.add_argument(
+        '--size', type=_size, metavar='WxH',
+        help="size of raw RGBA8888 input, needed to write PPM"
+    )
+    image.add_argument(
+        '-o', '--output', default='-',
+        help="output file, PPM if it ends with .ppm, raw RGBA8888 otherwise"
+    )
+
+    parser = argparse.ArgumentParser(
+        prog='pinkie',
+        description="Convert, quantize, blend and extract colors. "
+                    "Images are binary PPM or raw RGBA8888, '-' is stdin or stdout."
+    )
+    _add_options(parser)
+    commands = parser.add_subparsers(dest='command', required=True)
+
+    convert = commands.add_parser(
+        'convert', parents=[common],
+        help="convert a list of colors",
+        description="Convert colors, one hex value or CSV row per line."
+    )
+    convert.add_argument('input', nargs='?', default='-')
+    convert.add_argument('-o', '--output', default='-')
+    convert.add_argument('--from', dest='source', choices=MODELS, default='rgba')
+    convert.add_argument('--to', choices=('hex', *MODELS), default='hex')
+    convert.add_argument('--fast', action='store_true', help="use integer HSL conversion")
+    convert.set_defaults(func=_convert)
+
+    quantize = commands.add_parser(
+        'quantize', parents=[common, image],
+        help="reduce an image to a palette"
+    )
+    quantize.add_argument('input', nargs='?', default='-')
+    source = quantize.add_mutually_exclusive_group(required=True)
+    source.add_argument('--palette', help="palette file in any format of Palette.load")
+    source.add_argument('--colors', type=int, help="number of colors found by an octree")
+    quantize.set_defaults(func=_quantize)
+
+    blend = commands.add_parser(
+        'blend', parents=[common, image],
+        help="blend 2 images of the same size"
+    )
+    blend.add_argument('background')
+    blend.add_argument('foreground')
+    blend.add_argument('--mode', choices=MODES, default='normal')
+    blend.add_argument('--linear', action='store_true', help="blend in linear light")
+    blend.set_defaults(func=_blend)
+
+    extract = commands.add_parser(
+        'extract', parents=[common],
+        help="extract a palette from an image"
+    )
+    extract.add_argument('input', nargs='?', default='-')
+    extract.add_argument('-n', '--colors', type=int, default=8)
+    extract.add_argument('--method', choices=('common', 'octree'), default='common')
+    extract.add_argument('--size', type=_size, metavar='WxH', help=argparse.SUPPRESS)
+    extract.add_argument(
+        '-o', '--output', default='-',
+        help="palette file in any format of Palette.save, hex values to stdout by default"
+    )
+    extract.set_defaults(func=_extract)
+
+    return parser
+
+
+def main(argv: list[str] | None = None) -> int:
+    """
+    Run the command-line interface.
+
+    Parameters
+    ----------
+    argv: `list[str]` | `None`
+        Arguments. Defaults to `sys.argv`.
+
+    Returns
+    -------
+    `int`
+        Exit status.
+    """
+    parser = _parser()
+    args = parser.parse_args(argv)
+
+    if args.workers is not None:
+        from .parallel import set_num_threads
+
+        try:
+            set_num_threads(args.workers)
+        except ValueError as e:
+            parser.error(str(e))
+
+    global _phases
+
+    start = time.perf_counter()
+    try:
+        if args.profile:
+            from .profiling import profile
+
+            _phases = {}
+            with profile():
+                args.func(args)
+                _print_profile(time.perf_counter() - start)
+            _phases = None
+        else:
+            args.func(args)
+    except BrokenPipeError:
+        # the reader of the output has exited, like `head`,
+        # so the output flushed at exit goes nowhere instead of failing again
+        devnull = os.open(os.devnull, os.O_WRONLY)
+        os.dup2(devnull, sys.stdout.fileno())
+        return 1
+    except (ValueError, OSError) as e:
+        print(f"pinkie: error: {e}", file=sys.stderr)
+        return 1
+
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
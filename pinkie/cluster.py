@@ -0,0 +1,387 @@
+import functools
+import heapq
+import itertools
+import math
+from array import array
+from collections.abc import Callable, Iterable, Iterator, Sequence
+from itertools import repeat
+
+from .palette import Palette, _points
+from .parallel import map_chunks
+from .rgba import RGBA
+
+
+DEFAULT_TILE_SIZE = 256
+
+Metric = str | Callable[[RGBA], Sequence[float]]
+
+
+def _packed(colors: Palette | Iterable[RGBA]) -> tuple[list[int], int | None]:
+    if isinstance(colors, Palette):
+        return list(colors._live()), colors.bits
+
+    colors = list(colors)
+    bits = {c.bits for c in colors}
+    if len(bits) > 1:
+        raise ValueError("Colors must have same bit count")
+
+    return [c._data for c in colors], bits.pop() if bits else None
+
+
+def _prepare(
+    a: Palette | Iterable[RGBA],
+    b: Palette | Iterable[RGBA] | None,
+    metric: Metric
+) -> tuple[list[tuple[float, ...]], list[tuple[float, ...]]]:
+    values_a, bits_a = _packed(a)
+    if b is None:
+        points = _points(values_a, bits_a or 8, metric)
+        return points, points
+
+    values_b, bits_b = _packed(b)
+    if bits_a and bits_b and bits_a != bits_b:
+        raise ValueError("Palettes must have same bit count")
+
+    bits = bits_a or bits_b or 8
+    return _points(values_a, bits, metric), _points(values_b, bits, metric)
+
+
+def iter_tiles(
+    a: Palette | Iterable[RGBA],
+    b: Palette | Iterable[RGBA] | None = None,
+    *,
+    metric: Metric = 'lab',
+    tile_size: int = DEFAULT_TILE_SIZE
+) -> Iterator[tuple[int, int, list[array]]]:
+    """
+    Compute the distance matrix in square tiles.
+
+    Only one tile is kept in memory at a time, so large matrices
+    can be reduced without being built.
+
+    Parameters
+    ----------
+    a: `Palette` | `Iterable[RGBA]`
+        Colors of the rows.
+    b: `Palette` | `Iterable[RGBA]` | `None`
+        Colors of the columns. Defaults to `a`.
+    metric: `str` | `Callable[[RGBA], Sequence[float]]`
+        Metric like in `Palette.distinct`.
+    tile_size: `int`
+        Number of rows and columns of a tile.
+
+    Returns
+    -------
+    `Iterator[tuple[int, int, list[array]]]`
+        First row, first column and rows of distances of each tile.
+
+    Raises
+    ------
+    `ValueError`
+        If the bit counts do not match, the metric is unknown
+        or the tile size is not positive.
+    """
+    if tile_size < 1:
+        raise ValueError("Tile size must be positive")
+
+    rows, columns = _prepare(a, b, metric)
+    dist = math.dist
+
+    for i in range(0, len(rows), tile_size):
+        for j in range(0, len(columns), tile_size):
+            block = columns[j:j + tile_size]
+            yield i, j, [
+                array('d', map(dist, block, repeat(point)))
+                for point in rows[i:i + tile_size]
+            ]
+
+
+def pairwise_distances(
+    a: Palette | Iterable[RGBA],
+    b: Palette | Iterable[RGBA] | None = None,
+    *,
+    metric: Metric = 'lab'
+) -> list[array]:
+    """
+    Get distances between all pairs of colors.
+
+    The matrix takes `len(a) * len(b) * 8` bytes,
+    use `nearest` or `iter_tiles` for large palettes.
+
+    Parameters
+    ----------
+    a: `Palette` | `Iterable[RGBA]`
+        Colors of the rows.
+    b: `Palette` | `Iterable[RGBA]` | `None`
+        Colors of the columns. Defaults to `a`.
+    metric: `str` | `Callable[[RGBA], Sequence[float]]`
+        Metric like in `Palette.distinct`.
+
+    Returns
+    -------
+    `list[array]`
+        Row of distances for each color of `a`.
+
+    Raises
+    ------
+    `ValueError`
+        If the bit counts do not match or the metric is unknown.
+    """
+    rows, columns = _prepare(a, b, metric)
+    result = map_chunks(functools.partial(_rows, columns=columns), rows)
+    # without `out`, the chunks are concatenated to a list
+    assert isinstance(result, list)
+    return result
+
+
+def _rows(rows: Sequence[Sequence[float]], columns: list[tuple[float, ...]]) -> list[array]:
+    dist = math.dist
+    return [array('d', map(dist, columns, repeat(point))) for point in rows]
+
+
+def nearest(
+    a: Palette | Iterable[RGBA],
+    b: Palette | Iterable[RGBA] | None = None,
+    k: int = 1,
+    *,
+    metric: Metric = 'lab',
+    max_distance: float | None = None
+) -> list[list[tuple[int, float]]]:
+    """
+    Find the closest colors of `b` for each color of `a`.
+
+    Distances are computed one row at a time, so the full matrix
+    is never built. Large inputs are split between threads of `pinkie.parallel`.
+
+    Parameters
+    ----------
+    a: `Palette` | `Iterable[RGBA]`
+        Colors to find neighbors for.
+    b: `Palette` | `Iterable[RGBA]` | `None`
+        Candidate neighbors. Defaults to `a`, excluding each color itself.
+    k: `int`
+        Maximum number of neighbors per color.
+    metric: `str` | `Callable[[RGBA], Sequence[float]]`
+        Metric like in `Palette.distinct`.
+    max_distance: `float` | `None`
+        Skip neighbors that are further away.
+
+    Returns
+    -------
+    `list[list[tuple[int, float]]]`
+        Indices in `b` and distances of the neighbors of each color,
+        closest first.
+
+    Raises
+    ------
+    `ValueError`
+        If `k` is not positive, the bit counts do not match
+        or the metric is unknown.
+    """
+    if k < 1:
+        raise ValueError("Number of neighbors must be positive")
+
+    rows, columns = _prepare(a, b, metric)
+    func = functools.partial(
+        _nearest,
+        columns=columns,
+        k=k,
+        max_distance=max_distance,
+        exclude_self=b is None
+    )
+    result = map_chunks(func, range(len(rows)), rows)
+    assert isinstance(result, list)
+    return result
+
+
+def _nearest(
+    indices: range,
+    rows: Sequence[Sequence[float]],
+    columns: list[tuple[float, ...]],
+    k: int,
+    max_distance: float | None,
+    exclude_self: bool
+) -> list[list[tuple[int, float]]]:
+    dist = math.dist
+    result = []
+
+    for index, point in zip(indices, rows):
+        pairs: Iterable[tuple[int, float]] = enumerate(map(dist, columns, repeat(point)))
+        if exclude_self:
+            pairs = ((j, d) for j, d in pairs if j != index)
+        if max_distance is not None:
+            pairs = ((j, d) for j, d in pairs if d <= max_distance)
+
+        result.append(heapq.nsmallest(k, pairs, key=lambda pair: pair[1]))
+
+    return result
+
+
+def clusters(
+    palette: Palette | Iterable[RGBA],
+    epsilon: float,
+    *,
+    metric: Metric = 'lab'
+) -> list[int]:
+    """
+    Group colors that are connected by pairs closer than `epsilon`.
+
+    Colors are put in a grid of cells smaller than `epsilon`, so colors 
+    of a cell are joined without comparing them and only colors of 
+    neighboring cells are compared. Groups are joined with union-find.
+    Like single-linkage clustering, chains of close colors form one group
+    even if their ends are further apart.
+
+    Parameters
+    ----------
+    palette: `Palette` | `Iterable[RGBA]`
+        Colors to group.
+    epsilon: `float`
+        Maximum distance between connected colors.
+    metric: `str` | `Callable[[RGBA], Sequence[float]]`
+        Metric like in `Palette.distinct`.
+
+    Returns
+    -------
+    `list[int]`
+        Group of each color. Groups are numbered in order of their first color.
+
+    Raises
+    ------
+    `ValueError`
+        If epsilon is negative, the bit counts do not match
+        or the metric is unknown.
+    """
+    values, bits = _packed(palette)
+    return _clusters(values, bits or 8, epsilon, metric)
+
+
+def _grid(
+    points: list[tuple[float, ...]], 
+    epsilon: float
+) -> tuple[dict[int, list[int]], list[int]]:
+    # cells are small enough that any 2 colors of a cell are within epsilon
+    dims = len(points[0])
+    if epsilon == 0:
+        grid: dict = {}
+        for i, point in enumerate(points):
+            grid.setdefault(point, []).append(i)
+        return grid, []
+
+    side = epsilon / math.sqrt(dims)
+    cells = [[math.floor(c / side) for c in point] for point in points]
+
+    # cells are numbered in row-major order with a margin of neighbors,
+    # so a neighbor is a constant offset of the number
+    reach = math.ceil(math.sqrt(dims))
+    lows = []
+    strides = []
+    stride = 1
+    for column in reversed(list(zip(*cells))):
+        lows.append(min(column) - reach)
+        strides.append(stride)
+        stride *= max(column) - min(column) + 2 * reach + 1
+    lows.reverse()
+    strides.reverse()
+
+    grid = {}
+    for i, cell in enumerate(cells):
+        key = sum([(c - low) * s for c, low, s in zip(cell, lows, strides)])
+        grid.setdefault(key, []).append(i)
+
+    # half of the cells that can hold colors within epsilon,
+    # so each pair of cells is visited once
+    zero = (0,) * dims
+    deltas = [
+        sum([c * s for c, s in zip(offset, strides)])
+        for offset in itertools.product(range(-reach, reach + 1), repeat=dims)
+        if offset > zero and sum(max(abs(c) - 1, 0) ** 2 for c in offset) <= dims
+    ]
+    return grid, deltas
+
+
+def _clusters(values: list[int], bits: int, epsilon: float, metric: Metric) -> list[int]:
+    if epsilon < 0:
+        raise ValueError("Epsilon must not be negative")
+
+    points = _points(values, bits, metric)
+    parents = array('l', range(len(points)))
+
+    def find(i: int) -> int:
+        while parents[i] != i:
+            # path halving
+            parents[i] = parents[parents[i]]
+            i = parents[i]
+        return i
+
+    def union(i: int, j: int) -> None:
+        root_i, root_j = find(i), find(j)
+        if root_i != root_j:
+            # the smaller index becomes the root to keep groups in order
+            parents[max(root_i, root_j)] = min(root_i, root_j)
+
+    if points:
+        grid, deltas = _grid(points, epsilon)
+
+        for members in grid.values():
+            for i in members:
+                parents[i] = members[0]
+
+        dist = math.dist
+        for key, members in grid.items():
+            for delta in deltas:
+                other = grid.get(key + delta)
+                if other is None or find(members[0]) == find(other[0]):
+                    continue
+
+                if any(
+                    dist(points[i], points[j]) <= epsilon 
+                    for i in members 
+                    for j in other
+                ):
+                    union(members[0], other[0])
+
+    labels: dict[int, int] = {}
+    return [labels.setdefault(find(i), len(labels)) for i in range(len(points))]
+
+
+def merge_close(
+    palette: Palette | Iterable[RGBA],
+    epsilon: float,
+    *,
+    metric: Metric = 'lab'
+) -> Palette:
+    """
+    Collapse near-duplicate colors.
+
+    Parameters
+    ----------
+    palette: `Palette` | `Iterable[RGBA]`
+        Colors to merge.
+    epsilon: `float`
+        Maximum distance between merged colors, like in `clusters`.
+    metric: `str` | `Callable[[RGBA], Sequence[float]]`
+        Metric like in `Palette.distinct`.
+
+    Returns
+    -------
+    `Palette`
+        First color of each group of `clusters`, in order.
+
+    Raises
+    ------
+    `ValueError`
+        If epsilon is negative, the bit counts do not match
+        or the metric is unknown.
+    """
+    values, bits = _packed(palette)
+    result = []
+    groups = 0
+
+    for value, label in zip(values, _clusters(values, bits or 8, epsilon, metric)):
+        # groups are numbered in order of their first color
+        if label == groups:
+            groups += 1
+            result.append(value)
+
+    return Palette._from_values(result, bits if result else None)
@@ -1,25 +1,45 @@
-import random
-from typing import Sequence
+from collections.abc import Sequence
 
+from .utils import TYPE_CHECKING, mypyc_attr, rng
 
+if TYPE_CHECKING:
+    from random import Random
+
+
+def _pack_cmyk(c: int, m: int, y: int, k: int) -> int:
+    # 7 bits of each component
+    return c << 21 | m << 14 | y << 7 | k
+
+
+@mypyc_attr(allow_interpreted_subclasses=True)
 class CMYK:
     """`CMYK` (Cyan, Magenta, Yellow, Black Key) color model."""
 
-    __slots__ = ('_c', '_m', '_y', '_k')
+    __slots__ = ('_data',)
 
-    def __init__(self, color: Sequence[int], /) -> None:
+    _data: int
+
+    def __init__(self, color: int | Sequence[int], /) -> None:
         """
         Parameters
         ----------
-        color: `Sequence[int]`
-            Color sequence of c, m, y, k.
+        color: `int` | `Sequence[int]`
+            Packed value or a color sequence of c, m, y, k.
 
         Raises
         ------
         `ValueError` 
             If the color is invalid.
         """
-        if isinstance(color, (tuple, list)):
+        self._data = 0
+
+        if isinstance(color, int):
+            if color < 0 or color >> 28 or any(
+                (color >> shift & 0x7F) > 100 for shift in (21, 14, 7, 0)
+            ):
+                raise ValueError(f"Invalid packed value: {color}")
+            self._data = color
+        elif isinstance(color, (tuple, list)):
             self.c = color[0]
             self.m = color[1]
             self.y = color[2]
@@ -28,7 +48,7 @@ class CMYK:
             raise ValueError(f"Invalid color value: {color}")
             
     def __eq__(self, other) -> bool:
-        return isinstance(other, CMYK) and self.cmyk == other.cmyk
+        return isinstance(other, CMYK) and self._data == other._data
 
     def __ne__(self, other) -> bool:
         return not self.__eq__(other)
@@ -40,7 +60,7 @@ class CMYK:
         return f"<CMYK c={self.c}, m={self.m}, y={self.y}, k={self.k}>"
 
     def __hash__(self) -> int:
-        return hash(self.cmyk)
+        return hash(self._data)
             
     def __getitem__(self, key):
         return self.cmyk[key]
@@ -48,85 +68,135 @@ class CMYK:
     def __iter__(self):
         for item in self.cmyk:
             yield item
+
+    def _assign(self, data: int) -> "CMYK":
+        self._data = data
+        return self
+
+    @property
+    def decimal(self) -> int:
+        """Packed value of c, m, y and k."""
+        return self._data
             
     @property
     def c(self) -> int:
         """Cyan value in range `0-100`."""
-        return self._c
+        return self._data >> 21 & 0x7F
     
     @c.setter
     def c(self, value: int):
         if not isinstance(value, int):
             raise TypeError(f"Value must be an int, not {type(value).__name__}")
-        self._c = min(max(value, 0), 100)
+        self._data = self._data & ~(0x7F << 21) | min(max(value, 0), 100) << 21
+
+    @property
+    def cyan(self) -> int:
+        """Alias of `c`."""
+        return self.c
 
-    cyan = c
+    @cyan.setter
+    def cyan(self, value: int):
+        self.c = value
             
     @property
     def m(self) -> int:
         """Magenta value in range `0-100`."""
-        return self._m
+        return self._data >> 14 & 0x7F
     
     @m.setter
     def m(self, value: int):
         if not isinstance(value, int):
             raise TypeError(f"Value must be an int, not {type(value).__name__}")
-        self._m = min(max(value, 0), 100)
+        self._data = self._data & ~(0x7F << 14) | min(max(value, 0), 100) << 14
 
-    magenta = m
+    @property
+    def magenta(self) -> int:
+        """Alias of `m`."""
+        return self.m
+
+    @magenta.setter
+    def magenta(self, value: int):
+        self.m = value
 
     @property
     def y(self) -> int:
         """Yellow value in range `0-100`."""
-        return self._y
+        return self._data >> 7 & 0x7F
     
     @y.setter
     def y(self, value: int):
         if not isinstance(value, int):
             raise TypeError(f"Value must be an int, not {type(value).__name__}")
-        self._y = min(max(value, 0), 100)
+        self._data = self._data & ~(0x7F << 7) | min(max(value, 0), 100) << 7
+
+    @property
+    def yellow(self) -> int:
+        """Alias of `y`."""
+        return self.y
 
-    yellow = y
+    @yellow.setter
+    def yellow(self, value: int):
+        self.y = value
 
     @property
     def k(self) -> int:
         """Black key in range `0-100`."""
-        return self._k
+        return self._data & 0x7F
     
     @k.setter
     def k(self, value: int):
         if not isinstance(value, int):
             raise TypeError(f"Value must be an int, not {type(value).__name__}")
-        self._k = min(max(value, 0), 100)
+        self._data = self._data & ~0x7F | min(max(value, 0), 100)
 
-    key = k
-    black = k
+    @property
+    def key(self) -> int:
+        """Alias of `k`."""
+        return self.k
+
+    @key.setter
+    def key(self, value: int):
+        self.k = value
+
+    @property
+    def black(self) -> int:
+        """Alias of `k`."""
+        return self.k
+
+    @black.setter
+    def black(self, value: int):
+        self.k = value
 
     @property
     def cmyk(self) -> tuple[int, int, int, int]:
         """`(c, m, y, k)` tuple."""
-        return self.c, self.m, self.y, self.k
+        data = self._data
+        return data >> 21 & 0x7F, data >> 14 & 0x7F, data >> 7 & 0x7F, data & 0x7F
     
     def copy(self) -> "CMYK":
         """Get a copy of the color."""
-        obj = CMYK.__new__(CMYK)
-        obj._c = self._c
-        obj._m = self._m
-        obj._y = self._y
-        obj._k = self._k
-        return obj
-
-    def to_rgba(self):
-        """Convert to `RGBA` model."""
-        from .rgba import RGBA
+        return CMYK.__new__(CMYK)._assign(self._data)
 
+    def to_rgba(self) -> "RGBA":
+        """Convert to `RGBA` model."""
+        c, m, y, k = self.cmyk
         return RGBA([
-            255 * (1 - i / 100) * (1 - self.k / 100)
-            for i in self.cmyk[:3]
+            round(255 * (1 - i / 100) * (1 - k / 100))
+            for i in (c, m, y)
         ])
     
     @classmethod
-    def random(cls) -> "CMYK":
-        """Generate a random color."""
-        return cls([random.randint(0, 100) for _ in range(4)])
-    
\ No newline at end of file
+    def random(cls, seed: "int | Random | None" = None) -> "CMYK":
+        """
+        Generate a random color.
+
+        Parameters
+        ----------
+        seed: `int` | `random.Random` | `None`
+            Seed or generator to use instead of the shared one.
+        """
+        generator = rng(seed)
+        return cls([generator.randint(0, 100) for _ in range(4)])
+
+
+from .rgba import RGBA
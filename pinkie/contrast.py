@@ -0,0 +1,216 @@
+from collections.abc import Iterable, Mapping
+
+from .gamma import luminance
+from .hsla import HSLA
+from .palette import Palette
+from .rgba import RGBA
+
+
+LEVELS = {
+    ('AA', False): 4.5,
+    ('AA', True): 3.0,
+    ('AAA', False): 7.0,
+    ('AAA', True): 4.5,
+}
+
+
+def required_ratio(level: str | float = 'AA', large: bool = False) -> float:
+    """
+    Get a minimal contrast ratio of the WCAG level.
+
+    Parameters
+    ----------
+    level: `str` | `float`
+        `AA`, `AAA` or a custom contrast ratio.
+    large: `bool`
+        Whether the ratio is for large text.
+
+    Raises
+    ------
+    `ValueError`
+        If the level is unknown.
+    """
+    if isinstance(level, (int, float)):
+        return float(level)
+
+    try:
+        return LEVELS[(level.upper(), large)]
+    except (KeyError, AttributeError):
+        raise ValueError(f"Unknown contrast level: {level}") from None
+
+
+def _ratio(first: float, second: float) -> float:
+    first += 0.05
+    second += 0.05
+    return first / second if first > second else second / first
+
+
+def closest_accessible(
+    color: RGBA,
+    background: RGBA,
+    candidates: Palette | Iterable[RGBA],
+    *,
+    level: str | float = 'AA',
+    large: bool = False
+) -> RGBA | None:
+    """
+    Select the candidate closest to the color
+    that has enough contrast with the background.
+
+    Parameters
+    ----------
+    color: `RGBA`
+        Preferred color.
+    background: `RGBA`
+        Background color.
+    candidates: `Palette` | `Iterable[RGBA]`
+        Candidate colors. Luminance of palettes is cached between calls.
+    level: `str` | `float`
+        `AA`, `AAA` or a custom contrast ratio.
+    large: `bool`
+        Whether the color is used for large text.
+
+    Returns
+    -------
+    `RGBA` | `None`
+        Closest accessible color or `None` if no candidate has enough contrast.
+    """
+    ratio = required_ratio(level, large)
+    bg_lum = background.luminance()
+
+    if not isinstance(candidates, Palette):
+        candidates = Palette(*candidates)
+
+    accessible = [
+        c for c, lum in zip(candidates, candidates.luminance())
+        if _ratio(lum, bg_lum) >= ratio
+    ]
+    if not accessible:
+        return None
+
+    return color.closest(*accessible)
+
+
+def adjust_lightness(
+    color: RGBA,
+    background: RGBA,
+    *,
+    level: str | float = 'AA',
+    large: bool = False
+) -> RGBA | None:
+    """
+    Change lightness of the color as little as possible
+    to get enough contrast with the background.
+
+    A color that already has enough contrast is returned as it is.
+    Otherwise lightness is found with a binary search in `HSLA` model,
+    so the result is an 8-bit color, like `HSLA.to_rgba` returns.
+
+    Parameters
+    ----------
+    color: `RGBA`
+        Preferred color.
+    background: `RGBA`
+        Background color.
+    level: `str` | `float`
+        `AA`, `AAA` or a custom contrast ratio.
+    large: `bool`
+        Whether the color is used for large text.
+
+    Returns
+    -------
+    `RGBA` | `None`
+        Accessible color or `None` if no lightness gives enough contrast.
+    """
+    ratio = required_ratio(level, large)
+    bg_lum = background.luminance()
+    if _ratio(color.luminance(), bg_lum) >= ratio:
+        return color
+
+    h, s, start, a = color.to_hsla()
+
+    def _color(l: int) -> RGBA:
+        return HSLA((h, s, l, a)).to_rgba()
+
+    def _passes(l: int) -> bool:
+        return _ratio(luminance(_color(l)._data, 8), bg_lum) >= ratio
+
+    if _passes(start):
+        return _color(start)
+
+    # contrast only grows when lightness moves away from the background,
+    # so the passing lightness values form an interval at each end
+    found = []
+
+    if _passes(100):
+        low, high = start, 100
+        while high - low > 1:
+            mid = (low + high) // 2
+            if _passes(mid):
+                high = mid
+            else:
+                low = mid
+        found.append(high)
+
+    if _passes(0):
+        low, high = 0, start
+        while high - low > 1:
+            mid = (low + high) // 2
+            if _passes(mid):
+                low = mid
+            else:
+                high = mid
+        found.append(low)
+
+    if not found:
+        return None
+
+    return _color(min(found, key=lambda l: abs(l - start)))
+
+
+def resolve(
+    tokens: Mapping[str, RGBA],
+    background: RGBA,
+    candidates: Palette | Iterable[RGBA] | None = None,
+    *,
+    level: str | float = 'AA',
+    large: bool = False
+) -> dict[str, RGBA | None]:
+    """
+    Make a set of design tokens accessible on the background.
+
+    Each unique color is resolved once.
+
+    Parameters
+    ----------
+    tokens: `Mapping[str, RGBA]`
+        Token names and preferred colors.
+    background: `RGBA`
+        Background color.
+    candidates: `Palette` | `Iterable[RGBA]` | `None`
+        Candidate colors. If not specified, lightness of the colors is adjusted.
+    level: `str` | `float`
+        `AA`, `AAA` or a custom contrast ratio.
+    large: `bool`
+        Whether the colors are used for large text.
+    """
+    if candidates is not None and not isinstance(candidates, Palette):
+        candidates = Palette(*candidates)
+
+    resolved: dict[RGBA, RGBA | None] = {}
+    result = {}
+
+    for name, color in tokens.items():
+        if color not in resolved:
+            if candidates is None:
+                resolved[color] = adjust_lightness(
+                    color, background, level=level, large=large
+                )
+            else:
+                resolved[color] = closest_accessible(
+                    color, background, candidates, level=level, large=large
+                )
+
+        result[name] = resolved[color]
+
+    return result
@@ -0,0 +1,197 @@
+import functools
+from array import array
+from collections.abc import Callable, Sequence
+
+
+MAX_TABLE_BITS = 16
+ENCODE_TABLE_SIZE = 8192
+
+
+def _decode(value: float) -> float:
+    if value <= 0.04045:
+        return value / 12.92
+    return ((value + 0.055) / 1.055) ** 2.4
+
+
+def _encode(value: float) -> float:
+    if value <= 0.0031308:
+        return value * 12.92
+    return 1.055 * value ** (1 / 2.4) - 0.055
+
+
+@functools.lru_cache(maxsize=None)
+def decode_table(bits: int = 8) -> array:
+    """
+    Get a cached sRGB to linear-light lookup table.
+
+    The table has one entry per channel value, so it holds 256 entries
+    for 8-bit colors and 65536 entries for 16-bit colors.
+
+    Parameters
+    ----------
+    bits: `int`
+        Number of bits per channel.
+
+    Raises
+    ------
+    `ValueError`
+        If the bit count is too large for a table.
+    """
+    if bits > MAX_TABLE_BITS or bits < 1:
+        raise ValueError(
+            f"Lookup tables support up to {MAX_TABLE_BITS} bits per channel"
+        )
+
+    max_one = (1 << bits) - 1
+    return array('d', (_decode(i / max_one) for i in range(max_one + 1)))
+
+
+@functools.lru_cache(maxsize=None)
+def encode_table() -> array:
+    """
+    Get a cached linear-light to sRGB lookup table.
+
+    The table samples the transfer function at `ENCODE_TABLE_SIZE` evenly
+    spaced points of the `0-1` range. Use `encode` to read it.
+    """
+    size = ENCODE_TABLE_SIZE
+    return array('d', (_encode(i / size) for i in range(size + 1)))
+
+
+def encode(value: float) -> float:
+    """
+    Convert a linear-light value in range `0-1` to sRGB.
+
+    Linearly interpolates `encode_table`, which keeps the error
+    below one unit of a 16-bit channel.
+
+    Parameters
+    ----------
+    value: `float`
+        Linear-light value.
+    """
+    if value <= 0:
+        return 0.0
+    if value >= 1:
+        return 1.0
+
+    table = encode_table()
+    pos = value * ENCODE_TABLE_SIZE
+    i = int(pos)
+    low = table[i]
+    return low + (table[i + 1] - low) * (pos - i)
+
+
+def dequantizer(bits: int, linear: bool = False) -> Callable[[int], tuple[float, float, float, float]]:
+    """
+    Get a function that unpacks an RGBA value to channels in range `0-1`.
+
+    Parameters
+    ----------
+    bits: `int`
+        Number of bits per channel, up to 16 if `linear` is set.
+    linear: `bool`
+        Whether to decode r, g and b to linear light with `decode_table`.
+    """
+    max_one = (1 << bits) - 1
+    r_shift, g_shift, b_shift = bits * 3, bits * 2, bits
+
+    if linear:
+        table = decode_table(bits)
+
+        def _dequantize(value: int) -> tuple[float, float, float, float]:
+            return (
+                table[value >> r_shift & max_one],
+                table[value >> g_shift & max_one],
+                table[value >> b_shift & max_one],
+                (value & max_one) / max_one
+            )
+    else:
+        def _dequantize(value: int) -> tuple[float, float, float, float]:
+            return (
+                (value >> r_shift & max_one) / max_one,
+                (value >> g_shift & max_one) / max_one,
+                (value >> b_shift & max_one) / max_one,
+                (value & max_one) / max_one
+            )
+
+    return _dequantize
+
+
+def quantizer(bits: int, linear: bool = False) -> Callable[[Sequence[float]], int]:
+    """
+    Get a function that packs channels in range `0-1` to an RGBA value.
+
+    Channels are rounded and clamped to the range.
+
+    Parameters
+    ----------
+    bits: `int`
+        Number of bits per channel.
+    linear: `bool`
+        Whether to encode r, g and b from linear light with `encode`.
+    """
+    max_one = (1 << bits) - 1
+
+    def _quantize(color: Sequence[float]) -> int:
+        value = 0
+        for num, c in enumerate(color):
+            if linear and num < 3:
+                c = encode(c)
+            value = value << bits | min(max(round(c * max_one), 0), max_one)
+        return value
+
+    return _quantize
+
+
+@functools.lru_cache(maxsize=None)
+def luminance_tables(bits: int = 8) -> tuple[array, array, array]:
+    """
+    Get cached per-channel relative luminance lookup tables.
+
+    The sum of red, green and blue table entries 
+    of a color equals its WCAG relative luminance.
+
+    Parameters
+    ----------
+    bits: `int`
+        Number of bits per channel.
+
+    Raises
+    ------
+    `ValueError`
+        If the bit count is too large for a table.
+    """
+    table = decode_table(bits)
+    return (
+        array('d', (0.2126 * i for i in table)),
+        array('d', (0.7152 * i for i in table)),
+        array('d', (0.0722 * i for i in table))
+    )
+
+
+def luminance(value: int, bits: int = 8) -> float:
+    """
+    Get WCAG relative luminance of a packed RGBA value.
+
+    Parameters
+    ----------
+    value: `int`
+        Packed RGBA value.
+    bits: `int`
+        Number of bits per channel.
+    """
+    max_one = (1 << bits) - 1
+    r = value >> (bits * 3) & max_one
+    g = value >> (bits * 2) & max_one
+    b = value >> bits & max_one
+
+    if bits > MAX_TABLE_BITS:
+        return (
+            0.2126 * _decode(r / max_one) 
+            + 0.7152 * _decode(g / max_one) 
+            + 0.0722 * _decode(b / max_one)
+        )
+
+    r_table, g_table, b_table = luminance_tables(bits)
+    return r_table[r] + g_table[g] + b_table[b]
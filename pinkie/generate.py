@@ -0,0 +1,171 @@
+import math
+import sys
+from array import array
+from collections.abc import MutableSequence
+
+from .gamma import luminance
+from .hsla import _rgb
+from .palette import Palette
+from .rgba import RGBA
+from .utils import TYPE_CHECKING, packed_typecode, rng
+
+if TYPE_CHECKING:
+    from random import Random
+
+
+def packed(
+    num: int,
+    bits: int = 8,
+    seed: "int | Random | None" = None,
+    opaque: bool = False
+) -> MutableSequence[int]:
+    """
+    Generate random packed RGBA values with a single call to the generator.
+
+    Parameters
+    ----------
+    num: `int`
+        Number of values.
+    bits: `int`
+        Number of bits per channel.
+    seed: `int` | `random.Random` | `None`
+        Seed or generator to use instead of the shared one.
+    opaque: `bool`
+        Whether to set alpha to the maximum.
+
+    Returns
+    -------
+    `MutableSequence[int]`
+        Array of values, or a list if they do not fit into 64 bits.
+    """
+    size = bits // 2
+    data = rng(seed).getrandbits(num * bits * 4).to_bytes(num * size, 'little')
+    typecode = packed_typecode(bits)
+
+    values: MutableSequence[int]
+    if typecode is not None and array(typecode).itemsize == size:
+        result = array(typecode)
+        result.frombytes(data)
+        if sys.byteorder == 'big':
+            result.byteswap()
+        values = result
+    else:
+        values = [
+            int.from_bytes(data[i:i + size], 'little')
+            for i in range(0, len(data), size)
+        ]
+
+    if opaque:
+        max_one = (1 << bits) - 1
+        for i in range(num):
+            values[i] |= max_one
+
+    return values
+
+
+def _hue(generator: "Random", hue: tuple[int, int]) -> int:
+    start, end = hue[0] % 360, hue[1] % 360
+    if hue[1] - hue[0] >= 360:
+        start, end = 0, 359
+
+    # ranges like (330, 30) wrap around red
+    span = (end - start) % 360
+    return (start + generator.randint(0, span)) % 360
+
+
+def distinct(
+    num: int,
+    seed: "int | Random | None" = None,
+    *,
+    hue: tuple[int, int] = (0, 359),
+    saturation: tuple[int, int] = (0, 100),
+    lightness: tuple[int, int] = (0, 100),
+    min_distance: float = 0.0,
+    min_contrast: float | None = None,
+    background: RGBA | None = None,
+    max_attempts: int | None = None
+) -> Palette:
+    """
+    Generate distinguishable opaque 8-bit colors.
+
+    Candidates are drawn from the `HSLA` ranges and rejected if they are
+    closer than `min_distance` to an accepted color, like in Poisson-disk
+    sampling, or do not contrast enough with the background.
+    A grid over the RGB cube keeps each check constant-time.
+
+    Parameters
+    ----------
+    num: `int`
+        Number of colors.
+    seed: `int` | `random.Random` | `None`
+        Seed or generator to use instead of the shared one.
+    hue: `tuple[int, int]`
+        Hue range in degrees. The range may wrap, like `(330, 30)`.
+    saturation: `tuple[int, int]`
+        Saturation range.
+    lightness: `tuple[int, int]`
+        Lightness range.
+    min_distance: `float`
+        Minimum Euclidean distance between colors in 8-bit RGB units.
+    min_contrast: `float` | `None`
+        Minimum WCAG contrast ratio with the background.
+    background: `RGBA` | `None`
+        Background color. Defaults to white.
+    max_attempts: `int` | `None`
+        Number of candidates to draw before giving up.
+        Defaults to 100 per color.
+
+    Returns
+    -------
+    `Palette`
+        Palette with up to `num` colors. It is shorter if the constraints
+        do not leave enough room.
+    """
+    generator = rng(seed)
+    max_attempts = max_attempts or num * 100
+
+    if min_contrast is not None:
+        bg = background if background is not None else RGBA('FFFFFF')
+        bg_luminance = bg.luminance() + 0.05
+
+    cell = min_distance / math.sqrt(3)
+    grid: dict[tuple[int, int, int], list[tuple[int, int, int]]] = {}
+    accepted: list[int] = []
+    seen: set[int] = set()
+
+    for _ in range(max_attempts):
+        if len(accepted) >= num:
+            break
+
+        r, g, b = _rgb(
+            _hue(generator, hue),
+            generator.randint(*saturation),
+            generator.randint(*lightness)
+        )
+        value = r << 24 | g << 16 | b << 8 | 0xFF
+        if value in seen:
+            continue
+
+        if min_contrast is not None:
+            first = luminance(value) + 0.05
+            ratio = first / bg_luminance if first > bg_luminance else bg_luminance / first
+            if ratio < min_contrast:
+                continue
+
+        if cell > 0:
+            key = (int(r / cell), int(g / cell), int(b / cell))
+            if any(
+                (r - pr) ** 2 + (g - pg) ** 2 + (b - pb) ** 2 < min_distance ** 2
+                for dr in range(-2, 3)
+                for dg in range(-2, 3)
+                for db in range(-2, 3)
+                for pr, pg, pb in grid.get((key[0] + dr, key[1] + dg, key[2] + db), ())
+            ):
+                continue
+
+            grid.setdefault(key, []).append((r, g, b))
+
+        seen.add(value)
+        accepted.append(value)
+
+    return Palette._from_values(accepted, 8 if accepted else None, unique=True)
@@ -0,0 +1,378 @@
+import mmap
+import os
+from array import array
+from collections import Counter
+from collections.abc import Iterable
+
+from .palette import Palette
+from .rgba import _hsl
+from .swatch import _unpack
+
+
+CHANNELS = ('r', 'g', 'b', 'a')
+
+DEFAULT_CHUNK_SIZE = 1 << 20
+
+
+class ColorStats:
+    """
+    Statistics of packed RGBA values.
+
+    Values are counted once per unique color, and all statistics
+    are derived from the counts. Stats of separate chunks or workers
+    can be merged with `+`.
+    """
+
+    __slots__ = ('_bits', '_counts', '_cache')
+
+    def __init__(self, values: Iterable[int] | Counter = (), bits: int = 8) -> None:
+        """
+        Parameters
+        ----------
+        values: `Iterable[int]` | `Counter`
+            Packed values or their counts.
+        bits: `int`
+            Number of bits per channel.
+
+        Raises
+        ------
+        `ValueError`
+            If the bit count is invalid.
+        """
+        if bits % 4 != 0 or bits < 4:
+            raise ValueError("Number of bits must be dividable by 4")
+
+        self._bits = bits
+        self._counts: Counter = Counter()
+        self._cache: dict = {}
+        self.update(values)
+
+    def __add__(self, other: "ColorStats") -> "ColorStats":
+        if not isinstance(other, ColorStats):
+            return NotImplemented
+
+        return self.copy().merge(other)
+
+    def __len__(self) -> int:
+        return self.total
+
+    def __repr__(self) -> str:
+        return f"<ColorStats total={self.total}, unique={self.unique}, bits={self._bits}>"
+
+    @property
+    def bits(self) -> int:
+        return self._bits
+
+    @property
+    def counts(self) -> Counter:
+        """Counts of unique packed values."""
+        return self._counts
+
+    @property
+    def total(self) -> int:
+        """Number of counted values."""
+        return self._cached('total', lambda: sum(self._counts.values()))
+
+    @property
+    def unique(self) -> int:
+        """Number of unique values."""
+        return len(self._counts)
+
+    def _cached(self, key, func):
+        if key not in self._cache:
+            self._cache[key] = func()
+        return self._cache[key]
+
+    def copy(self) -> "ColorStats":
+        """Get a copy of the stats."""
+        return ColorStats(self._counts, self._bits)
+
+    def update(self, values: Iterable[int] | Counter) -> "ColorStats":
+        """
+        Count a chunk of packed values.
+
+        Parameters
+        ----------
+        values: `Iterable[int]` | `Counter`
+            Packed values or their counts.
+        """
+        self._counts.update(values)
+        self._cache.clear()
+        return self
+
+    def merge(self, other: "ColorStats") -> "ColorStats":
+        """
+        Add counts of other stats in place.
+
+        Parameters
+        ----------
+        other: `ColorStats`
+            Stats with the same bit count.
+
+        Raises
+        ------
+        `ValueError`
+            If the bit counts do not match.
+        """
+        if other._bits != self._bits:
+            raise ValueError("Cannot merge stats with different bit counts")
+
+        return self.update(other._counts)
+
+    @classmethod
+    def from_chunks(cls, chunks: Iterable[Iterable[int]], bits: int = 8) -> "ColorStats":
+        """
+        Count a stream of chunks of packed values.
+
+        Parameters
+        ----------
+        chunks: `Iterable[Iterable[int]]`
+            Chunks of packed values.
+        bits: `int`
+            Number of bits per channel.
+        """
+        stats = cls(bits=bits)
+        for chunk in chunks:
+            stats.update(chunk)
+        return stats
+
+    @classmethod
+    def from_file(
+        cls,
+        path: str | os.PathLike,
+        bits: int = 8,
+        offset: int = 0,
+        chunk_size: int = DEFAULT_CHUNK_SIZE
+    ) -> "ColorStats":
+        """
+        Count packed values of a memory-mapped file.
+
+        Values are read as little-endian integers of `bits // 2` bytes,
+        the layout of binary palettes.
+
+        Parameters
+        ----------
+        path: `str` | `os.PathLike`
+            File path.
+        bits: `int`
+            Number of bits per channel.
+        offset: `int`
+            Number of bytes to skip, such as a header.
+        chunk_size: `int`
+            Number of values counted at once.
+        """
+        stats = cls(bits=bits)
+        size = bits // 2
+
+        with open(path, 'rb') as f:
+            length = os.fstat(f.fileno()).st_size - offset
+            if length < size:
+                return stats
+
+            with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as data:
+                with memoryview(data) as view:
+                    end = offset + length // size * size
+                    step = chunk_size * size
+
+                    for start in range(offset, end, step):
+                        chunk = _unpack(view[start:min(start + step, end)], bits)
+                        stats.update(chunk)
+                        if isinstance(chunk, memoryview):
+                            chunk.release()
+
+        return stats
+
+    def _channel_counts(self, channel: int) -> dict[int, int]:
+        def _count() -> dict[int, int]:
+            bits = self._bits
+            shift = (3 - channel) * bits
+            max_one = (1 << bits) - 1
+            result: dict[int, int] = {}
+
+            for value, count in self._counts.items():
+                c = value >> shift & max_one
+                result[c] = result.get(c, 0) + count
+
+            return result
+
+        return self._cached(('channel', channel), _count)
+
+    @staticmethod
+    def _index(channel: int | str) -> int:
+        if isinstance(channel, str):
+            if channel not in CHANNELS:
+                raise ValueError(f"Unknown channel: {channel}")
+            return CHANNELS.index(channel)
+
+        if not 0 <= channel < 4:
+            raise ValueError(f"Unknown channel: {channel}")
+        return channel
+
+    def histogram(self, channel: int | str, bins: int | None = None) -> list[int]:
+        """
+        Get a histogram of a channel.
+
+        Parameters
+        ----------
+        channel: `int` | `str`
+            Channel index or name: `r`, `g`, `b` or `a`.
+        bins: `int` | `None`
+            Number of bins. Defaults to one bin per channel value.
+
+        Raises
+        ------
+        `ValueError`
+            If the channel is unknown or the number of bins is invalid.
+        """
+        levels = 1 << self._bits
+        bins = bins or levels
+        if not 0 < bins <= levels:
+            raise ValueError(f"Number of bins must be in range 1-{levels}")
+
+        result = [0] * bins
+        for c, count in self._channel_counts(self._index(channel)).items():
+            result[c * bins >> self._bits] += count
+
+        return result
+
+    def histogram3d(self, bins: int = 16) -> array:
+        """
+        Get a 3D histogram of red, green and blue.
+
+        Parameters
+        ----------
+        bins: `int`
+            Number of bins along each axis.
+
+        Returns
+        -------
+        `array`
+            Flat counts of `bins ** 3` cells, with blue changing fastest.
+
+        Raises
+        ------
+        `ValueError`
+            If the number of bins is invalid.
+        """
+        bits = self._bits
+        if not 0 < bins <= 1 << bits:
+            raise ValueError(f"Number of bins must be in range 1-{1 << bits}")
+
+        max_one = (1 << bits) - 1
+        result = array('Q', bytes(bins ** 3 * array('Q').itemsize))
+
+        for value, count in self._counts.items():
+            r = (value >> (bits * 3) & max_one) * bins >> bits
+            g = (value >> (bits * 2) & max_one) * bins >> bits
+            b = (value >> bits & max_one) * bins >> bits
+            result[(r * bins + g) * bins + b] += count
+
+        return result
+
+    def mean(self) -> tuple[float, float, float, float]:
+        """
+        Get mean values of the channels.
+
+        Raises
+        ------
+        `ValueError`
+            If no values were counted.
+        """
+        total = self._total()
+        r, g, b, a = (
+            sum(c * n for c, n in self._channel_counts(i).items()) / total
+            for i in range(4)
+        )
+        return r, g, b, a
+
+    def variance(self) -> tuple[float, float, float, float]:
+        """
+        Get population variances of the channels.
+
+        Raises
+        ------
+        `ValueError`
+            If no values were counted.
+        """
+        total = self._total()
+        r, g, b, a = (
+            sum((c - mean) ** 2 * n for c, n in self._channel_counts(i).items()) / total
+            for i, mean in enumerate(self.mean())
+        )
+        return r, g, b, a
+
+    def median(self) -> tuple[int, int, int, int]:
+        """
+        Get lower medians of the channels.
+
+        Raises
+        ------
+        `ValueError`
+            If no values were counted.
+        """
+        middle = (self._total() - 1) // 2
+        result = []
+
+        for i in range(4):
+            seen = 0
+            for c, n in sorted(self._channel_counts(i).items()):
+                seen += n
+                if seen > middle:
+                    result.append(c)
+                    break
+
+        r, g, b, a = result
+        return r, g, b, a
+
+    def _total(self) -> int:
+        total = self.total
+        if total == 0:
+            raise ValueError("No values were counted")
+        return total
+
+    def hue_histogram(self, bins: int = 360) -> list[int]:
+        """
+        Get a histogram of hues like `RGBA.to_hsla` computes them.
+
+        Achromatic values have no hue and are not counted.
+
+        Parameters
+        ----------
+        bins: `int`
+            Number of bins. Defaults to one bin per degree.
+
+        Raises
+        ------
+        `ValueError`
+            If the number of bins is invalid.
+        """
+        if not 0 < bins <= 360:
+            raise ValueError("Number of bins must be in range 1-360")
+
+        bits = self._bits
+        max_one = (1 << bits) - 1
+        result = [0] * bins
+
+        for value, count in self._counts.items():
+            r = (value >> (bits * 3) & max_one) / max_one
+            g = (value >> (bits * 2) & max_one) / max_one
+            b = (value >> bits & max_one) / max_one
+            if r == g == b:
+                continue
+
+            h = round(_hsl(r, g, b)[0]) % 360
+            result[h * bins // 360] += count
+
+        return result
+
+    def most_common(self, num: int) -> Palette:
+        """
+        Get a palette of the most common colors.
+
+        Parameters
+        ----------
+        num: `int`
+            Maximum number of colors.
+        """
+        common = [value for value, _ in self._counts.most_common(num)]
+        return Palette._from_values(common, self._bits if common else None)
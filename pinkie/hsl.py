@@ -0,0 +1,86 @@
+import functools
+
+
+def rgb_to_hsl(r: int, g: int, b: int, max_one: int = 255) -> tuple[int, int, int]:
+    """
+    Convert channel values to `(h, s, l)` using integer math only.
+
+    Differs from `RGBA.to_hsla` by at most 1 unit in each component,
+    because halves are always rounded up.
+
+    Parameters
+    ----------
+    r: `int`
+        Red value.
+    g: `int`
+        Green value.
+    b: `int`
+        Blue value.
+    max_one: `int`
+        Maximum value of a channel.
+    """
+    cmax = max(r, g, b)
+    cmin = min(r, g, b)
+    delta = cmax - cmin
+    total = cmax + cmin
+
+    l = (total * 100 + max_one) // (2 * max_one)
+    if delta == 0:
+        return 0, 0, l
+
+    den = max_one - abs(total - max_one)
+    s = (delta * 200 + den) // (2 * den)
+
+    if cmax == r:
+        h = (120 * (g - b) + delta) // (2 * delta)
+    elif cmax == g:
+        h = 120 + (120 * (b - r) + delta) // (2 * delta)
+    else:
+        h = 240 + (120 * (r - g) + delta) // (2 * delta)
+
+    return h % 360, s, l
+
+
+@functools.lru_cache(maxsize=None)
+def hsl_row(h: int) -> bytes:
+    """
+    Get a cached table of 8-bit `(r, g, b)` values for a hue.
+
+    The table holds 3 bytes for each of the 101 x 101 saturation
+    and lightness values, so a row takes about 30 KB and all 360 rows
+    about 11 MB. Rows are built on first use.
+
+    Parameters
+    ----------
+    h: `int`
+        Hue in range `0-359`.
+    """
+    return bytes(
+        channel
+        for s in range(101)
+        for l in range(101)
+        for channel in _rgb(h, s, l)
+    )
+
+
+def hsl_to_rgb(h: int, s: int, l: int) -> tuple[int, int, int]:
+    """
+    Convert `(h, s, l)` to 8-bit `(r, g, b)` using lookup tables.
+
+    Results are identical to `HSLA.to_rgba`.
+
+    Parameters
+    ----------
+    h: `int`
+        Hue in range `0-359`.
+    s: `int`
+        Saturation in range `0-100`.
+    l: `int`
+        Lightness in range `0-100`.
+    """
+    i = (s * 101 + l) * 3
+    row = hsl_row(h)
+    return row[i], row[i + 1], row[i + 2]
+
+
+from .hsla import _rgb
@@ -1,25 +1,76 @@
-import random
-from typing import Sequence
+from collections.abc import Sequence
 
+from .utils import TYPE_CHECKING, mypyc_attr, rng
 
+if TYPE_CHECKING:
+    from random import Random
+
+
+def _hue_to_rgb(p: float, q: float, t: float) -> float:
+    if t < 0:
+        t += 1
+    if t > 1:
+        t -= 1
+    if t < 1/6:
+        return p + (q - p) * 6 * t
+    if t < 1/2:
+        return q
+    if t < 2/3:
+        return p + (q - p) * (2/3 - t) * 6
+    return p
+
+
+def _rgb(h: int, s: int, l: int) -> tuple[int, int, int]:
+    hf = h / 360.0
+    sf = s / 100.0
+    lf = l / 100.0
+
+    if sf == 0:
+        r = g = b = float(int(lf * 255))
+    else:
+        q = lf * (1 + sf) if lf < 0.5 else lf + sf - lf * sf
+        p = 2 * lf - q
+        r = _hue_to_rgb(p, q, hf + 1/3) * 255
+        g = _hue_to_rgb(p, q, hf) * 255
+        b = _hue_to_rgb(p, q, hf - 1/3) * 255
+
+    return round(r), round(g), round(b)
+
+
+def _pack_hsla(h: int, s: int, l: int, a: int) -> int:
+    # 9 bits of hue and 7 bits of saturation, lightness and alpha
+    return h << 21 | s << 14 | l << 7 | a
+
+
+@mypyc_attr(allow_interpreted_subclasses=True)
 class HSLA:
     """`HSLA` (Hue, Saturation, Lightness, Alpha) color model."""
 
-    __slots__ = ('_h', '_s', '_l', '_a')
+    __slots__ = ('_data',)
+
+    _data: int
 
-    def __init__(self, color: Sequence[int], /) -> None:
+    def __init__(self, color: int | Sequence[int], /) -> None:
         """
         Parameters
         ----------
-        color: `Sequence[int]`
-            Color sequence of h, s, l and optional a.
+        color: `int` | `Sequence[int]`
+            Packed value or a color sequence of h, s, l and optional a.
 
         Raises
         ------
         `ValueError` 
             If the color is invalid.
         """
-        if isinstance(color, Sequence) and len(color) in {3, 4}:
+        self._data = 0
+
+        if isinstance(color, int):
+            if color < 0 or color >> 21 >= 360 or any(
+                (color >> shift & 0x7F) > 100 for shift in (14, 7, 0)
+            ):
+                raise ValueError(f"Invalid packed value: {color}")
+            self._data = color
+        elif isinstance(color, Sequence) and len(color) in {3, 4}:
             self.h = color[0]
             self.s = color[1]
             self.l = color[2]
@@ -28,7 +79,7 @@ class HSLA:
             raise ValueError(f"Invalid color value: {color}")
 
     def __eq__(self, other) -> bool:
-        return isinstance(other, HSLA) and self.hsla == other.hsla
+        return isinstance(other, HSLA) and self._data == other._data
 
     def __ne__(self, other) -> bool:
         return not self.__eq__(other)
@@ -40,7 +91,7 @@ class HSLA:
         return f"<HSLA h={self.h}, s={self.s}, l={self.l}, a={self.a}>"
 
     def __hash__(self) -> int:
-        return hash(self.hsla)
+        return hash(self._data)
             
     def __getitem__(self, key):
         return self.hsla[key]
@@ -49,120 +100,150 @@ class HSLA:
         for item in self.hsla:
             yield item
 
+    def _assign(self, data: int) -> "HSLA":
+        self._data = data
+        return self
+
+    @property
+    def decimal(self) -> int:
+        """Packed value of h, s, l and a."""
+        return self._data
+
     @property
     def h(self) -> int:
         """Hue value in range `0-359`."""
-        return self._h
+        return self._data >> 21
     
     @h.setter
     def h(self, value: int):
         value %= 360
         if value < 0:
             value += 360
-        self._h = round(value)
+        self._data = self._data & 0x1FFFFF | round(value) % 360 << 21
+
+    @property
+    def hue(self) -> int:
+        """Alias of `h`."""
+        return self.h
 
-    hue = h
+    @hue.setter
+    def hue(self, value: int):
+        self.h = value
 
     @property
     def s(self) -> int:
         """Saturation value in range `0-100`."""
-        return self._s
+        return self._data >> 14 & 0x7F
     
     @s.setter
     def s(self, value: int):
         if not isinstance(value, int):
             raise TypeError(f"Value must be an int, not {type(value).__name__}")
-        self._s = min(max(value, 0), 100)
+        self._data = self._data & ~(0x7F << 14) | min(max(value, 0), 100) << 14
 
-    saturation = s
+    @property
+    def saturation(self) -> int:
+        """Alias of `s`."""
+        return self.s
+
+    @saturation.setter
+    def saturation(self, value: int):
+        self.s = value
 
     @property
     def l(self) -> int:
         """Lightness value in range `0-100`."""
-        return self._l
+        return self._data >> 7 & 0x7F
     
     @l.setter
     def l(self, value: int):
         if not isinstance(value, int):
             raise TypeError(f"Value must be an int, not {type(value).__name__}")
-        self._l = min(max(value, 0), 100)
+        self._data = self._data & ~(0x7F << 7) | min(max(value, 0), 100) << 7
+
+    @property
+    def lightness(self) -> int:
+        """Alias of `l`."""
+        return self.l
 
-    lightness = l
+    @lightness.setter
+    def lightness(self, value: int):
+        self.l = value
 
     @property
     def a(self) -> int:
         """Alpha value (transparency) in range `0-100`."""
-        return self._a
+        return self._data & 0x7F
     
     @a.setter
     def a(self, value: int):
         if not isinstance(value, int):
             raise TypeError(f"Value must be an int, not {type(value).__name__}")
-        self._a = min(max(value, 0), 100)
+        self._data = self._data & ~0x7F | min(max(value, 0), 100)
 
-    alpha = a
+    @property
+    def alpha(self) -> int:
+        """Alias of `a`."""
+        return self.a
+
+    @alpha.setter
+    def alpha(self, value: int):
+        self.a = value
 
     @property
     def hsl(self) -> tuple[int, int, int]:
         """`(h, s, l)` tuple."""
-        return (self.h, self.s, self.l)
+        data = self._data
+        return (data >> 21, data >> 14 & 0x7F, data >> 7 & 0x7F)
     
     @property
     def hsla(self) -> tuple[int, int, int, int]:
         """`(h, s, l, a)` tuple."""
-        return (self.h, self.s, self.l, self.a)
+        data = self._data
+        return (data >> 21, data >> 14 & 0x7F, data >> 7 & 0x7F, data & 0x7F)
     
-    def copy(self) -> "HSLA":
-        """Get a copy of the color."""
-        obj = HSLA.__new__(HSLA)
-        obj._h = self._h
-        obj._s = self._s
-        obj._l = self._l
-        obj._a = self._a
-        return obj
-
-    def to_rgba(self):
-        """Convert to `RGBA` model."""
-        from .rgba import RGBA
-
-        h = self.h / 360.0
-        s = self.s / 100.0
-        l = self.l / 100.0
-        
-        def hue_to_rgb(p, q, t):
-            if t < 0:
-                t += 1
-            if t > 1:
-                t -= 1
-            if t < 1/6:
-                return p + (q - p) * 6 * t
-            if t < 1/2:
-                return q
-            if t < 2/3:
-                return p + (q - p) * (2/3 - t) * 6
-            return p
-
-        if s == 0:
-            r = g = b = int(l * 255)
+    def copy(self, out: "HSLA | None" = None) -> "HSLA":
+        """
+        Get a copy of the color.
+
+        Parameters
+        ----------
+        out: `HSLA` | `None`
+            Color to write the copy to instead of creating a new one.
+        """
+        obj = out if out is not None else HSLA.__new__(HSLA)
+        return obj._assign(self._data)
+
+    def to_rgba(self, fast: bool = False, out: "RGBA | None" = None) -> "RGBA":
+        """
+        Convert to `RGBA` model.
+
+        Parameters
+        ----------
+        fast: `bool`
+            Whether to read cached lookup tables instead of computing
+            the color. Results are identical, but each hue builds 
+            a 30 KB table on first use.
+        out: `RGBA` | `None`
+            Color to write the result to instead of creating a new one.
+        """
+        h, s, l = self.hsl
+        if fast:
+            r, g, b = hsl_to_rgb(h, s, l)
         else:
-            q = l * (1 + s) if l < 0.5 else l + s - l * s
-            p = 2 * l - q
-            r = hue_to_rgb(p, q, h + 1/3) * 255
-            g = hue_to_rgb(p, q, h) * 255
-            b = hue_to_rgb(p, q, h - 1/3) * 255
-
-        return RGBA((
-            round(r), 
-            round(g), 
-            round(b), 
-            round(self.a * 2.55)
-        ))
+            r, g, b = _rgb(h, s, l)
+
+        if out is None:
+            out = RGBA.__new__(RGBA)
+
+        return out._assign(r << 24 | g << 16 | b << 8 | round(self.a * 2.55), 8)
 
     def range(
         self, 
         num: int, 
         step: int, 
-        angle: int | None = None
+        angle: int | None = None,
+        out: list["HSLA"] | None = None
     ) -> list["HSLA"]:
         """
         Get a list of circular colors.
@@ -175,22 +256,49 @@ class HSLA:
             Step angle in degrees.
         angle: `int`
             Start angle.
+        out: `list[HSLA]` | `None`
+            List to write the colors to instead of creating a new one.
+            Its colors are reused, and it is resized to `num` colors.
         """
         angle = angle or self.h
-        result = []
+        result = out if out is not None else []
+        del result[num:]
 
         for i in range(num):
-            co = self.copy()
+            if i < len(result):
+                co = self.copy(result[i])
+            else:
+                co = self.copy()
+                result.append(co)
+
             co.h = angle + step * i
-            result.append(co)
 
         return result
 
-    def complementary(self) -> "HSLA":
-        """Get a complementary color."""
-        color = self.copy()
+    def complementary(self, out: "HSLA | None" = None) -> "HSLA":
+        """
+        Get a complementary color.
+
+        Parameters
+        ----------
+        out: `HSLA` | `None`
+            Color to write the result to instead of creating a new one.
+        """
+        color = self.copy(out)
         color.h += 180
         return color
+
+    def shift_hue_inplace(self, degrees: int) -> "HSLA":
+        """
+        Rotate hue of the color in place.
+
+        Parameters
+        ----------
+        degrees: `int`
+            Hue shift in degrees.
+        """
+        self.h += degrees
+        return self
     
     def split_complementary(self) -> list["HSLA"]:
         """Get 2 split-complementary colors."""
@@ -209,5 +317,18 @@ class HSLA:
         return self.range(3, 30, self.h - 30)
     
     @classmethod
-    def random(cls) -> "HSLA":
-        return cls([random.randint(0, i) for i in (360, 100, 100, 100)])
\ No newline at end of file
+    def random(cls, seed: "int | Random | None" = None) -> "HSLA":
+        """
+        Generate a random color.
+
+        Parameters
+        ----------
+        seed: `int` | `random.Random` | `None`
+            Seed or generator to use instead of the shared one.
+        """
+        generator = rng(seed)
+        return cls([generator.randint(0, i) for i in (360, 100, 100, 100)])
+
+
+from .rgba import RGBA
+from .hsl import hsl_to_rgb
@@ -0,0 +1,300 @@
+import importlib
+import sys
+from array import array
+from collections.abc import Sequence
+
+from .utils import packed_typecode
+
+
+# arrow and numpy integer types by size in bytes
+_TYPECODES = {1: 'B', 2: 'H', 4: 'I', 8: 'Q'}
+
+
+def _require(name: str):
+    try:
+        return importlib.import_module(name)
+    except ImportError:
+        raise ImportError(
+            f"{name} is required for this conversion, install it with `pip install {name}`"
+        ) from None
+
+
+def _typecode(bits: int) -> str:
+    # typecode of items of exactly `bits // 2` bytes
+    size = bits // 2
+    typecode = _TYPECODES.get(size)
+    if typecode is None or array(typecode).itemsize != size:
+        raise ValueError(f"Values of {bits} bits per channel do not fit an integer type")
+    return typecode
+
+
+def _array(values: Sequence[int], bits: int) -> array:
+    typecode = _typecode(bits)
+    if isinstance(values, array) and values.typecode == typecode:
+        return values
+
+    result = array(typecode)
+    if isinstance(values, (array, memoryview)) and values.itemsize == result.itemsize:
+        # unsigned values of the same size have the same bytes
+        result.frombytes(memoryview(values).cast('B'))
+    else:
+        result.extend(values)
+    return result
+
+
+def to_bytes(values: Sequence[int], bits: int = 8) -> bytes:
+    """
+    Serialize packed values to raw bytes in channel order.
+
+    For 8 bits per channel the layout is RGBA8888: one byte of red, green,
+    blue and alpha per color. Wider channels are stored big-endian.
+
+    Parameters
+    ----------
+    values: `Sequence[int]`
+        Packed values.
+    bits: `int`
+        Number of bits per channel.
+    """
+    size = bits // 2
+
+    try:
+        data = _array(values, bits)
+    except ValueError:
+        return b''.join(value.to_bytes(size, 'big') for value in values)
+
+    if sys.byteorder == 'little':
+        if data is values:
+            data = array(data.typecode, data)
+        data.byteswap()
+    return data.tobytes()
+
+
+def from_bytes(data: bytes | bytearray | memoryview, bits: int = 8) -> Sequence[int]:
+    """
+    Read packed values from raw bytes in channel order.
+
+    The inverse of `to_bytes`.
+
+    Parameters
+    ----------
+    data: `bytes` | `bytearray` | `memoryview`
+        Raw bytes, such as RGBA8888 pixels for 8 bits per channel.
+    bits: `int`
+        Number of bits per channel.
+
+    Returns
+    -------
+    `Sequence[int]`
+        Array of values, or a list if they do not fit into 64 bits.
+
+    Raises
+    ------
+    `ValueError`
+        If the length is not a multiple of the color size.
+    """
+    size = bits // 2
+    view = memoryview(data).cast('B')
+    if len(view) % size != 0:
+        raise ValueError(f"Data length must be a multiple of {size} bytes")
+
+    result = packed_typecode(bits)
+    try:
+        typecode = _typecode(bits)
+    except ValueError:
+        items = [
+            int.from_bytes(view[i:i + size], 'big')
+            for i in range(0, len(view), size)
+        ]
+        return array(result, items) if result else items
+
+    values = array(typecode)
+    values.frombytes(view)
+    if sys.byteorder == 'little':
+        values.byteswap()
+
+    # values of exactly `size` bytes always fit a packed typecode
+    assert result is not None
+    return values if result == typecode else array(result, values)
+
+
+def to_numpy(values: Sequence[int], bits: int = 8, channels: bool = False):
+    """
+    Copy packed values to a NumPy array.
+
+    Parameters
+    ----------
+    values: `Sequence[int]`
+        Packed values.
+    bits: `int`
+        Number of bits per channel, up to 16.
+    channels: `bool`
+        Whether to split values into an `(n, 4)` array of r, g, b and a
+        instead of returning an `(n,)` array of packed values.
+
+    Raises
+    ------
+    `ImportError`
+        If NumPy is not installed.
+    `ValueError`
+        If values do not fit an integer type.
+    """
+    np = _require('numpy')
+
+    data = _array(values, bits)
+    packed = np.frombuffer(data, dtype=f'=u{data.itemsize}').copy()
+    if not channels:
+        return packed
+
+    shifts = np.array([bits * 3, bits * 2, bits, 0], dtype=packed.dtype)
+    result = packed[:, None] >> shifts & ((1 << bits) - 1)
+    return result.astype(np.uint8 if bits <= 8 else np.uint16)
+
+
+def from_numpy(data, bits: int = 8) -> Sequence[int]:
+    """
+    Read packed values from a NumPy array.
+
+    Parameters
+    ----------
+    data: `numpy.ndarray`
+        Array of packed values, or an array of r, g, b and a channels
+        whose last axis has 4 items, such as an `(height, width, 4)` image.
+    bits: `int`
+        Number of bits per channel, up to 16.
+
+    Raises
+    ------
+    `ImportError`
+        If NumPy is not installed.
+    `ValueError`
+        If the array has an invalid shape, a non-integer type
+        or values out of range.
+    """
+    np = _require('numpy')
+
+    data = np.asarray(data)
+    if data.dtype.kind not in 'ui':
+        raise ValueError(f"Expected an integer array, got {data.dtype}")
+
+    result = array(_typecode(bits))
+
+    if data.ndim > 1:
+        if data.shape[-1] != 4:
+            raise ValueError(f"Expected 4 channels, got {data.shape[-1]}")
+
+        limit = 1 << bits
+        data = data.reshape(-1, 4)
+        packed = np.zeros(len(data), dtype=np.uint64)
+        for c, shift in enumerate((bits * 3, bits * 2, bits, 0)):
+            packed |= data[:, c].astype(np.uint64) << np.uint64(shift)
+    else:
+        limit = 1 << (bits * 4)
+        packed = data
+
+    if data.size and (data.min() < 0 or int(data.max()) >= limit):
+        raise ValueError(f"Values are out of range for {bits} bits per channel")
+
+    result.frombytes(packed.astype(f'=u{result.itemsize}').tobytes())
+
+    typecode = packed_typecode(bits)
+    assert typecode is not None
+    return array(typecode, result)
+
+
+def to_arrow(values: Sequence[int], bits: int = 8, channels: bool = True):
+    """
+    Wrap packed values in an Arrow array.
+
+    Parameters
+    ----------
+    values: `Sequence[int]`
+        Packed values.
+    bits: `int`
+        Number of bits per channel.
+    channels: `bool`
+        Whether to return a `FixedSizeList<uint8, 4>` array of r, g, b and a
+        (`uint16` for 16 bits per channel) instead of a `uint32` array
+        of packed values (`uint16` or `uint64` for other bit counts).
+
+    Raises
+    ------
+    `ImportError`
+        If PyArrow is not installed.
+    `ValueError`
+        If values do not fit an integer type or channels are not
+        8 or 16 bits wide.
+    """
+    pa = _require('pyarrow')
+
+    if not channels:
+        data = _array(values, bits)
+        kind = {2: pa.uint16(), 4: pa.uint32(), 8: pa.uint64()}[data.itemsize]
+        return pa.Array.from_buffers(kind, len(data), [None, pa.py_buffer(data)])
+
+    if bits not in {8, 16}:
+        raise ValueError("Arrow channels need 8 or 16 bits per channel")
+
+    flat = array('B' if bits == 8 else 'H')
+    flat.frombytes(to_bytes(values, bits))
+    if bits == 16 and sys.byteorder == 'little':
+        flat.byteswap()
+
+    kind = pa.uint8() if bits == 8 else pa.uint16()
+    flat_array = pa.Array.from_buffers(kind, len(flat), [None, pa.py_buffer(flat)])
+    return pa.FixedSizeListArray.from_arrays(flat_array, 4)
+
+
+def from_arrow(data, bits: int = 8) -> Sequence[int]:
+    """
+    Read packed values from an Arrow array.
+
+    Parameters
+    ----------
+    data: `pyarrow.Array` | `pyarrow.ChunkedArray`
+        `FixedSizeList` array of 4 unsigned channels as created by `to_arrow`,
+        or an unsigned integer array of packed values.
+    bits: `int`
+        Number of bits per channel.
+
+    Raises
+    ------
+    `ImportError`
+        If PyArrow is not installed.
+    `ValueError`
+        If the array has nulls, an invalid type or values out of range.
+    """
+    pa = _require('pyarrow')
+
+    if isinstance(data, pa.ChunkedArray):
+        data = data.combine_chunks()
+    if data.null_count:
+        raise ValueError("Arrow array must not have nulls")
+
+    kind = data.type
+    if pa.types.is_fixed_size_list(kind):
+        if kind.list_size != 4:
+            raise ValueError(f"Expected 4 channels, got {kind.list_size}")
+
+        data = data.flatten()
+        width = data.type.bit_width
+        if width != bits or width not in {8, 16}:
+            raise ValueError(f"Expected {bits}-bit channels, got {data.type}")
+    elif not pa.types.is_unsigned_integer(kind):
+        raise ValueError(f"Expected a FixedSizeList or unsigned integer array, got {kind}")
+
+    size = data.type.bit_width // 8
+    flat = array(_TYPECODES[size])
+    start = data.offset * size
+    flat.frombytes(memoryview(data.buffers()[1])[start:start + len(data) * size])
+
+    if pa.types.is_fixed_size_list(kind):
+        if sys.byteorder == 'little':
+            flat.byteswap()
+        return from_bytes(flat.tobytes(), bits)
+
+    if flat and max(flat) >> (bits * 4):
+        raise ValueError(f"Values are out of range for {bits} bits per channel")
+
+    typecode = packed_typecode(bits)
+    return array(typecode, flat) if typecode else list(flat)
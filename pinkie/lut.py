@@ -0,0 +1,493 @@
+import functools
+import os
+from array import array
+from collections.abc import Callable, MutableSequence, Sequence
+
+from .gamma import _decode, encode
+from .parallel import map_chunks
+from .rgba import RGBA
+
+
+_Func = Callable[[float, float, float], Sequence[float]]
+
+METHODS = ('trilinear', 'tetrahedral')
+
+
+class LUT3D:
+    """
+    3D color lookup table.
+
+    The grid holds `size ** 3` output `(r, g, b)` points in a float32 array,
+    with red changing fastest like in `.cube` files.
+    """
+
+    __slots__ = ('_size', '_table', '_domain_min', '_domain_max', 'title')
+
+    def __init__(
+        self,
+        size: int,
+        table: Sequence[float],
+        domain_min: Sequence[float] = (0.0, 0.0, 0.0),
+        domain_max: Sequence[float] = (1.0, 1.0, 1.0),
+        title: str | None = None
+    ) -> None:
+        """
+        Parameters
+        ----------
+        size: `int`
+            Number of points along each axis.
+        table: `Sequence[float]`
+            Flat sequence of `size ** 3` output r, g and b values.
+        domain_min: `Sequence[float]`
+            Input values mapped to the first grid point.
+        domain_max: `Sequence[float]`
+            Input values mapped to the last grid point.
+        title: `str` | `None`
+            Title of the table.
+
+        Raises
+        ------
+        `ValueError`
+            If the size, the table length or the domain is invalid.
+        """
+        if size < 2:
+            raise ValueError("LUT size must be at least 2")
+
+        if len(table) != size ** 3 * 3:
+            raise ValueError(f"LUT of size {size} must have {size ** 3 * 3} values")
+
+        if len(domain_min) != 3 or len(domain_max) != 3 or any(
+            low >= high for low, high in zip(domain_min, domain_max)
+        ):
+            raise ValueError("Invalid LUT domain")
+
+        values: array
+        if isinstance(table, array) and table.typecode == 'f':
+            values = table
+        else:
+            values = array('f', table)
+
+        self._size = size
+        self._table = values
+        self._domain_min = tuple(float(i) for i in domain_min)
+        self._domain_max = tuple(float(i) for i in domain_max)
+        self.title = title
+
+    def __eq__(self, other) -> bool:
+        return (
+            isinstance(other, LUT3D)
+            and self._size == other._size
+            and self._domain_min == other._domain_min
+            and self._domain_max == other._domain_max
+            and self._table == other._table
+        )
+
+    def __repr__(self) -> str:
+        return f"<LUT3D size={self._size}, title={self.title!r}>"
+
+    @property
+    def size(self) -> int:
+        """Number of points along each axis."""
+        return self._size
+
+    @property
+    def table(self) -> array:
+        """Flat float32 array of output r, g and b values."""
+        return self._table
+
+    @classmethod
+    def identity(cls, size: int = 33) -> "LUT3D":
+        """
+        Create a table that keeps colors unchanged.
+
+        Parameters
+        ----------
+        size: `int`
+            Number of points along each axis.
+        """
+        return cls.from_function(lambda r, g, b: (r, g, b), size)
+
+    @classmethod
+    def from_function(cls, func: _Func, size: int = 33, title: str | None = None) -> "LUT3D":
+        """
+        Bake a color transform into a table.
+
+        Parameters
+        ----------
+        func: `Callable[[float, float, float], Sequence[float]]`
+            Function that maps r, g and b in range `0-1` to new values.
+        size: `int`
+            Number of points along each axis.
+        title: `str` | `None`
+            Title of the table.
+        """
+        step = size - 1
+        table = array('f')
+        for b in range(size):
+            for g in range(size):
+                for r in range(size):
+                    table.extend(func(r / step, g / step, b / step)[:3])
+
+        return cls(size, table, title=title)
+
+    @classmethod
+    def from_adjust(cls, adjust: "Adjust", size: int = 33) -> "LUT3D":
+        """
+        Bake an adjustment chain into a table.
+
+        Parameters
+        ----------
+        adjust: `Adjust`
+            Adjustments to apply.
+        size: `int`
+            Number of points along each axis.
+        """
+        def _func(r: float, g: float, b: float) -> tuple[float, float, float]:
+            color = adjust(RGBA([round(c * 255) for c in (r, g, b)]))
+            return color.r / 255, color.g / 255, color.b / 255
+
+        return cls.from_function(_func, size)
+
+    @classmethod
+    def from_blend(cls, mode: "BlendMode", color: RGBA, size: int = 33) -> "LUT3D":
+        """
+        Bake blending with a constant foreground color into a table.
+
+        Parameters
+        ----------
+        mode: `BlendMode`
+            Blending mode.
+        color: `RGBA`
+            Foreground color.
+        size: `int`
+            Number of points along each axis.
+        """
+        linear = mode.linear
+        fg = color.to_rgbaf(linear).rgba
+
+        def _func(r: float, g: float, b: float) -> Sequence[float]:
+            bg = (r, g, b)
+            if linear:
+                bg = (_decode(r), _decode(g), _decode(b))
+
+            blended = mode.blend((*bg, 1.0), fg)[:3]
+            if linear:
+                return [encode(c) for c in blended]
+
+            return blended
+
+        return cls.from_function(_func, size)
+
+    def then(self, other: "LUT3D", size: int | None = None) -> "LUT3D":
+        """
+        Bake this table followed by another one into a new table.
+
+        Parameters
+        ----------
+        other: `LUT3D`
+            Table applied to the output of this one.
+        size: `int` | `None`
+            Number of points along each axis. Defaults to the size of this table.
+        """
+        return LUT3D.from_function(
+            lambda r, g, b: other.sample(*self.sample(r, g, b)),
+            size or self._size
+        )
+
+    def _point(self, r: int, g: int, b: int) -> int:
+        size = self._size
+        return ((b * size + g) * size + r) * 3
+
+    def sample(
+        self,
+        r: float,
+        g: float,
+        b: float,
+        method: str = 'tetrahedral'
+    ) -> tuple[float, float, float]:
+        """
+        Interpolate output values for an input color.
+
+        Inputs outside the domain are clamped.
+
+        Parameters
+        ----------
+        r: `float`
+            Red value.
+        g: `float`
+            Green value.
+        b: `float`
+            Blue value.
+        method: `str`
+            `tetrahedral` or `trilinear` interpolation.
+
+        Raises
+        ------
+        `ValueError`
+            If the method is unknown.
+        """
+        step = self._size - 1
+        pos = []
+        for c, low, high in zip((r, g, b), self._domain_min, self._domain_max):
+            x = min(max((c - low) / (high - low), 0.0), 1.0) * step
+            i = min(int(x), step - 1)
+            pos.append((i, x - i))
+
+        (ri, fr), (gi, fg), (bi, fb) = pos
+        table = self._table
+        point = self._point
+        c000 = point(ri, gi, bi)
+
+        if method == 'trilinear':
+            c100 = point(ri + 1, gi, bi)
+            c010 = point(ri, gi + 1, bi)
+            c110 = point(ri + 1, gi + 1, bi)
+            c001 = point(ri, gi, bi + 1)
+            c101 = point(ri + 1, gi, bi + 1)
+            c011 = point(ri, gi + 1, bi + 1)
+            c111 = point(ri + 1, gi + 1, bi + 1)
+
+            def _channel(n: int) -> float:
+                x00 = table[c000 + n] + (table[c100 + n] - table[c000 + n]) * fr
+                x10 = table[c010 + n] + (table[c110 + n] - table[c010 + n]) * fr
+                x01 = table[c001 + n] + (table[c101 + n] - table[c001 + n]) * fr
+                x11 = table[c011 + n] + (table[c111 + n] - table[c011 + n]) * fr
+                y0 = x00 + (x10 - x00) * fg
+                y1 = x01 + (x11 - x01) * fg
+                return y0 + (y1 - y0) * fb
+
+            return _channel(0), _channel(1), _channel(2)
+
+        if method != 'tetrahedral':
+            raise ValueError(f"Unknown interpolation method: {method}")
+
+        # split the cube into 6 tetrahedra by the order of fractions
+        c111 = point(ri + 1, gi + 1, bi + 1)
+        if fr > fg:
+            if fg > fb:
+                c1, c2 = point(ri + 1, gi, bi), point(ri + 1, gi + 1, bi)
+                w0, w1, w2, w3 = 1 - fr, fr - fg, fg - fb, fb
+            elif fr > fb:
+                c1, c2 = point(ri + 1, gi, bi), point(ri + 1, gi, bi + 1)
+                w0, w1, w2, w3 = 1 - fr, fr - fb, fb - fg, fg
+            else:
+                c1, c2 = point(ri, gi, bi + 1), point(ri + 1, gi, bi + 1)
+                w0, w1, w2, w3 = 1 - fb, fb - fr, fr - fg, fg
+        else:
+            if fb > fg:
+                c1, c2 = point(ri, gi, bi + 1), point(ri, gi + 1, bi + 1)
+                w0, w1, w2, w3 = 1 - fb, fb - fg, fg - fr, fr
+            elif fb > fr:
+                c1, c2 = point(ri, gi + 1, bi), point(ri, gi + 1, bi + 1)
+                w0, w1, w2, w3 = 1 - fg, fg - fb, fb - fr, fr
+            else:
+                c1, c2 = point(ri, gi + 1, bi), point(ri + 1, gi + 1, bi)
+                w0, w1, w2, w3 = 1 - fg, fg - fr, fr - fb, fb
+
+        r, g, b = (
+            w0 * table[c000 + n] + w1 * table[c1 + n]
+            + w2 * table[c2 + n] + w3 * table[c111 + n]
+            for n in range(3)
+        )
+        return r, g, b
+
+    def __call__(
+        self,
+        color: RGBA,
+        method: str = 'tetrahedral',
+        out: RGBA | None = None
+    ) -> RGBA:
+        """
+        Apply the table to a color. Alpha and bit count are kept.
+
+        Parameters
+        ----------
+        color: `RGBA`
+            Color to transform.
+        method: `str`
+            `tetrahedral` or `trilinear` interpolation.
+        out: `RGBA` | `None`
+            Color to write the result to instead of creating a new one.
+
+        Raises
+        ------
+        `ValueError`
+            If the method is unknown.
+        """
+        bits = color.bits
+        max_one = (1 << bits) - 1
+        r, g, b = color.rgb
+        rgb = self.sample(r / max_one, g / max_one, b / max_one, method=method)
+
+        value = color.a
+        for num, c in zip((3, 2, 1), rgb):
+            value |= min(max(round(c * max_one), 0), max_one) << (num * bits)
+
+        if out is None:
+            out = RGBA.__new__(RGBA)
+
+        return out._assign(value, bits)
+
+    def apply(
+        self,
+        values: Sequence[int],
+        bits: int = 8,
+        method: str = 'tetrahedral',
+        out: MutableSequence[int] | None = None
+    ) -> MutableSequence[int]:
+        """
+        Apply the table to packed RGBA values. Alpha is kept.
+
+        Each unique color is interpolated once per chunk.
+        Large inputs are split between threads of `pinkie.parallel`.
+
+        Parameters
+        ----------
+        values: `Sequence[int]`
+            Packed values.
+        bits: `int`
+            Number of bits per channel.
+        method: `str`
+            `tetrahedral` or `trilinear` interpolation.
+        out: `MutableSequence[int]` | `None`
+            List or array to write the results to instead of creating
+            a new list. May be `values` to work in place.
+
+        Raises
+        ------
+        `ValueError`
+            If the method is unknown or the output has a different length.
+        """
+        if method not in METHODS:
+            raise ValueError(f"Unknown interpolation method: {method}")
+
+        return map_chunks(
+            functools.partial(self._apply, bits=bits, method=method),
+            values,
+            out=out
+        )
+
+    def _apply(self, values: Sequence[int], bits: int, method: str) -> list[int]:
+        max_one = (1 << bits) - 1
+        sample = self.sample
+        mapped: dict[int, int] = {}
+        result = []
+
+        for value in values:
+            rgb = value >> bits
+            if rgb not in mapped:
+                channels = (
+                    (rgb >> (bits * 2) & max_one) / max_one,
+                    (rgb >> bits & max_one) / max_one,
+                    (rgb & max_one) / max_one
+                )
+                packed = 0
+                for c in sample(*channels, method=method):
+                    packed = packed << bits | min(max(round(c * max_one), 0), max_one)
+                mapped[rgb] = packed << bits
+
+            result.append(mapped[rgb] | value & max_one)
+
+        return result
+
+    @classmethod
+    def loads(cls, text: str) -> "LUT3D":
+        """
+        Parse a table in `.cube` format.
+
+        Parameters
+        ----------
+        text: `str`
+            File content.
+
+        Raises
+        ------
+        `ValueError`
+            If the content is invalid or describes a 1D table.
+        """
+        size = None
+        title = None
+        domain_min: tuple[float, ...] = (0.0, 0.0, 0.0)
+        domain_max: tuple[float, ...] = (1.0, 1.0, 1.0)
+        table = array('f')
+
+        for line in text.splitlines():
+            line = line.strip()
+            if not line or line.startswith('#'):
+                continue
+
+            keyword, _, rest = line.partition(' ')
+            if keyword == 'TITLE':
+                title = rest.strip().strip('"')
+            elif keyword == 'LUT_3D_SIZE':
+                size = int(rest)
+            elif keyword == 'LUT_1D_SIZE':
+                raise ValueError("1D LUTs are not supported")
+            elif keyword == 'DOMAIN_MIN':
+                domain_min = tuple(float(i) for i in rest.split())
+            elif keyword == 'DOMAIN_MAX':
+                domain_max = tuple(float(i) for i in rest.split())
+            elif keyword[0].isalpha():
+                # unknown keywords of other applications
+                continue
+            else:
+                values = line.split()
+                if len(values) != 3:
+                    raise ValueError(f"Invalid LUT line: {line}")
+                table.extend(float(i) for i in values)
+
+        if size is None:
+            raise ValueError("LUT size is not specified")
+
+        return cls(size, table, domain_min, domain_max, title)
+
+    def dumps(self) -> str:
+        """Get the table in `.cube` format."""
+        lines = []
+        if self.title is not None:
+            lines.append(f'TITLE "{self.title}"')
+
+        lines.append(f"LUT_3D_SIZE {self._size}")
+        if self._domain_min != (0.0, 0.0, 0.0) or self._domain_max != (1.0, 1.0, 1.0):
+            lines.append("DOMAIN_MIN " + " ".join(f"{i:g}" for i in self._domain_min))
+            lines.append("DOMAIN_MAX " + " ".join(f"{i:g}" for i in self._domain_max))
+
+        table = self._table
+        for i in range(0, len(table), 3):
+            lines.append(f"{table[i]:.6f} {table[i + 1]:.6f} {table[i + 2]:.6f}")
+
+        return "\n".join(lines) + "\n"
+
+    @classmethod
+    def load(cls, path: str | os.PathLike) -> "LUT3D":
+        """
+        Load a `.cube` file.
+
+        Parameters
+        ----------
+        path: `str` | `os.PathLike`
+            File path.
+
+        Raises
+        ------
+        `ValueError`
+            If the file is invalid or describes a 1D table.
+        """
+        with open(path) as f:
+            return cls.loads(f.read())
+
+    def save(self, path: str | os.PathLike) -> None:
+        """
+        Save the table to a `.cube` file.
+
+        Parameters
+        ----------
+        path: `str` | `os.PathLike`
+            File path.
+        """
+        with open(path, 'w') as f:
+            f.write(self.dumps())
+
+
+from .adjust import Adjust
+from .blend import BlendMode
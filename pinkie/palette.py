@@ -1,6 +1,86 @@
 from __future__ import annotations
 
-from .rgba import RGBA
+import functools
+import math
+import sys
+from array import array
+from collections.abc import Callable, Iterable, Sequence
+from itertools import repeat
+
+from .gamma import MAX_TABLE_BITS, _decode, decode_table, luminance, luminance_tables
+from .rgba import RGBA, _hsl
+from .utils import TYPE_CHECKING, packed_typecode
+
+if TYPE_CHECKING:
+    from random import Random
+
+
+@functools.lru_cache(maxsize=None)
+def _brightness_tables(bits: int) -> tuple[array, ...]:
+    max_one = (1 << bits) - 1
+    return tuple(
+        array('d', (weight * (i / max_one) ** 2 for i in range(max_one + 1)))
+        for weight in (0.299, 0.587, 0.114)
+    )
+
+
+DISTANCE_METRICS = ('rgb', 'rgba', 'linear', 'lab')
+
+# sRGB primaries to CIE XYZ, normalized to the D65 white point
+_XYZ = (
+    (0.4124564 / 0.95047, 0.3575761 / 0.95047, 0.1804375 / 0.95047),
+    (0.2126729, 0.7151522, 0.0721750),
+    (0.0193339 / 1.08883, 0.1191920 / 1.08883, 0.9503041 / 1.08883)
+)
+
+
+def _lab_f(t: float) -> float:
+    if t > 216 / 24389:
+        return t ** (1 / 3)
+    return (24389 / 27 * t + 16) / 116
+
+
+def _points(values: Sequence[int], bits: int, metric) -> list[tuple[float, ...]]:
+    if callable(metric):
+        return [tuple(metric(RGBA(v, bits=bits))) for v in values]
+
+    if metric not in DISTANCE_METRICS:
+        raise ValueError(f"Unknown metric: {metric}")
+
+    max_one = (1 << bits) - 1
+    channels = [
+        (v >> (bits * 3) & max_one, v >> (bits * 2) & max_one, v >> bits & max_one, v & max_one)
+        for v in values
+    ]
+
+    if metric == 'rgb':
+        return [(r / max_one, g / max_one, b / max_one) for r, g, b, _ in channels]
+    
+    if metric == 'rgba':
+        return [(r / max_one, g / max_one, b / max_one, a / max_one) for r, g, b, a in channels]
+
+    linear: list[tuple[float, ...]]
+    if bits <= MAX_TABLE_BITS:
+        table = decode_table(bits)
+        linear = [(table[r], table[g], table[b]) for r, g, b, _ in channels]
+    else:
+        linear = [
+            (_decode(r / max_one), _decode(g / max_one), _decode(b / max_one))
+            for r, g, b, _ in channels
+        ]
+
+    if metric == 'linear':
+        return linear
+
+    (xr, xg, xb), (yr, yg, yb), (zr, zg, zb) = _XYZ
+    points: list[tuple[float, ...]] = []
+    for r, g, b in linear:
+        fx = _lab_f(xr * r + xg * g + xb * b)
+        fy = _lab_f(yr * r + yg * g + yb * b)
+        fz = _lab_f(zr * r + zg * g + zb * b)
+        points.append((116 * fy - 16, 500 * (fx - fy), 200 * (fy - fz)))
+    
+    return points
 
 
 class Palette:
@@ -8,48 +88,258 @@ class Palette:
 
     _web: Palette | None = None
 
-    def __init__(self, *colors: RGBA) -> None:
+    def __init__(self, *colors: RGBA, unique: bool = False) -> None:
         """
         Palette constructor.
 
+        Colors are stored as packed values in an array 
+        with a hash index, so membership tests, additions 
+        and removals take constant time.
+
         Parameters
         ----------
         *colors: `RGBA`
             List of colors.
+        unique: `bool`
+            Whether to skip colors that are already in the palette.
 
         Raises
         ------
         `ValueError` 
             If any of colors is not `RGBA` instance.
         """
-        self._items: list[RGBA] = []
-        self._bits: int | None = None
+        self._unique: bool = unique
+        self._reset()
 
         for color in colors:
             self.add_color(color)
 
     def __eq__(self, other) -> bool:
-        return (
-            isinstance(other, Palette) 
-            and len(self) == len(other)
-            and all(first == second for first, second in zip(self, other))
-        )
+        if not isinstance(other, Palette) or len(self) != len(other):
+            return False
+        
+        self._compact()
+        other._compact()
+        return self._bits == other._bits and self._values == other._values
 
     def __ne__(self, other) -> bool:
         return not self.__eq__(other)
 
     def __str__(self) -> str:
-        return f"Palette(num={len(self._items)})"
+        return f"Palette(num={len(self)})"
 
     def __repr__(self) -> str:
-        return f"<Palette colors={self._items}>"
+        return f"<Palette colors={list(self)}>"
+    
+    def __len__(self) -> int:
+        return len(self._values) - self._holes
+    
+    def __contains__(self, color) -> bool:
+        return (
+            isinstance(color, RGBA) 
+            and color.bits == self._bits 
+            and color._data in self._lookup()
+        )
     
     def __getitem__(self, key):
-        return self._items[key]
+        self._compact()
+
+        if isinstance(key, slice):
+            return [RGBA(i, bits=self._bits) for i in self._values[key]]
+        
+        return RGBA(self._values[key], bits=self._bits)
     
     def __iter__(self):
-        for item in self._items:
-            yield item
+        bits = self._bits
+        for value in self._live():
+            yield RGBA(value, bits=bits)
+
+    def __or__(self, other: Palette) -> Palette:
+        return self.union(other)
+    
+    def __and__(self, other: Palette) -> Palette:
+        return self.intersection(other)
+    
+    def __sub__(self, other: Palette) -> Palette:
+        return self.difference(other)
+
+    def _reset(self, bits: int | None = None) -> None:
+        typecode = packed_typecode(bits) if bits else None
+
+        self._bits: int | None = bits
+        self._values: array | list[int] = array(typecode) if typecode else []
+        self._alive = bytearray()
+        self._holes: int = 0
+        self._index: dict[int, list[int]] | None = {}
+        self._cache: dict[str, object] = {}
+
+    def _live(self):
+        if self._holes == 0:
+            return iter(self._values)
+        
+        return (v for v, alive in zip(self._values, self._alive) if alive)
+
+    def _lookup(self) -> dict[int, list[int]]:
+        if self._index is None:
+            index: dict[int, list[int]] = {}
+            for pos, value in enumerate(self._values):
+                if value in index:
+                    index[value].append(pos)
+                else:
+                    index[value] = [pos]
+            
+            self._index = index
+
+        return self._index
+
+    def _append(self, value: int) -> None:
+        if self._index is not None:
+            positions = self._index.get(value)
+
+            if positions is None:
+                self._index[value] = [len(self._values)]
+            elif self._unique:
+                return
+            else:
+                positions.append(len(self._values))
+
+        if isinstance(self._values, memoryview):
+            values = array(self._values.format)
+            values.frombytes(self._values.cast('B'))
+            self._values = values
+
+        try:
+            self._values.append(value)
+        except BufferError:
+            # the array is exported, so detach from the exported buffer
+            assert isinstance(self._values, array)
+            self._values = array(self._values.typecode, self._values)
+            self._values.append(value)
+
+        self._alive.append(1)
+
+    def _compact(self) -> None:
+        if self._holes == 0:
+            return
+        
+        values = list(self._live())
+        cache = self._cache
+        self._reset(self._bits)
+
+        for value in values:
+            self._append(value)
+
+        self._cache = cache
+
+    def _cached(self, key: str, func):
+        cache = self._cache
+        if key not in cache:
+            cache[key] = func()
+        return cache[key]
+    
+    def _channels(self):
+        bits = self._bits
+        max_one = (1 << bits) - 1
+        return (
+            (v >> (bits * 3) & max_one, v >> (bits * 2) & max_one, v >> bits & max_one)
+            for v in self._live()
+        )
+    
+    def _brightness(self) -> tuple[float, ...]:
+        if not self._bits:
+            return ()
+        
+        if self._bits > MAX_TABLE_BITS:
+            return tuple(c.brightness() for c in self)
+
+        r_table, g_table, b_table = _brightness_tables(self._bits)
+        return tuple(r_table[r] + g_table[g] + b_table[b] for r, g, b in self._channels())
+
+    def _luminance(self) -> tuple[float, ...]:
+        if not self._bits:
+            return ()
+        
+        if self._bits > MAX_TABLE_BITS:
+            return tuple(luminance(v, self._bits) for v in self._live())
+
+        r_table, g_table, b_table = luminance_tables(self._bits)
+        return tuple(r_table[r] + g_table[g] + b_table[b] for r, g, b in self._channels())
+    
+    def _hues(self) -> tuple[int, ...]:
+        if not self._bits:
+            return ()
+
+        max_one = (1 << self._bits) - 1
+        return tuple(
+            round(_hsl(r / max_one, g / max_one, b / max_one)[0]) % 360 
+            for r, g, b in self._channels()
+        )
+    
+    def _contrast_matrix(self) -> tuple[tuple[float, ...], ...]:
+        shifted = [i + 0.05 for i in self.luminance()]
+        return tuple(
+            tuple(a / b if a > b else b / a for b in shifted) 
+            for a in shifted
+        )
+
+    def _check_bits(self, other: Palette) -> None:
+        if self._bits and other._bits and self._bits != other._bits:
+            raise ValueError("Palettes must have same bit count")
+
+    @classmethod
+    def _from_values(cls, values, bits: int | None, *, unique: bool = False) -> Palette:
+        obj = cls.__new__(cls)
+        obj._unique = unique
+        obj._reset(bits)
+
+        for value in values:
+            obj._append(value)
+
+        return obj
+
+    @classmethod
+    def _from_packed(cls, values, bits: int) -> Palette:
+        # uses the values as they are, the index is built on first lookup
+        obj = cls.__new__(cls)
+        obj._unique = False
+        obj._reset(bits if len(values) else None)
+
+        if len(values):
+            obj._values = values
+            obj._alive = bytearray(b'\x01') * len(values)
+            obj._index = None
+
+        return obj
+
+    def _buffer(self) -> memoryview:
+        self._compact()
+        values = self._values
+
+        if isinstance(values, list):
+            if values:
+                raise TypeError(f"Values of {self._bits} bits per channel do not fit into 64 bits")
+            typecode = packed_typecode(8)
+            assert typecode is not None
+            values = array(typecode)
+
+        return memoryview(values).toreadonly()
+
+    # `memoryview()` calls this on Python 3.12+ only, before that
+    # the values are shared through `__array_interface__`
+    def __buffer__(self, flags: int) -> memoryview:
+        return self._buffer()
+
+    @property
+    def __array_interface__(self) -> dict:
+        """Read-only view of packed values for `numpy.asarray`."""
+        view = self._buffer()
+        order = '<' if sys.byteorder == 'little' else '>'
+        return {
+            'version': 3,
+            'shape': (len(view),),
+            'typestr': f'{order}u{view.itemsize}',
+            'data': view
+        }
 
     @property
     def bits(self) -> int | None:
@@ -60,11 +350,16 @@ class Palette:
         if isinstance(value, int):
             if value % 4 != 0 or value < 4:
                 raise ValueError("Number of bits must be dividable by 4")
-        elif not isinstance(value, None):
+        elif value is not None:
             raise ValueError("Invalid value")
         
         self._bits = value
 
+    @property
+    def unique(self) -> bool:
+        """Whether the palette skips duplicate colors."""
+        return self._unique
+
     def add_color(self, color: RGBA, /) -> None:
         """
         Add a color to the palette.
@@ -82,14 +377,15 @@ class Palette:
         if not isinstance(color, RGBA) or (self.bits and color.bits != self.bits):
             raise ValueError("Color must be RGBA and have same bit count as the palette")
         
-        self._items.append(color)
-
         if not self.bits:
-            self.bits = color.bits
+            self._reset(color.bits)
+
+        self._append(color._data)
+        self._cache.clear()
 
     def remove_color(self, color: RGBA) -> None:
         """
-        Remove the color from the palette.
+        Remove the first occurrence of the color from the palette.
 
         Parameters
         ----------
@@ -101,10 +397,383 @@ class Palette:
         `ValueError` 
             If the color is not present.
         """
-        self._items.remove(color)
+        if color not in self:
+            raise ValueError("Color is not present in the palette")
+        
+        self._cache.clear()
+
+        index = self._lookup()
+        positions = index[color._data]
+        self._alive[positions.pop(0)] = 0
+        self._holes += 1
+
+        if not positions:
+            del index[color._data]
+
+        if len(self) == 0:
+            self._reset()
+        elif self._holes * 2 > len(self._values):
+            self._compact()
+
+    def count(self, color: RGBA) -> int:
+        """
+        Get the number of occurrences of the color.
+
+        Parameters
+        ----------
+        color: `RGBA`
+            Color to count.
+        """
+        if color not in self:
+            return 0
+        
+        return len(self._lookup()[color._data])
+    
+    def brightness(self) -> tuple[float, ...]:
+        """
+        Get a perceived brightness of each color in range `0-1`.
+        
+        Values are computed in bulk and cached until the palette changes.
+        """
+        return self._cached('brightness', self._brightness)
+    
+    def luminance(self) -> tuple[float, ...]:
+        """
+        Get WCAG relative luminance of each color in range `0-1`.
+        
+        Values are computed in bulk and cached until the palette changes.
+        """
+        return self._cached('luminance', self._luminance)
+    
+    def hues(self) -> tuple[int, ...]:
+        """
+        Get a hue of each color in range `0-359`.
+        
+        Values are computed in bulk and cached until the palette changes.
+        """
+        return self._cached('hues', self._hues)
+    
+    def contrast_matrix(self) -> tuple[tuple[float, ...], ...]:
+        """
+        Get WCAG contrast ratios of all pairs of colors.
+
+        Item `[i][j]` is the ratio between `i`-th and `j`-th colors.
+        The matrix is cached until the palette changes.
+        """
+        return self._cached('contrast', self._contrast_matrix)
+
+    def sorted(self, by: str = 'brightness', *, reverse: bool = False) -> Palette:
+        """
+        Get a palette with colors sorted by the property.
+
+        Parameters
+        ----------
+        by: `str`
+            One of `brightness`, `luminance` and `hue`.
+        reverse: `bool`
+            Whether to sort in descending order.
+
+        Raises
+        ------
+        `ValueError`
+            If the property is unknown.
+        """
+        keys = {
+            'brightness': self.brightness,
+            'luminance': self.luminance,
+            'hue': self.hues,
+        }
+        if by not in keys:
+            raise ValueError(f"Cannot sort by {by}")
+
+        self._compact()
+        key = keys[by]()
+        order = self._cached(
+            f'order:{by}', 
+            lambda: sorted(range(len(key)), key=key.__getitem__)
+        )
+        
+        values = self._values
+        return self._from_values(
+            (values[i] for i in (reversed(order) if reverse else order)), 
+            self._bits, 
+            unique=self._unique
+        )
+    
+    def split(self, threshold: float = 0.5) -> tuple[Palette, Palette]:
+        """
+        Split the palette into light and dark colors based on HSP color model.
+
+        Parameters
+        ----------
+        threshold: `float`
+            Brightness threshold.
+
+        Returns
+        -------
+        `tuple[Palette, Palette]`
+            Light and dark colors.
+        """
+        light: list[int] = []
+        dark: list[int] = []
+
+        for value, brightness in zip(self._live(), self.brightness()):
+            (light if brightness > threshold else dark).append(value)
+
+        return (
+            self._from_values(light, self._bits if light else None, unique=self._unique),
+            self._from_values(dark, self._bits if dark else None, unique=self._unique)
+        )
+
+    def copy(self) -> Palette:
+        """Get a copy of the palette."""
+        return self._from_values(self._live(), self._bits, unique=self._unique)
+
+    def union(self, other: Palette) -> Palette:
+        """
+        Get a palette with colors of this palette 
+        followed by colors of another one that are not present in this palette.
+
+        Parameters
+        ----------
+        other: `Palette`
+            Another palette.
+
+        Raises
+        ------
+        `ValueError`
+            If bit counts of the palettes do not match.
+        """
+        self._check_bits(other)
+        
+        result = self._from_values(
+            self._live(), 
+            self._bits or other._bits, 
+            unique=self._unique
+        )
+        
+        index = self._lookup()
+        for value in other._live():
+            if value not in index:
+                result._append(value)
+
+        return result
+    
+    def intersection(self, other: Palette) -> Palette:
+        """
+        Get a palette with colors of this palette that are present in another one.
+
+        Parameters
+        ----------
+        other: `Palette`
+            Another palette.
+
+        Raises
+        ------
+        `ValueError`
+            If bit counts of the palettes do not match.
+        """
+        self._check_bits(other)
+
+        index = other._lookup()
+        return self._from_values(
+            (v for v in self._live() if v in index), 
+            self._bits, 
+            unique=self._unique
+        )
+    
+    def difference(self, other: Palette) -> Palette:
+        """
+        Get a palette with colors of this palette that are not present in another one.
+
+        Parameters
+        ----------
+        other: `Palette`
+            Another palette.
+
+        Raises
+        ------
+        `ValueError`
+            If bit counts of the palettes do not match.
+        """
+        self._check_bits(other)
+
+        index = other._lookup()
+        return self._from_values(
+            (v for v in self._live() if v not in index), 
+            self._bits, 
+            unique=self._unique
+        )
+
+    def save(self, path, format: str | None = None) -> None:
+        """
+        Save the palette to a file.
+
+        Parameters
+        ----------
+        path: `str` | `os.PathLike`
+            File path.
+        format: `str` | `None`
+            One of `binary`, `gpl`, `aco` and `json`.
+            Guessed from the file extension if not specified.
+            Binary is a compact format that loads without building colors.
+
+        Raises
+        ------
+        `ValueError`
+            If the format is unknown.
+        """
+        from . import swatch
+
+        swatch.save(self, path, format)
+
+    @classmethod
+    def load(cls, path, format: str | None = None) -> Palette:
+        """
+        Load a palette from a file.
+
+        Binary palettes are memory-mapped and 
+        copied only when the palette is modified.
+
+        Parameters
+        ----------
+        path: `str` | `os.PathLike`
+            File path.
+        format: `str` | `None`
+            One of `binary`, `gpl`, `aco` and `json`.
+            Guessed from the file extension if not specified.
+
+        Raises
+        ------
+        `ValueError`
+            If the format is unknown or the file is invalid.
+        """
+        from . import swatch
 
-        if len(self._items) == 0:
-            self.bits = None
+        return swatch.load(path, format)
+
+    def to_bytes(self) -> bytes:
+        """
+        Get raw bytes of the colors in channel order.
+
+        For 8 bits per channel the layout is RGBA8888, 
+        as used by image buffers.
+        """
+        from . import interop
+
+        self._compact()
+        return interop.to_bytes(self._values, self._bits or 8)
+
+    @classmethod
+    def from_bytes(cls, data: bytes | bytearray | memoryview, bits: int = 8) -> Palette:
+        """
+        Create a palette from raw bytes in channel order.
+
+        Parameters
+        ----------
+        data: `bytes` | `bytearray` | `memoryview`
+            Raw bytes, such as RGBA8888 pixels for 8 bits per channel.
+        bits: `int`
+            Number of bits per channel.
+
+        Raises
+        ------
+        `ValueError`
+            If the length is not a multiple of the color size.
+        """
+        from . import interop
+
+        return cls._from_packed(interop.from_bytes(data, bits), bits)
+
+    def to_numpy(self, channels: bool = False):
+        """
+        Copy the colors to a NumPy array.
+
+        Use `numpy.asarray(palette)` for a read-only view without copying.
+
+        Parameters
+        ----------
+        channels: `bool`
+            Whether to return an `(n, 4)` array of r, g, b and a
+            instead of an `(n,)` array of packed values.
+
+        Raises
+        ------
+        `ImportError`
+            If NumPy is not installed.
+        """
+        from . import interop
+
+        self._compact()
+        return interop.to_numpy(self._values, self._bits or 8, channels)
+
+    @classmethod
+    def from_numpy(cls, data, bits: int = 8) -> Palette:
+        """
+        Create a palette from a NumPy array.
+
+        Parameters
+        ----------
+        data: `numpy.ndarray`
+            Array of packed values, or an array of r, g, b and a channels 
+            whose last axis has 4 items, such as an image.
+        bits: `int`
+            Number of bits per channel.
+
+        Raises
+        ------
+        `ImportError`
+            If NumPy is not installed.
+        `ValueError`
+            If the array is invalid.
+        """
+        from . import interop
+
+        return cls._from_packed(interop.from_numpy(data, bits), bits)
+
+    def to_arrow(self, channels: bool = True):
+        """
+        Get the colors as an Arrow array.
+
+        Parameters
+        ----------
+        channels: `bool`
+            Whether to return a `FixedSizeList<uint8, 4>` array of r, g, b and a 
+            instead of a `uint32` array of packed values.
+
+        Raises
+        ------
+        `ImportError`
+            If PyArrow is not installed.
+        """
+        from . import interop
+
+        self._compact()
+        return interop.to_arrow(self._values, self._bits or 8, channels)
+
+    @classmethod
+    def from_arrow(cls, data, bits: int = 8) -> Palette:
+        """
+        Create a palette from an Arrow array.
+
+        Parameters
+        ----------
+        data: `pyarrow.Array` | `pyarrow.ChunkedArray`
+            `FixedSizeList` array of r, g, b and a channels
+            or an unsigned integer array of packed values.
+        bits: `int`
+            Number of bits per channel.
+
+        Raises
+        ------
+        `ImportError`
+            If PyArrow is not installed.
+        `ValueError`
+            If the array is invalid.
+        """
+        from . import interop
+
+        return cls._from_packed(interop.from_arrow(data, bits), bits)
 
     @classmethod
     def web(cls) -> "Palette":
@@ -120,7 +789,7 @@ class Palette:
         return cls._web
     
     @classmethod
-    def random(cls, num: int) -> "Palette":
+    def random(cls, num: int, seed: int | Random | None = None) -> "Palette":
         """
         Generate a palette with random colors.
 
@@ -128,8 +797,12 @@ class Palette:
         ----------
         num: `int`
             Number of colors.
+        seed: `int` | `random.Random` | `None`
+            Seed or generator to use instead of the shared one.
         """
-        return cls(*(RGBA.random() for _ in range(num)))
+        from .generate import packed
+
+        return cls._from_values(packed(num, 8, seed), 8 if num else None)
     
     @classmethod
     def gradient(cls, num: int, *, start: RGBA, end: RGBA) -> "Palette":
@@ -164,4 +837,113 @@ class Palette:
         ]
 
         return Palette(*gradient)
-    
\ No newline at end of file
+
+    @classmethod
+    def distinct(
+        cls,
+        num: int,
+        candidates: Palette | Iterable[RGBA] | None = None,
+        *,
+        metric: str | Callable[[RGBA], Sequence[float]] = 'lab',
+        seeds: Iterable[RGBA] = (),
+        background: RGBA | None = None,
+        min_background_distance: float = 0.0
+    ) -> "Palette":
+        """
+        Select maximally distinguishable colors from candidates.
+
+        Uses greedy farthest-point sampling: each step picks the candidate 
+        furthest from all colors picked so far. The distance of every candidate 
+        to its closest picked color is kept in an array and updated once per pick, 
+        so selecting `num` of `N` candidates takes `O(num * N)` distance computations.
+
+        Parameters
+        ----------
+        num: `int`
+            Number of colors, including seeds.
+        candidates: `Palette` | `Iterable[RGBA]` | `None`
+            Colors to select from. Defaults to web-safe colors.
+        metric: `str` | `Callable[[RGBA], Sequence[float]]`
+            Space of the Euclidean distance: `rgb`, `rgba`, `linear` for 
+            linear-light RGB, `lab` for CIELAB, or a function that maps 
+            a color to coordinates. Channels are scaled to `0-1`.
+        seeds: `Iterable[RGBA]`
+            Colors that are always included and come first.
+        background: `RGBA` | `None`
+            Background color. Picked colors are also kept away from it.
+        min_background_distance: `float`
+            Minimum distance to the background in units of the metric.
+            Closer candidates are never picked.
+
+        Returns
+        -------
+        `Palette`
+            Seeds followed by picked colors. It is shorter than `num` 
+            if there are not enough distinct candidates.
+
+        Raises
+        ------
+        `ValueError`
+            If there are more seeds than colors, the bit counts of the colors 
+            do not match, or the metric is unknown.
+        """
+        if candidates is None:
+            candidates = cls.web()
+
+        bit_counts: set[int]
+        if isinstance(candidates, Palette):
+            values = list(candidates._live())
+            bit_counts = {candidates._bits} if values and candidates._bits else set()
+        else:
+            colors = list(candidates)
+            values = [c._data for c in colors]
+            bit_counts = {c.bits for c in colors}
+
+        locked = list(seeds)
+        if len(locked) > num:
+            raise ValueError("Number of seeds must not exceed the number of colors")
+
+        extra = locked + [background] if background is not None else locked
+        bit_counts.update(c.bits for c in extra)
+        if len(bit_counts) > 1:
+            raise ValueError("Colors must have same bit count")
+
+        bits = bit_counts.pop() if bit_counts else 8
+        chosen = [c._data for c in locked]
+        points = _points(values, bits, metric)
+        nearest = array('d', repeat(math.inf, len(points)))
+
+        def pick(point: Sequence[float]) -> None:
+            nonlocal nearest
+            nearest = array('d', map(min, nearest, map(math.dist, points, repeat(point))))
+
+        if background is not None:
+            bg_point = _points([background._data], bits, metric)[0]
+            pick(bg_point)
+
+            if min_background_distance > 0:
+                # only the background excludes candidates, not the seeds
+                for i, d in enumerate(map(math.dist, points, repeat(bg_point))):
+                    # excluded candidates are never the furthest
+                    if d < min_background_distance:
+                        nearest[i] = -1.0
+
+        for color in locked:
+            pick(_points([color._data], bits, metric)[0])
+
+        if points and not extra and num > 0:
+            # start with the candidate furthest from the center
+            center = [math.fsum(c) / len(points) for c in zip(*points)]
+            first = max(range(len(points)), key=lambda i: math.dist(points[i], center))
+            pick(points[first])
+            chosen.append(values[first])
+
+        while points and len(chosen) < num:
+            best = max(range(len(points)), key=nearest.__getitem__)
+            if nearest[best] <= 0:
+                break
+
+            pick(points[best])
+            chosen.append(values[best])
+
+        return cls._from_values(chosen, bits if chosen else None)
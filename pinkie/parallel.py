@@ -0,0 +1,161 @@
+import os
+import sys
+import threading
+from array import array
+from collections.abc import Callable, MutableSequence, Sequence
+
+from .utils import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from concurrent.futures import ThreadPoolExecutor
+
+
+# smallest number of values that is worth splitting between threads
+MIN_CHUNK_SIZE = 4096
+
+
+def _default_num_threads() -> int:
+    # pure Python kernels only run in parallel on free-threaded builds
+    is_gil_enabled = getattr(sys, '_is_gil_enabled', None)
+    if is_gil_enabled is None or is_gil_enabled():
+        return 1
+
+    return os.cpu_count() or 1
+
+
+_num_threads: int = _default_num_threads()
+_executor: "ThreadPoolExecutor | None" = None
+_lock = threading.Lock()
+
+
+def get_num_threads() -> int:
+    """Get the number of threads used by batch operations."""
+    return _num_threads
+
+
+def set_num_threads(num: int | None) -> None:
+    """
+    Set the number of threads used by batch operations.
+
+    By default, batch operations use all cores on free-threaded
+    Python builds and a single thread otherwise, because
+    pure Python kernels hold the GIL.
+
+    Parameters
+    ----------
+    num: `int` | `None`
+        Number of threads. If `None`, the default is restored.
+
+    Raises
+    ------
+    `ValueError`
+        If the number is not positive.
+    """
+    global _num_threads, _executor
+
+    if num is not None and num < 1:
+        raise ValueError("Number of threads must be positive")
+
+    with _lock:
+        _num_threads = num or _default_num_threads()
+
+        if _executor is not None:
+            _executor.shutdown(wait=False)
+            _executor = None
+
+
+def _get_executor() -> "ThreadPoolExecutor":
+    global _executor
+
+    with _lock:
+        if _executor is None:
+            # imported on first use, it pulls in logging and slows down startup
+            from concurrent.futures import ThreadPoolExecutor
+
+            _executor = ThreadPoolExecutor(
+                _num_threads,
+                thread_name_prefix='pinkie'
+            )
+
+        return _executor
+
+
+def chunk_size(length: int, threads: int | None = None) -> int:
+    """
+    Get a chunk size to split values between threads.
+
+    Each thread gets a few chunks to balance the load,
+    but no chunk is smaller than `MIN_CHUNK_SIZE`.
+
+    Parameters
+    ----------
+    length: `int`
+        Number of values.
+    threads: `int` | `None`
+        Number of threads. Defaults to `get_num_threads()`.
+    """
+    threads = threads or _num_threads
+    return max(MIN_CHUNK_SIZE, -(-length // (threads * 4)))
+
+
+def _store(out: MutableSequence, start: int, part: list) -> None:
+    if isinstance(out, array):
+        out[start:start + len(part)] = array(out.typecode, part)
+    else:
+        out[start:start + len(part)] = part
+
+
+def map_chunks(
+    func: Callable[..., list], 
+    *sequences: Sequence, 
+    out: MutableSequence | None = None
+) -> MutableSequence:
+    """
+    Apply the function to chunks of the sequences
+    in the shared thread pool and concatenate the results.
+
+    Small inputs are processed in the calling thread.
+
+    Parameters
+    ----------
+    func: `Callable[..., list]`
+        Function that takes a chunk of each sequence and returns a list.
+    *sequences: `Sequence`
+        Sequences of the same length.
+    out: `MutableSequence` | `None`
+        List or array of the same length to write the results to 
+        instead of creating a new list. May be one of the sequences.
+
+    Raises
+    ------
+    `ValueError`
+        If the output has a different length.
+    """
+    length = len(sequences[0])
+    threads = _num_threads
+
+    if out is not None and len(out) != length:
+        raise ValueError("Output must have the same length as the input")
+
+    if threads == 1 or length < MIN_CHUNK_SIZE * 2:
+        if out is None:
+            return func(*sequences)
+
+        _store(out, 0, func(*sequences))
+        return out
+
+    size = chunk_size(length, threads)
+    starts = range(0, length, size)
+    chunks = [[seq[start:start + size] for seq in sequences] for start in starts]
+    parts = _get_executor().map(lambda chunk: func(*chunk), chunks)
+
+    if out is not None:
+        for start, part in zip(starts, parts):
+            _store(out, start, part)
+        return out
+
+    result = []
+    for part in parts:
+        result.extend(part)
+
+    return result
@@ -0,0 +1,137 @@
+import contextlib
+from collections.abc import Callable, Iterator
+
+from .hsla import HSLA
+from .rgba import RGBA
+from .utils import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from typing import Any, Generic, TypeVar, overload
+
+    T = TypeVar('T')
+else:
+    # pools are generic for type checkers only, typing is slow to import
+    class Generic:
+        __slots__ = ()
+
+        def __class_getitem__(cls, params):
+            return cls
+
+    def overload(func):
+        return func
+
+
+class ColorPool(Generic["T"]):
+    """
+    Pool of reusable temporary colors.
+
+    Combined with `out=` parameters and in-place methods,
+    it lets steady-state loops run without creating colors.
+    Acquired colors keep their previous values.
+    """
+
+    __slots__ = ('_factory', '_free', '_max_size')
+
+    @overload
+    def __init__(self: "ColorPool[RGBA]", *, max_size: int = 1024) -> None: ...
+
+    @overload
+    def __init__(self, factory: "Callable[[], T]", max_size: int = 1024) -> None: ...
+
+    def __init__(
+        self,
+        factory: "Callable[[], Any]" = lambda: RGBA(0),
+        max_size: int = 1024
+    ) -> None:
+        """
+        Parameters
+        ----------
+        factory: `Callable[[], T]`
+            Function that creates a new color. Creates black `RGBA` by default.
+        max_size: `int`
+            Maximum number of free colors kept by the pool.
+
+        Raises
+        ------
+        `ValueError`
+            If the maximum size is negative.
+        """
+        if max_size < 0:
+            raise ValueError("Pool size must not be negative")
+
+        self._factory: Callable[[], T] = factory
+        self._free: list[T] = []
+        self._max_size = max_size
+
+    def __len__(self) -> int:
+        return len(self._free)
+
+    @classmethod
+    def rgba(cls, bits: int = 8, max_size: int = 1024) -> "ColorPool[RGBA]":
+        """
+        Create a pool of `RGBA` colors.
+
+        Parameters
+        ----------
+        bits: `int`
+            Number of bits per channel of new colors.
+        max_size: `int`
+            Maximum number of free colors kept by the pool.
+        """
+        return ColorPool(lambda: RGBA(0, bits), max_size)
+
+    @classmethod
+    def hsla(cls, max_size: int = 1024) -> "ColorPool[HSLA]":
+        """
+        Create a pool of `HSLA` colors.
+
+        Parameters
+        ----------
+        max_size: `int`
+            Maximum number of free colors kept by the pool.
+        """
+        return ColorPool(lambda: HSLA((0, 0, 0)), max_size)
+
+    def acquire(self) -> "T":
+        """Take a free color or create a new one."""
+        if self._free:
+            return self._free.pop()
+        return self._factory()
+
+    def release(self, *colors: "T") -> None:
+        """
+        Return colors to the pool.
+
+        Colors must not be used after they are released.
+
+        Parameters
+        ----------
+        *colors: `T`
+            Colors taken by `acquire`.
+        """
+        free = self._free
+        for color in colors:
+            if len(free) >= self._max_size:
+                break
+            free.append(color)
+
+    def reserve(self, num: int) -> None:
+        """
+        Create free colors in advance.
+
+        Parameters
+        ----------
+        num: `int`
+            Number of free colors to have.
+        """
+        while len(self._free) < min(num, self._max_size):
+            self._free.append(self._factory())
+
+    @contextlib.contextmanager
+    def borrow(self) -> "Iterator[T]":
+        """Context manager that acquires a color and releases it on exit."""
+        color = self.acquire()
+        try:
+            yield color
+        finally:
+            self.release(color)
@@ -0,0 +1,322 @@
+import contextlib
+import functools
+import importlib
+import json
+import os
+import sys
+import time
+
+
+# module, class and methods to instrument
+TARGETS = [
+    ('rgba', 'RGBA', (
+        '__init__', 'to_hsla', 'to_cmyk', 'to_rgbaf', 'to_bytes', 'from_bytes',
+        'convert', 'normalize', 'closest', 'furthest', 'blend'
+    )),
+    ('hsla', 'HSLA', ('to_rgba',)),
+    ('cmyk', 'CMYK', ('to_rgba',)),
+    ('rgbaf', 'RGBAF', ('from_rgba', 'to_rgba', 'tone_map', 'blend')),
+    ('rgbaf', 'RGBAFArray', ('from_packed', 'to_packed', 'tone_map', 'blend')),
+    ('blend', 'BlendMode', ('compose', 'compose_many', 'compose_packed')),
+    ('palette', 'Palette', ('add_color', 'remove_color', 'to_bytes', 'from_bytes')),
+]
+
+# memoized functions that report hits and misses
+CACHES = [
+    ('gamma', 'decode_table'),
+    ('gamma', 'encode_table'),
+    ('gamma', 'luminance_tables'),
+    ('palette', '_brightness_tables'),
+    ('hsl', 'hsl_row'),
+]
+
+_calls: dict[str, list[int]] = {}
+# hits and misses of memoized methods
+_memos: dict[str, list[int]] = {}
+_cache_base: dict[str, tuple[int, int]] = {}
+_patched: list[tuple[type, str, object]] = []
+_skipped: list[str] = []
+
+
+def _wrap(name: str, func):
+    if isinstance(func, classmethod):
+        return classmethod(_wrap(name, func.__func__))
+
+    record = _calls.setdefault(name, [0, 0])
+    perf_counter_ns = time.perf_counter_ns
+
+    @functools.wraps(func)
+    def wrapper(*args, **kwargs):
+        start = perf_counter_ns()
+        try:
+            return func(*args, **kwargs)
+        finally:
+            record[0] += 1
+            record[1] += perf_counter_ns() - start
+
+    return wrapper
+
+
+def _wrap_cached(record: list[int], func):
+    # `_cached(key, compute)` of palettes and color stats
+    @functools.wraps(func)
+    def wrapper(self, key, compute):
+        record[0 if key in self._cache else 1] += 1
+        return func(self, key, compute)
+
+    return wrapper
+
+
+def _wrap_lut(record: list[int], func):
+    from .blend import _luts
+
+    @functools.wraps(func)
+    def wrapper(self):
+        record[0 if (type(self), self.linear) in _luts else 1] += 1
+        return func(self)
+
+    return wrapper
+
+
+def _wrap_adjust(record: list[int], func):
+    # each unique color of a chunk is adjusted once
+    @functools.wraps(func)
+    def wrapper(self, values, fast):
+        unique = len({value >> 8 for value in values})
+        record[0] += len(values) - unique
+        record[1] += unique
+        return func(self, values, fast)
+
+    return wrapper
+
+
+def _wrap_tiles(record: list[int], func):
+    @functools.wraps(func)
+    def wrapper(self, *args, **kwargs):
+        result = func(self, *args, **kwargs)
+        record[0] += result.pairs - result.computed
+        record[1] += result.computed
+        return result
+
+    return wrapper
+
+
+# memoized methods and wrappers that count their hits and misses
+MEMOS = [
+    ('palette', 'Palette', '_cached', _wrap_cached),
+    ('histogram', 'ColorStats', '_cached', _wrap_cached),
+    ('blend', 'SeparableBlendMode', '_table', _wrap_lut),
+    ('adjust', 'Adjust', '_apply', _wrap_adjust),
+    ('tiles', 'TileCompositor', 'compose', _wrap_tiles),
+]
+
+
+def _is_compiled(module) -> bool:
+    # calls between compiled classes bypass wrappers set on them,
+    # so their stats would be silently incomplete
+    return not module.__file__.endswith('.py')
+
+
+def _patch(cls: type, attr: str, wrapper) -> None:
+    _patched.append((cls, attr, cls.__dict__[attr]))
+    setattr(cls, attr, wrapper)
+
+
+def is_enabled() -> bool:
+    """Check if the instrumentation is enabled."""
+    return bool(_patched or _skipped)
+
+
+def enable() -> None:
+    """
+    Start counting and timing calls of conversions, blends and palette mutations.
+
+    Methods are wrapped only while the instrumentation is enabled,
+    so it has no overhead otherwise. Methods of compiled modules
+    are not wrapped, because compiled code calls them directly,
+    and are listed in `stats()` as skipped.
+    """
+    if _patched or _skipped:
+        return
+
+    for module_name, class_name, attrs in TARGETS:
+        module = importlib.import_module(f'.{module_name}', __package__)
+        base = getattr(module, class_name)
+        classes = dict.fromkeys(
+            cls for cls in vars(module).values()
+            if isinstance(cls, type) and issubclass(cls, base)
+        )
+
+        for cls in classes:
+            for attr in attrs:
+                if attr in cls.__dict__:
+                    name = f"{cls.__name__}.{attr}"
+                    if _is_compiled(module):
+                        _skipped.append(name)
+                    else:
+                        _patch(cls, attr, _wrap(name, cls.__dict__[attr]))
+
+    for module_name, class_name, attr, wrap in MEMOS:
+        module = importlib.import_module(f'.{module_name}', __package__)
+        cls = getattr(module, class_name)
+        if _is_compiled(module):
+            _skipped.append(f"{class_name}.{attr}")
+            continue
+
+        record = _memos.setdefault(f"{class_name}.{attr}", [0, 0])
+        _patch(cls, attr, wrap(record, cls.__dict__[attr]))
+
+
+def disable() -> None:
+    """Stop the instrumentation. Collected stats are kept."""
+    while _patched:
+        cls, attr, original = _patched.pop()
+        setattr(cls, attr, original)
+
+    _skipped.clear()
+
+
+def _cache_info() -> dict[str, tuple[int, int, int]]:
+    result = {}
+    for module_name, func_name in CACHES:
+        module = sys.modules.get(f'{__package__}.{module_name}')
+        if module is None:
+            continue
+
+        info = getattr(module, func_name).cache_info()
+        name = f"{module_name}.{func_name}"
+        hits, misses = _cache_base.get(name, (0, 0))
+        result[name] = (info.hits - hits, info.misses - misses, info.currsize)
+
+    return result
+
+
+def reset() -> None:
+    """Reset collected stats."""
+    for record in _calls.values():
+        record[0] = record[1] = 0
+
+    for record in _memos.values():
+        record[0] = record[1] = 0
+    _cache_base.clear()
+
+    for name, (hits, misses, _) in _cache_info().items():
+        _cache_base[name] = (hits, misses)
+
+
+def stats() -> dict:
+    """
+    Get a snapshot of collected stats.
+
+    Call times are inclusive, so time of nested calls
+    is counted by both the caller and the callee.
+
+    Returns
+    -------
+    `dict`
+        `calls` maps method names to call counts and total seconds,
+        `caches` maps memoized functions and methods to hits,
+        misses and sizes,
+        `skipped` lists methods that could not be instrumented.
+    """
+    caches: dict[str, dict[str, int | None]] = {
+        name: {'hits': hits, 'misses': misses, 'size': size}
+        for name, (hits, misses, size) in _cache_info().items()
+    }
+    for name, (hits, misses) in _memos.items():
+        # memos of objects have no single size
+        caches[name] = {'hits': hits, 'misses': misses, 'size': None}
+
+    return {
+        'enabled': is_enabled(),
+        'calls': {
+            name: {'count': count, 'seconds': elapsed / 1e9}
+            for name, (count, elapsed) in _calls.items()
+            if count
+        },
+        'caches': caches,
+        'skipped': list(_skipped),
+    }
+
+
+@contextlib.contextmanager
+def profile(*, reset_stats: bool = True):
+    """
+    Context manager that enables the instrumentation inside its block.
+
+    Parameters
+    ----------
+    reset_stats: `bool`
+        Whether to reset collected stats on enter.
+    """
+    was_enabled = is_enabled()
+    enable()
+
+    if reset_stats:
+        reset()
+
+    try:
+        yield
+    finally:
+        if not was_enabled:
+            disable()
+
+
+def _prometheus(snapshot: dict) -> str:
+    lines = [
+        "# HELP pinkie_calls_total Number of calls.",
+        "# TYPE pinkie_calls_total counter",
+    ]
+    for name, call in snapshot['calls'].items():
+        lines.append(f'pinkie_calls_total{{function="{name}"}} {call["count"]}')
+
+    lines += [
+        "# HELP pinkie_call_seconds_total Total time of calls.",
+        "# TYPE pinkie_call_seconds_total counter",
+    ]
+    for name, call in snapshot['calls'].items():
+        lines.append(f'pinkie_call_seconds_total{{function="{name}"}} {call["seconds"]}')
+
+    for kind in ('hits', 'misses'):
+        lines += [
+            f"# HELP pinkie_cache_{kind}_total Number of cache {kind}.",
+            f"# TYPE pinkie_cache_{kind}_total counter",
+        ]
+        for name, cache in snapshot['caches'].items():
+            lines.append(f'pinkie_cache_{kind}_total{{cache="{name}"}} {cache[kind]}')
+
+    return "\n".join(lines) + "\n"
+
+
+def export(path: str | os.PathLike, format: str = 'json') -> None:
+    """
+    Write a snapshot of collected stats to a file.
+
+    The file is replaced atomically, so it can be scraped at any time.
+
+    Parameters
+    ----------
+    path: `str` | `os.PathLike`
+        File path.
+    format: `str`
+        `json` or `prometheus` text format.
+
+    Raises
+    ------
+    `ValueError`
+        If the format is unknown.
+    """
+    snapshot = stats()
+
+    if format == 'json':
+        data = json.dumps(snapshot, indent=2)
+    elif format == 'prometheus':
+        data = _prometheus(snapshot)
+    else:
+        raise ValueError(f"Unknown stats format: {format}")
+
+    temp = f"{os.fspath(path)}.tmp"
+    with open(temp, 'w') as f:
+        f.write(data)
+
+    os.replace(temp, path)
@@ -0,0 +1,287 @@
+from array import array
+from collections import Counter
+from collections.abc import Iterable, MutableSequence, Sequence
+
+from . import batch
+from .palette import Palette
+
+
+_NO_CHILDREN = array('l', [0] * 8)
+
+
+class OctreeQuantizer:
+    """
+    Octree color quantizer for streams of packed RGBA values.
+
+    Values are fed in chunks of any size. Once the tree has more than
+    `max_leaves` leaves, the deepest nodes with the fewest pixels are
+    merged, so memory stays bounded no matter how many values are fed.
+    Nodes are stored in flat arrays and freed slots are reused.
+    """
+
+    __slots__ = (
+        '_bits', '_max_colors', '_max_leaves', '_children', '_counts',
+        '_sums', '_leaf', '_reducible', '_free', '_leaves', '_pixels'
+    )
+
+    def __init__(
+        self,
+        max_colors: int = 256,
+        max_leaves: int | None = None,
+        bits: int = 8
+    ) -> None:
+        """
+        Parameters
+        ----------
+        max_colors: `int`
+            Default number of colors of `palette`.
+        max_leaves: `int` | `None`
+            Maximum number of leaves kept between chunks.
+            Defaults to 4 times `max_colors`.
+        bits: `int`
+            Number of bits per channel of fed values.
+
+        Raises
+        ------
+        `ValueError`
+            If the numbers of colors or leaves are not positive
+            or the bit count is invalid.
+        """
+        if max_colors < 1:
+            raise ValueError("Number of colors must be positive")
+
+        max_leaves = max_leaves or max_colors * 4
+        if max_leaves < max_colors:
+            raise ValueError("Number of leaves must be at least the number of colors")
+
+        if bits % 4 != 0 or bits < 8:
+            raise ValueError("Number of bits must be dividable by 4 and at least 8")
+
+        self._bits = bits
+        self._max_colors = max_colors
+        self._max_leaves = max_leaves
+        self._reset()
+
+    def _reset(self) -> None:
+        # child indices of each node, 0 means no child since the root is never a child
+        self._children = array('l', _NO_CHILDREN)
+        self._counts = array('Q', [0])
+        # sums of r, g, b and a of each node
+        self._sums = array('Q', [0] * 4)
+        self._leaf = bytearray(1)
+        # internal nodes of each level that can be merged
+        self._reducible: list[list[int]] = [[] for _ in range(8)]
+        self._free: list[int] = []
+        self._leaves = 0
+        self._pixels = 0
+
+    def __len__(self) -> int:
+        return self._leaves
+
+    @property
+    def pixels(self) -> int:
+        """Number of values fed so far."""
+        return self._pixels
+
+    def _new_node(self, level: int) -> int:
+        is_leaf = level == 8
+
+        if self._free:
+            node = self._free.pop()
+            self._children[node * 8:node * 8 + 8] = _NO_CHILDREN
+            self._counts[node] = 0
+            for c in range(4):
+                self._sums[node * 4 + c] = 0
+            self._leaf[node] = is_leaf
+        else:
+            node = len(self._counts)
+            self._children.extend(_NO_CHILDREN)
+            self._counts.append(0)
+            self._sums.extend((0, 0, 0, 0))
+            self._leaf.append(is_leaf)
+
+        if is_leaf:
+            self._leaves += 1
+        else:
+            self._reducible[level].append(node)
+
+        return node
+
+    def _insert(self, value: int, weight: int) -> None:
+        bits = self._bits
+        max_one = (1 << bits) - 1
+        r = value >> (bits * 3) & max_one
+        g = value >> (bits * 2) & max_one
+        b = value >> bits & max_one
+        a = value & max_one
+
+        children = self._children
+        leaf = self._leaf
+        node = 0
+        level = 0
+
+        while not leaf[node]:
+            shift = bits - 1 - level
+            index = (r >> shift & 1) << 2 | (g >> shift & 1) << 1 | (b >> shift & 1)
+            child = children[node * 8 + index]
+
+            if child == 0:
+                child = self._new_node(level + 1)
+                # the array may have been extended
+                children = self._children
+                children[node * 8 + index] = child
+
+            node = child
+            level += 1
+
+        self._counts[node] += weight
+        sums = self._sums
+        sums[node * 4] += r * weight
+        sums[node * 4 + 1] += g * weight
+        sums[node * 4 + 2] += b * weight
+        sums[node * 4 + 3] += a * weight
+
+    def _merge(self) -> bool:
+        for level in range(7, -1, -1):
+            nodes = self._reducible[level]
+            if nodes:
+                break
+        else:
+            return False
+
+        counts = self._counts
+        children = self._children
+        sums = self._sums
+
+        # merge the node of the deepest level with the fewest pixels
+        pos = min(range(len(nodes)), key=lambda i: self._subtree_count(nodes[i]))
+        node = nodes[pos]
+        nodes[pos] = nodes[-1]
+        nodes.pop()
+
+        for i in range(8):
+            child = children[node * 8 + i]
+            if child == 0:
+                continue
+
+            counts[node] += counts[child]
+            for c in range(4):
+                sums[node * 4 + c] += sums[child * 4 + c]
+
+            children[node * 8 + i] = 0
+            counts[child] = 0
+            self._leaves -= 1
+            self._free.append(child)
+
+        self._leaf[node] = 1
+        self._leaves += 1
+        return True
+
+    def _subtree_count(self, node: int) -> int:
+        # children of the deepest internal nodes are leaves
+        children = self._children
+        counts = self._counts
+        return sum(counts[children[node * 8 + i]] for i in range(8))
+
+    def _reduce(self, max_leaves: int) -> None:
+        # the root is never merged, so up to 8 leaves may remain
+        while self._leaves > max_leaves and self._merge():
+            pass
+
+    def feed(self, values: Iterable[int] | Counter) -> None:
+        """
+        Add a chunk of packed values.
+
+        Parameters
+        ----------
+        values: `Iterable[int]` | `Counter`
+            Packed values or their counts.
+        """
+        counts = values if isinstance(values, Counter) else Counter(values)
+
+        for value, weight in counts.items():
+            self._insert(value, weight)
+            self._pixels += weight
+
+            if self._leaves > self._max_leaves:
+                self._reduce(self._max_leaves)
+
+    def copy(self) -> "OctreeQuantizer":
+        """Get a copy of the quantizer."""
+        obj = OctreeQuantizer.__new__(OctreeQuantizer)
+        obj._bits = self._bits
+        obj._max_colors = self._max_colors
+        obj._max_leaves = self._max_leaves
+        obj._children = array('l', self._children)
+        obj._counts = array('Q', self._counts)
+        obj._sums = array('Q', self._sums)
+        obj._leaf = bytearray(self._leaf)
+        obj._reducible = [list(nodes) for nodes in self._reducible]
+        obj._free = list(self._free)
+        obj._leaves = self._leaves
+        obj._pixels = self._pixels
+        return obj
+
+    def palette(self, num: int | None = None) -> Palette:
+        """
+        Get a palette of average colors of the leaves.
+
+        The quantizer is not changed, so more values can be fed afterwards.
+
+        Parameters
+        ----------
+        num: `int` | `None`
+            Maximum number of colors. Defaults to `max_colors`.
+        """
+        num = num or self._max_colors
+        tree = self
+        if self._leaves > num:
+            tree = self.copy()
+            tree._reduce(num)
+
+        bits = self._bits
+        counts = tree._counts
+        sums = tree._sums
+        leaves: list[tuple[int, int]] = []
+
+        for node in range(len(counts)):
+            count = counts[node]
+            if not tree._leaf[node] or count == 0:
+                continue
+
+            value = 0
+            for c in range(4):
+                value = value << bits | (sums[node * 4 + c] + count // 2) // count
+            leaves.append((count, value))
+
+        leaves.sort(reverse=True)
+        del leaves[num:]
+        return Palette._from_values([value for _, value in leaves], bits if leaves else None)
+
+    def quantize(
+        self,
+        values: Sequence[int],
+        num: int | None = None,
+        out: MutableSequence[int] | None = None
+    ) -> MutableSequence[int]:
+        """
+        Replace packed values with the closest colors of `palette`.
+
+        Uses the same nearest-color search as `batch.quantize`.
+
+        Parameters
+        ----------
+        values: `Sequence[int]`
+            Packed values.
+        num: `int` | `None`
+            Maximum number of colors. Defaults to `max_colors`.
+        out: `MutableSequence[int]` | `None`
+            List or array to write the results to instead of creating
+            a new list. May be `values` to work in place.
+
+        Raises
+        ------
+        `ValueError`
+            If nothing was fed yet or the output has a different length.
+        """
+        return batch.quantize(values, self.palette(num), self._bits, out)
@@ -1,14 +1,44 @@
-import random
-from typing import Sequence
+from collections.abc import Sequence
 
-from .utils import distance
+from .gamma import luminance
+from .utils import TYPE_CHECKING, distance, mypyc_attr, rng
 
+if TYPE_CHECKING:
+    from random import Random
 
+    from .rgbaf import RGBAF
+
+
+def _hsl(r: float, g: float, b: float) -> tuple[float, float, float]:
+    cmax = max(r, g, b)
+    cmin = min(r, g, b)
+    delta = cmax - cmin
+
+    l = (cmax + cmin) / 2
+    s = delta / (1 - abs(2 * l - 1)) if delta != 0 else 0.0
+    h = 0.0
+    if delta != 0:
+        if cmax == r:
+            h = 60 * ((g - b) / delta % 6)
+        elif cmax == g:
+            h = 60 * ((b - r) / delta + 2)
+        elif cmax == b:
+            h = 60 * ((r - g) / delta + 4)
+
+    return h, s, l
+
+
+@mypyc_attr(allow_interpreted_subclasses=True)
 class RGBA:
     """RGBA (Red, Green, Blue, Alpha) color model."""
 
     __slots__ = ('_data', '_bits', '_max_one', '_max_all')
 
+    _data: int
+    _bits: int
+    _max_one: int
+    _max_all: int
+
     def __init__(self, color: int | str | Sequence[int], /, bits: int = 8) -> None:
         """
         Parameters
@@ -42,16 +72,16 @@ class RGBA:
             
             self._data = int(color, 16)
         elif isinstance(color, Sequence):
-            if len(color) not in {3, 4} or not all(isinstance(i, int) for i in color):
+            channels = [i for i in color if isinstance(i, int)]
+            if len(channels) != len(color) or len(channels) not in {3, 4}:
                 raise ValueError(f"Invalid color sequence: {color}")
             
-            if len(color) == 3:
-                color = (*color, self._max_one)
+            if len(channels) == 3:
+                channels.append(self._max_one)
 
-            
             self._data = sum(
                 min(max(c, 0), self._max_one) << (num * self.bits) 
-                for num, c in enumerate(reversed(color))
+                for num, c in enumerate(reversed(channels))
             )
         else:
             raise ValueError(f"Invalid color value: {color}")
@@ -84,6 +114,13 @@ class RGBA:
     def _channel_value(self, pos: int) -> int:
         return (self._data >> (pos * self.bits)) & self._max_one
 
+    def _assign(self, data: int, bits: int) -> "RGBA":
+        self.bits = bits
+        self._data = data
+        self._max_one = (1 << bits) - 1
+        self._max_all = (1 << (bits * 4)) - 1
+        return self
+
     def _set_channel_value(self, pos: int, value: int) -> None:
         val = min(max(value, 0), self._max_one)
         shift = pos * self.bits
@@ -112,7 +149,14 @@ class RGBA:
             raise TypeError(f"Value must be an int, not {type(value).__name__}")
         self._set_channel_value(3, value)
 
-    red = r
+    @property
+    def red(self) -> int:
+        """Alias of `r`."""
+        return self.r
+
+    @red.setter
+    def red(self, value: int):
+        self.r = value
 
     @property
     def g(self) -> int:
@@ -125,7 +169,14 @@ class RGBA:
             raise TypeError(f"Value must be an int, not {type(value).__name__}")
         self._set_channel_value(2, value)
 
-    green = g
+    @property
+    def green(self) -> int:
+        """Alias of `g`."""
+        return self.g
+
+    @green.setter
+    def green(self, value: int):
+        self.g = value
 
     @property
     def b(self) -> int:
@@ -138,7 +189,14 @@ class RGBA:
             raise TypeError(f"Value must be an int, not {type(value).__name__}")
         self._set_channel_value(1, value)
 
-    blue = b
+    @property
+    def blue(self) -> int:
+        """Alias of `b`."""
+        return self.b
+
+    @blue.setter
+    def blue(self, value: int):
+        self.b = value
 
     @property
     def a(self) -> int:
@@ -151,7 +209,14 @@ class RGBA:
             raise TypeError(f"Value must be an int, not {type(value).__name__}")
         self._set_channel_value(0, value)
 
-    alpha = a
+    @property
+    def alpha(self) -> int:
+        """Alias of `a`."""
+        return self.a
+
+    @alpha.setter
+    def alpha(self, value: int):
+        self.a = value
 
     @property
     def rgb(self) -> tuple[int, int, int]:
@@ -183,56 +248,101 @@ class RGBA:
         """Integer value of RGB. Does not contain alpha."""
         return self._data >> self.bits
 
+    def to_bytes(self) -> bytes:
+        """Raw bytes of the channels in RGBA order, like RGBA8888 for 8-bit colors."""
+        return self._data.to_bytes(self._bits // 2, 'big')
+
+    @classmethod
+    def from_bytes(cls, data: "bytes | bytearray | memoryview", bits: int = 8) -> "RGBA":
+        """
+        Create a color from raw bytes of the channels in RGBA order.
+
+        Parameters
+        ----------
+        data: `bytes` | `bytearray` | `memoryview`
+            Bytes of one color, like a pixel of an RGBA8888 image.
+        bits: `int`
+            Number of bits per channel.
+
+        Raises
+        ------
+        `ValueError`
+            If the data length does not match the bit count.
+        """
+        size = bits // 2
+        if len(data) != size:
+            raise ValueError(f"Expected {size} bytes, got {len(data)}")
+
+        return cls(int.from_bytes(data, 'big'), bits=bits)
+
     def copy(self) -> "RGBA":
         """Get a copy of the color."""
-        obj = RGBA.__new__(RGBA)
-        obj._data = self._data
-        obj._bits = self._bits
-        return obj
+        return RGBA.__new__(RGBA)._assign(self._data, self._bits)
     
-    def to_hsla(self):
-        """Convert to `HSLA` color model."""
-        from .hsla import HSLA
-
-        r, g, b = (c / self._max_one for c in self.rgb)
-        cmax = max(r, g, b)
-        cmin = min(r, g, b)
-        delta = cmax - cmin
-
-        l = (cmax + cmin) / 2
-        s = delta / (1 - abs(2 * l - 1)) if delta != 0 else 0
-        h = 0
-        if delta != 0:
-            if cmax == r:
-                h = 60 * ((g - b) / delta % 6)
-            elif cmax == g:
-                h = 60 * ((b - r) / delta + 2)
-            elif cmax == b:
-                h = 60 * ((r - g) / delta + 4)
-
-        return HSLA((
-            round(h), 
-            round(s * 100), 
-            round(l * 100), 
-            round(self.a / self._max_one * 100)
-        ))
+    def _to_hsl(self, fast: bool) -> tuple[int, int, int]:
+        if fast:
+            r, g, b = self.rgb
+            return rgb_to_hsl(r, g, b, self._max_one)
+
+        h, s, l = _hsl(*(c / self._max_one for c in self.rgb))
+        return round(h) % 360, round(s * 100), round(l * 100)
+
+    def to_hsla(self, fast: bool = False, out: "HSLA | None" = None) -> "HSLA":
+        """
+        Convert to `HSLA` color model.
+
+        Parameters
+        ----------
+        fast: `bool`
+            Whether to use integer math only. Components may 
+            differ from the exact result by 1 unit.
+        out: `HSLA` | `None`
+            Color to write the result to instead of creating a new one.
+        """
+        h, s, l = self._to_hsl(fast)
+        max_one = self._max_one
+
+        if fast:
+            a = (self.a * 200 + max_one) // (2 * max_one)
+        else:
+            a = round(self.a / max_one * 100)
+
+        if out is None:
+            out = HSLA.__new__(HSLA)
+
+        return out._assign(_pack_hsla(h, s, l, a))
     
-    def to_cmyk(self):
-        """Convert to `CMYK` color model."""
-        from .cmyk import CMYK
+    def to_rgbaf(self, linear: bool = False) -> "RGBAF":
+        """
+        Convert to floating-point `RGBAF` color model.
+
+        Parameters
+        ----------
+        linear: `bool`
+            Whether to decode sRGB channels to linear light.
+            Colors must have at most 16 bits per channel.
+        """
+        # the float model is loaded on first use
+        from .rgbaf import RGBAF
 
+        return RGBAF.from_rgba(self, linear)
+
+    def to_cmyk(self) -> "CMYK":
+        """Convert to `CMYK` color model."""
         rgb = self.rgb
         cmax = max(rgb)
         k = 1 - cmax / self._max_one
 
         if k == 1:
-            return CMYK((0, 0, 0, 100))
+            return CMYK.__new__(CMYK)._assign(_pack_cmyk(0, 0, 0, 100))
         
         c, m, y = ((1 - i / self._max_one - k) / (1 - k) for i in rgb)
 
-        return CMYK([round(i * 100) for i in [c, m, y, k]])
+        return CMYK.__new__(CMYK)._assign(
+            _pack_cmyk(round(c * 100), round(m * 100), round(y * 100), round(k * 100))
+        )
     
-    def convert(self, bits: int) -> "RGBA":
+    def convert(self, bits: int, out: "RGBA | None" = None) -> "RGBA":
         """
         Convert the color to another bit count.
 
@@ -240,16 +350,38 @@ class RGBA:
         ----------
         bits: `int`
             Number of bits per channel. Must be dividable by 4. 
+        out: `RGBA` | `None`
+            Color to write the result to instead of creating a new one.
         """
         scale = (1 << bits) // (1 << self.bits)
         maxv = (1 << bits) - 1
-        return RGBA([min(i * scale, maxv) for i in self.rgba], bits=bits)
+        data = 0
+        for c in self.rgba:
+            data = data << bits | min(c * scale, maxv)
+
+        if out is None:
+            out = RGBA.__new__(RGBA)
+
+        return out._assign(data, bits)
+
+    def convert_into(self, bits: int) -> "RGBA":
+        """
+        Convert the color to another bit count in place.
+
+        Parameters
+        ----------
+        bits: `int`
+            Number of bits per channel. Must be dividable by 4. 
+        """
+        return self.convert(bits, self)
     
     def normalize(self) -> tuple[float, float, float, float]:
         """Normalize RGBA to `0-1` range."""
-        return tuple(i / self._max_one for i in self.rgba)
+        max_one = self._max_one
+        r, g, b, a = self.rgba
+        return r / max_one, g / max_one, b / max_one, a / max_one
     
-    def brightness(self) -> int:
+    def brightness(self) -> float:
         """Get a perceived brightness in range `0-1`."""
         r, g, b, _ = self.normalize()
         return 0.299 * r ** 2 + 0.587 * g ** 2 + 0.114 * b ** 2
@@ -264,10 +396,73 @@ class RGBA:
             Brightness threshold.
         """
         return self.brightness() > threshold
+    
+    def luminance(self) -> float:
+        """Get WCAG relative luminance in range `0-1`."""
+        return luminance(self._data, self.bits)
+    
+    def contrast_ratio(self, other: "RGBA") -> float:
+        """
+        Get WCAG contrast ratio with another color in range `1-21`.
+
+        Alpha is ignored.
+
+        Parameters
+        ----------
+        other: `RGBA`
+            Another color.
+        """
+        first = self.luminance() + 0.05
+        second = other.luminance() + 0.05
+        return first / second if first > second else second / first
             
-    def complementary(self) -> "RGBA":
-        """Get the complementary color."""
-        return self.to_hsla().complementary().to_rgba()
+    def complementary(self, out: "RGBA | None" = None) -> "RGBA":
+        """
+        Get the complementary color.
+
+        Parameters
+        ----------
+        out: `RGBA` | `None`
+            Color to write the result to instead of creating a new one.
+        """
+        h, s, l = self._to_hsl(False)
+        r, g, b = _rgb((h + 180) % 360, s, l)
+        a = round(round(self.a / self._max_one * 100) * 2.55)
+
+        if out is None:
+            out = RGBA.__new__(RGBA)
+
+        return out._assign(r << 24 | g << 16 | b << 8 | a, 8)
+
+    def shift_hue_inplace(self, degrees: int, fast: bool = False) -> "RGBA":
+        """
+        Rotate hue of the color in place.
+
+        Unlike a round trip through `HSLA`, bit count and alpha are kept.
+
+        Parameters
+        ----------
+        degrees: `int`
+            Hue shift in degrees.
+        fast: `bool`
+            Whether to use integer math and lookup tables. Hue, saturation 
+            and lightness may differ from the exact path by 1 unit.
+        """
+        h, s, l = self._to_hsl(fast)
+        h = (h + degrees) % 360
+        r, g, b = hsl_to_rgb(h, s, l) if fast else _rgb(h, s, l)
+
+        bits = self._bits
+        max_one = self._max_one
+        data = self._data & max_one
+
+        for num, c in enumerate((b, g, r), 1):
+            if bits != 8:
+                c = (c * max_one * 2 + 255) // 510
+            data |= c << (num * bits)
+
+        self._data = data
+        return self
     
     def split_complementary(self) -> list["RGBA"]:
         """Get 2 split-complementary colors."""
@@ -323,7 +518,7 @@ class RGBA:
 
         return max(colors, key=lambda c: distance(self, c))
     
-    def blend(self, other: "RGBA", mode) -> "RGBA":
+    def blend(self, other: "RGBA", mode, out: "RGBA | None" = None) -> "RGBA":
         """
         Blend the color with another one. 
 
@@ -333,6 +528,8 @@ class RGBA:
             Foreground color.
         mode: `BlendMode`
             Blending mode.
+        out: `RGBA` | `None`
+            Color to write the result to instead of creating a new one.
 
         Raises
         ------
@@ -341,17 +538,35 @@ class RGBA:
         `TypeError`
             If blend mode is invalid.
         """
-        from .blend import BlendMode
-
         if not isinstance(mode, BlendMode):
             raise TypeError(
                 f"Mode must be {BlendMode.__name__}, not {type(mode).__name__}"
             )
 
-        return mode.compose(self, other)
+        return mode.compose(self, other, out)
+
+    def blend_into(self, other: "RGBA", mode) -> "RGBA":
+        """
+        Blend another color over this one in place.
+
+        Parameters
+        ----------
+        other: `RGBA`
+            Foreground color.
+        mode: `BlendMode`
+            Blending mode.
+
+        Raises
+        ------
+        `ValueError` 
+            If bit counts of the colors do not match.
+        `TypeError`
+            If blend mode is invalid.
+        """
+        return self.blend(other, mode, self)
     
     @classmethod
-    def random(cls, bits: int = 8) -> "RGBA":
+    def random(cls, bits: int = 8, seed: "int | Random | None" = None) -> "RGBA":
         """
         Generate a random color.
 
@@ -359,11 +574,16 @@ class RGBA:
         ----------
         bits: `int`
             Number of bits.
+        seed: `int` | `random.Random` | `None`
+            Seed or generator to use instead of the shared one.
         """
-        return cls(
-            [random.randint(0, 2 ** bits - 1) for _ in range(4)], 
-            bits=bits
-        )
+        return cls(rng(seed).getrandbits(bits * 4), bits=bits)
+
+
+Color = RGBA
 
 
-Color = RGBA
\ No newline at end of file
+from .blend import BlendMode
+from .cmyk import CMYK, _pack_cmyk
+from .hsla import HSLA, _pack_hsla, _rgb
+from .hsl import hsl_to_rgb, rgb_to_hsl
\ No newline at end of file
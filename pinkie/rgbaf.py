@@ -0,0 +1,499 @@
+import sys
+from array import array
+from collections.abc import Callable, Iterable, Iterator, Sequence
+
+from . import gamma
+
+
+def _reinhard(value: float) -> float:
+    return value / (1 + value) if value > 0 else 0.0
+
+
+def _aces(value: float) -> float:
+    # curve fit of the ACES filmic tone mapping by Krzysztof Narkowicz
+    if value <= 0:
+        return 0.0
+    return min(value * (2.51 * value + 0.03) / (value * (2.43 * value + 0.59) + 0.14), 1.0)
+
+
+def _clip(value: float) -> float:
+    return min(max(value, 0.0), 1.0)
+
+
+# tone mapping operators that compress channel values into `0-1` range
+TONE_MAPS: dict[str, Callable[[float], float]] = {
+    'clip': _clip,
+    'reinhard': _reinhard,
+    'aces': _aces,
+}
+
+
+def _tone_map(method: str) -> Callable[[float], float]:
+    try:
+        return TONE_MAPS[method]
+    except KeyError:
+        raise ValueError(f"Unknown tone mapping: {method}") from None
+
+
+class RGBAF:
+    """
+    Floating-point RGBA color model.
+
+    Channels are not limited to `0-1` range, so colors can hold
+    high dynamic range values. Blending keeps full precision,
+    and colors are quantized only by `to_rgba`.
+    """
+
+    __slots__ = ('_r', '_g', '_b', '_a')
+
+    def __init__(self, color: Sequence[float], /) -> None:
+        """
+        Parameters
+        ----------
+        color: `Sequence[float]`
+            Color sequence of r, g, b and optional a.
+
+        Raises
+        ------
+        `ValueError`
+            If the color is invalid.
+        """
+        if not isinstance(color, Sequence) or len(color) not in {3, 4}:
+            raise ValueError(f"Invalid color value: {color}")
+
+        self.r = color[0]
+        self.g = color[1]
+        self.b = color[2]
+        self.a = color[3] if len(color) == 4 else 1.0
+
+    def __eq__(self, other) -> bool:
+        return isinstance(other, RGBAF) and self.rgba == other.rgba
+
+    def __ne__(self, other) -> bool:
+        return not self.__eq__(other)
+
+    def __str__(self) -> str:
+        return f"rgbaf{self.rgba}"
+
+    def __repr__(self) -> str:
+        return f"<RGBAF r={self.r}, g={self.g}, b={self.b}, a={self.a}>"
+
+    def __hash__(self) -> int:
+        return hash(self.rgba)
+
+    def __getitem__(self, key):
+        return self.rgba[key]
+
+    def __iter__(self):
+        for item in self.rgba:
+            yield item
+
+    @staticmethod
+    def _float(value: float) -> float:
+        if not isinstance(value, (int, float)):
+            raise TypeError(f"Value must be a float, not {type(value).__name__}")
+        return float(value)
+
+    @property
+    def r(self) -> float:
+        """Red value."""
+        return self._r
+
+    @r.setter
+    def r(self, value: float):
+        self._r = self._float(value)
+
+    @property
+    def red(self) -> float:
+        """Alias of `r`."""
+        return self.r
+
+    @red.setter
+    def red(self, value: float):
+        self.r = value
+
+    @property
+    def g(self) -> float:
+        """Green value."""
+        return self._g
+
+    @g.setter
+    def g(self, value: float):
+        self._g = self._float(value)
+
+    @property
+    def green(self) -> float:
+        """Alias of `g`."""
+        return self.g
+
+    @green.setter
+    def green(self, value: float):
+        self.g = value
+
+    @property
+    def b(self) -> float:
+        """Blue value."""
+        return self._b
+
+    @b.setter
+    def b(self, value: float):
+        self._b = self._float(value)
+
+    @property
+    def blue(self) -> float:
+        """Alias of `b`."""
+        return self.b
+
+    @blue.setter
+    def blue(self, value: float):
+        self.b = value
+
+    @property
+    def a(self) -> float:
+        """Alpha value (transparency) in range `0-1`."""
+        return self._a
+
+    @a.setter
+    def a(self, value: float):
+        self._a = min(max(self._float(value), 0.0), 1.0)
+
+    @property
+    def alpha(self) -> float:
+        """Alias of `a`."""
+        return self.a
+
+    @alpha.setter
+    def alpha(self, value: float):
+        self.a = value
+
+    @property
+    def rgb(self) -> tuple[float, float, float]:
+        """`(r, g, b)` tuple."""
+        return self._r, self._g, self._b
+
+    @property
+    def rgba(self) -> tuple[float, float, float, float]:
+        """`(r, g, b, a)` tuple."""
+        return self._r, self._g, self._b, self._a
+
+    def copy(self, out: "RGBAF | None" = None) -> "RGBAF":
+        """
+        Get a copy of the color.
+
+        Parameters
+        ----------
+        out: `RGBAF` | `None`
+            Color to write the copy to instead of creating a new one.
+        """
+        obj = out if out is not None else RGBAF.__new__(RGBAF)
+        obj._r = self._r
+        obj._g = self._g
+        obj._b = self._b
+        obj._a = self._a
+        return obj
+
+    def is_hdr(self) -> bool:
+        """Check if any channel is brighter than `1`."""
+        return max(self.rgb) > 1
+
+    @classmethod
+    def from_rgba(cls, color: "RGBA", linear: bool = False) -> "RGBAF":
+        """
+        Convert an `RGBA` color.
+
+        Parameters
+        ----------
+        color: `RGBA`
+            Color to convert.
+        linear: `bool`
+            Whether to decode sRGB channels to linear light.
+            Colors must have at most 16 bits per channel.
+        """
+        return cls(gamma.dequantizer(color.bits, linear)(color._data))
+
+    def to_rgba(
+        self,
+        bits: int = 8,
+        linear: bool = False,
+        out: "RGBA | None" = None
+    ) -> "RGBA":
+        """
+        Quantize to `RGBA` color model.
+
+        Channels outside `0-1` range are clipped,
+        use `tone_map` first to keep highlights.
+
+        Parameters
+        ----------
+        bits: `int`
+            Number of bits per channel. Must be dividable by 4.
+        linear: `bool`
+            Whether channels are in linear light and must be encoded to sRGB.
+        out: `RGBA` | `None`
+            Color to write the result to instead of creating a new one.
+        """
+        if out is None:
+            out = RGBA.__new__(RGBA)
+
+        return out._assign(gamma.quantizer(bits, linear)(self.rgba), bits)
+
+    def tone_map(self, method: str = 'reinhard', exposure: float = 1.0) -> "RGBAF":
+        """
+        Compress high dynamic range channels into `0-1` range.
+
+        Parameters
+        ----------
+        method: `str`
+            Operator from `TONE_MAPS`: `clip`, `reinhard` or `aces`.
+        exposure: `float`
+            Multiplier applied to channels before the operator.
+
+        Raises
+        ------
+        `ValueError`
+            If the method is unknown.
+        """
+        func = _tone_map(method)
+        return RGBAF((*(func(c * exposure) for c in self.rgb), self._a))
+
+    def blend(self, other: "RGBAF", mode) -> "RGBAF":
+        """
+        Blend the color with another one without quantizing.
+
+        Channels are blended as they are, so the `linear`
+        option of the mode does not apply.
+
+        Parameters
+        ----------
+        other: `RGBAF`
+            Foreground color.
+        mode: `BlendMode`
+            Blending mode.
+
+        Raises
+        ------
+        `TypeError`
+            If blend mode is invalid.
+        """
+        if not isinstance(mode, BlendMode):
+            raise TypeError(
+                f"Mode must be {BlendMode.__name__}, not {type(mode).__name__}"
+            )
+
+        return mode.compose_float(self, other)
+
+
+class RGBAFArray:
+    """Array of `RGBAF` colors stored as interleaved float channels."""
+
+    __slots__ = ('_data',)
+
+    def __init__(
+        self,
+        colors: Iterable[RGBAF | Sequence[float]] = (),
+        typecode: str = 'd'
+    ) -> None:
+        """
+        Parameters
+        ----------
+        colors: `Iterable[RGBAF | Sequence[float]]`
+            Colors or sequences of r, g, b and optional a.
+        typecode: `str`
+            `f` for 32-bit or `d` for 64-bit channels.
+
+        Raises
+        ------
+        `ValueError`
+            If the typecode or a color is invalid.
+        """
+        if typecode not in {'f', 'd'}:
+            raise ValueError(f"Invalid typecode: {typecode}")
+
+        self._data: array[float] = array(typecode)
+        for color in colors:
+            self.append(color)
+
+    def __len__(self) -> int:
+        return len(self._data) // 4
+
+    def __getitem__(self, index: int) -> RGBAF:
+        if index < 0:
+            index += len(self)
+        if not 0 <= index < len(self):
+            raise IndexError("Color index out of range")
+
+        return RGBAF(self._data[index * 4:index * 4 + 4])
+
+    def __setitem__(self, index: int, color: RGBAF | Sequence[float]) -> None:
+        if index < 0:
+            index += len(self)
+        if not 0 <= index < len(self):
+            raise IndexError("Color index out of range")
+
+        if not isinstance(color, RGBAF):
+            color = RGBAF(color)
+
+        self._data[index * 4:index * 4 + 4] = array(self.typecode, color.rgba)
+
+    def __iter__(self) -> Iterator[RGBAF]:
+        data = self._data
+        for i in range(0, len(data), 4):
+            yield RGBAF(data[i:i + 4])
+
+    # `memoryview()` calls this on Python 3.12+ only, before that
+    # the values are shared through `__array_interface__`
+    def __buffer__(self, flags: int) -> memoryview:
+        return memoryview(self._data)
+
+    @property
+    def __array_interface__(self) -> dict:
+        """View of channels with `(n, 4)` shape for `numpy.asarray`."""
+        order = '<' if sys.byteorder == 'little' else '>'
+        return {
+            'version': 3,
+            'shape': (len(self), 4),
+            'typestr': f'{order}f{self._data.itemsize}',
+            'data': memoryview(self._data)
+        }
+
+    @property
+    def data(self) -> array:
+        """Interleaved r, g, b and a channels."""
+        return self._data
+
+    @property
+    def typecode(self) -> str:
+        """Typecode of the channel array."""
+        return self._data.typecode
+
+    def append(self, color: RGBAF | Sequence[float]) -> None:
+        """
+        Add a color to the end.
+
+        Parameters
+        ----------
+        color: `RGBAF` | `Sequence[float]`
+            Color or a sequence of r, g, b and optional a.
+        """
+        if not isinstance(color, RGBAF):
+            color = RGBAF(color)
+
+        try:
+            self._data.extend(color.rgba)
+        except BufferError:
+            # the array is exported, so detach from the exported buffer
+            self._data = array(self._data.typecode, self._data)
+            self._data.extend(color.rgba)
+
+    def _from_tuples(self, colors: Iterable[Sequence[float]]) -> "RGBAFArray":
+        obj = RGBAFArray(typecode=self.typecode)
+        for color in colors:
+            obj._data.extend(color)
+        return obj
+
+    def _tuples(self) -> Iterator[tuple[float, float, float, float]]:
+        data = self._data
+        for i in range(0, len(data), 4):
+            yield data[i], data[i + 1], data[i + 2], data[i + 3]
+
+    @classmethod
+    def from_packed(
+        cls,
+        values: Iterable[int],
+        bits: int = 8,
+        linear: bool = False,
+        typecode: str = 'd'
+    ) -> "RGBAFArray":
+        """
+        Convert packed RGBA values.
+
+        Parameters
+        ----------
+        values: `Iterable[int]`
+            Packed values.
+        bits: `int`
+            Number of bits per channel.
+        linear: `bool`
+            Whether to decode sRGB channels to linear light.
+        typecode: `str`
+            `f` for 32-bit or `d` for 64-bit channels.
+        """
+        obj = cls(typecode=typecode)
+        dequantize = gamma.dequantizer(bits, linear)
+        for value in values:
+            obj._data.extend(dequantize(value))
+        return obj
+
+    def to_packed(self, bits: int = 8, linear: bool = False) -> list[int]:
+        """
+        Quantize to packed RGBA values.
+
+        Channels outside `0-1` range are clipped,
+        use `tone_map` first to keep highlights.
+
+        Parameters
+        ----------
+        bits: `int`
+            Number of bits per channel.
+        linear: `bool`
+            Whether channels are in linear light and must be encoded to sRGB.
+        """
+        quantize = gamma.quantizer(bits, linear)
+        return [quantize(color) for color in self._tuples()]
+
+    def tone_map(self, method: str = 'reinhard', exposure: float = 1.0) -> "RGBAFArray":
+        """
+        Compress high dynamic range channels into `0-1` range.
+
+        Parameters
+        ----------
+        method: `str`
+            Operator from `TONE_MAPS`: `clip`, `reinhard` or `aces`.
+        exposure: `float`
+            Multiplier applied to channels before the operator.
+
+        Raises
+        ------
+        `ValueError`
+            If the method is unknown.
+        """
+        func = _tone_map(method)
+        return self._from_tuples(
+            (func(r * exposure), func(g * exposure), func(b * exposure), a)
+            for r, g, b, a in self._tuples()
+        )
+
+    def blend(self, other: "RGBAFArray", mode) -> "RGBAFArray":
+        """
+        Blend colors with another array pairwise without quantizing.
+
+        Parameters
+        ----------
+        other: `RGBAFArray`
+            Foreground colors.
+        mode: `BlendMode`
+            Blending mode.
+
+        Raises
+        ------
+        `ValueError`
+            If the arrays have different lengths.
+        `TypeError`
+            If blend mode is invalid.
+        """
+        if not isinstance(mode, BlendMode):
+            raise TypeError(
+                f"Mode must be {BlendMode.__name__}, not {type(mode).__name__}"
+            )
+
+        if len(self) != len(other):
+            raise ValueError("Cannot blend arrays of different length")
+
+        blend = mode.blend
+        return self._from_tuples(
+            blend(bg, fg) for bg, fg in zip(self._tuples(), other._tuples())
+        )
+
+
+from .blend import BlendMode
+from .rgba import RGBA
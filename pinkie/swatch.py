@@ -0,0 +1,406 @@
+import json
+import mmap
+import os
+import struct
+import sys
+from array import array
+from collections.abc import Sequence
+
+from .palette import Palette
+from .utils import packed_typecode
+
+
+MAGIC = b'PNKP'
+VERSION = 1
+
+# magic, version, bits, bytes per color, number of colors
+_HEADER = struct.Struct('<4sBBHQ')
+
+
+def _channels(value: int, bits: int, scale: int) -> tuple[int, ...]:
+    max_one = (1 << bits) - 1
+    return tuple(
+        round((value >> (num * bits) & max_one) * scale / max_one)
+        for num in (3, 2, 1, 0)
+    )
+
+
+def _pack(channels, bits: int, scale: int) -> int:
+    max_one = (1 << bits) - 1
+    value = 0
+    for c in channels:
+        value = value << bits | round(min(max(c, 0), scale) * max_one / scale)
+    return value
+
+
+def _unpack(view: memoryview, bits: int) -> Sequence[int]:
+    # little-endian packed values take `bits // 2` bytes each
+    size = bits // 2
+    typecode = packed_typecode(bits)
+
+    if typecode is None or array(typecode).itemsize != size:
+        return [
+            int.from_bytes(view[i:i + size], 'little')
+            for i in range(0, len(view), size)
+        ]
+
+    if sys.byteorder == 'big':
+        values = array(typecode)
+        values.frombytes(view)
+        values.byteswap()
+        return values
+
+    return view.cast('B').cast(typecode)
+
+
+def dumps_binary(palette: Palette) -> bytes:
+    """
+    Serialize the palette to the compact binary format.
+
+    The data starts with a header holding the bit count and number
+    of colors, followed by little-endian packed color values.
+
+    Parameters
+    ----------
+    palette: `Palette`
+        Palette to serialize.
+    """
+    bits = palette.bits or 0
+    size = bits // 2
+    header = _HEADER.pack(MAGIC, VERSION, bits, size, len(palette))
+    typecode = packed_typecode(bits) if bits else None
+
+    if typecode is None or array(typecode).itemsize != size:
+        return header + b''.join(v.to_bytes(size, 'little') for v in palette._live())
+
+    values = array(typecode, palette._live())
+    if sys.byteorder == 'big':
+        values.byteswap()
+
+    return header + values.tobytes()
+
+
+def loads_binary(data) -> Palette:
+    """
+    Deserialize a palette from the compact binary format.
+
+    Packed values are used as they are, without building colors.
+    If the data is a buffer, the palette keeps a read-only view of it
+    and copies the values only when it is modified.
+
+    Parameters
+    ----------
+    data: `bytes` | `memoryview` | `mmap.mmap`
+        Serialized palette.
+
+    Raises
+    ------
+    `ValueError`
+        If the data is not a valid palette.
+    """
+    if len(data) < _HEADER.size:
+        raise ValueError("Invalid palette data")
+
+    magic, version, bits, size, count = _HEADER.unpack_from(data)
+    if magic != MAGIC or version != VERSION:
+        raise ValueError("Invalid palette data")
+
+    if bits and (bits % 4 != 0 or size != bits // 2):
+        raise ValueError("Invalid palette data")
+
+    end = _HEADER.size + count * size
+    if len(data) < end:
+        raise ValueError("Palette data is truncated")
+
+    if count == 0:
+        return Palette()
+
+    return Palette._from_packed(_unpack(memoryview(data)[_HEADER.size:end], bits), bits)
+
+
+def dumps_gpl(palette: Palette, name: str = "pinkie") -> str:
+    """
+    Serialize the palette to the GIMP palette format.
+
+    Channels are scaled to 8 bits and alpha is dropped.
+
+    Parameters
+    ----------
+    palette: `Palette`
+        Palette to serialize.
+    name: `str`
+        Palette name.
+    """
+    bits = palette.bits or 8
+    lines = ["GIMP Palette", f"Name: {name}", "#"]
+
+    for value in palette._live():
+        r, g, b, _ = _channels(value, bits, 255)
+        lines.append(f"{r:3} {g:3} {b:3}\t{r:02x}{g:02x}{b:02x}")
+
+    return "\n".join(lines) + "\n"
+
+
+def loads_gpl(text: str, bits: int = 8) -> Palette:
+    """
+    Deserialize a palette from the GIMP palette format.
+
+    Parameters
+    ----------
+    text: `str`
+        Serialized palette.
+    bits: `int`
+        Number of bits per channel of the palette.
+
+    Raises
+    ------
+    `ValueError`
+        If the text is not a valid palette.
+    """
+    lines = text.splitlines()
+    if not lines or lines[0].strip() != "GIMP Palette":
+        raise ValueError("Invalid GIMP palette")
+
+    values = []
+    for line in lines[1:]:
+        line = line.strip()
+        if not line or line.startswith('#') or ':' in line.split()[0]:
+            continue
+
+        # r, g and b are followed by an optional name
+        try:
+            rgb = [int(i) for i in line.split(maxsplit=3)[:3]]
+        except ValueError:
+            rgb = []
+
+        if len(rgb) != 3:
+            raise ValueError(f"Invalid GIMP palette line: {line}")
+
+        values.append(_pack((*rgb, 255), bits, 255))
+
+    return Palette._from_values(values, bits if values else None)
+
+
+def dumps_aco(palette: Palette) -> bytes:
+    """
+    Serialize the palette to the Adobe color swatch format.
+
+    Both version 1 and version 2 (named) sections are written.
+    Alpha is dropped.
+
+    Parameters
+    ----------
+    palette: `Palette`
+        Palette to serialize.
+    """
+    bits = palette.bits or 8
+    colors = [_channels(value, bits, 65535)[:3] for value in palette._live()]
+
+    v1 = [struct.pack('>HH', 1, len(colors))]
+    v2 = [struct.pack('>HH', 2, len(colors))]
+
+    for r, g, b in colors:
+        entry = struct.pack('>5H', 0, r, g, b, 0)
+        name = f"{r >> 8:02x}{g >> 8:02x}{b >> 8:02x}".encode('utf-16-be')
+
+        v1.append(entry)
+        v2.append(entry + struct.pack('>I', len(name) // 2 + 1) + name + b'\x00\x00')
+
+    return b''.join(v1 + v2)
+
+
+def _aco_entries(data: bytes) -> list[tuple[int, ...]]:
+    version, count = struct.unpack_from('>HH', data)
+    if version == 1:
+        return [struct.unpack_from('>5H', data, 4 + i * 10) for i in range(count)]
+
+    if version != 2:
+        raise ValueError("Invalid color swatch data")
+
+    # version 2 entries are followed by a UTF-16 name with its length in characters
+    entries = []
+    offset = 4
+    for _ in range(count):
+        entries.append(struct.unpack_from('>5H', data, offset))
+        length, = struct.unpack_from('>I', data, offset + 10)
+        offset += 14 + length * 2
+
+    if offset > len(data):
+        raise ValueError("Color swatch data is truncated")
+
+    return entries
+
+
+def loads_aco(data: bytes, bits: int = 8) -> Palette:
+    """
+    Deserialize a palette from the Adobe color swatch format.
+
+    Only RGB and grayscale swatches are supported,
+    names of version 2 swatches are dropped.
+
+    Parameters
+    ----------
+    data: `bytes`
+        Serialized palette.
+    bits: `int`
+        Number of bits per channel of the palette.
+
+    Raises
+    ------
+    `ValueError`
+        If the data is not a valid palette.
+    """
+    try:
+        entries = _aco_entries(data)
+    except struct.error:
+        raise ValueError("Invalid color swatch data") from None
+
+    values = []
+    for space, w, x, y, _ in entries:
+        if space == 0:
+            rgb = (w, x, y)
+        elif space == 8:
+            gray = round((10000 - min(w, 10000)) * 65535 / 10000)
+            rgb = (gray, gray, gray)
+        else:
+            raise ValueError(f"Unsupported color space: {space}")
+
+        values.append(_pack((*rgb, 65535), bits, 65535))
+
+    return Palette._from_values(values, bits if values else None)
+
+
+def dumps_json(palette: Palette) -> str:
+    """
+    Serialize the palette to JSON.
+
+    Colors are stored as hex strings with alpha.
+
+    Parameters
+    ----------
+    palette: `Palette`
+        Palette to serialize.
+    """
+    bits = palette.bits
+    return json.dumps({
+        "bits": bits,
+        "colors": [f"{v:0{bits}X}" for v in palette._live()]
+    })
+
+
+def loads_json(text: str) -> Palette:
+    """
+    Deserialize a palette from JSON.
+
+    Parameters
+    ----------
+    text: `str`
+        Serialized palette.
+
+    Raises
+    ------
+    `ValueError`
+        If the text is not a valid palette.
+    """
+    data = json.loads(text)
+    if not isinstance(data, dict) or not isinstance(data.get("colors"), list):
+        raise ValueError("Invalid JSON palette")
+
+    colors = data["colors"]
+    bits = data.get("bits") or 8
+
+    if not isinstance(bits, int) or bits % 4 != 0 or bits < 4:
+        raise ValueError("Invalid JSON palette bits")
+
+    if any(not isinstance(c, str) or len(c) != bits for c in colors):
+        raise ValueError("Invalid JSON palette colors")
+
+    return Palette._from_values((int(c, 16) for c in colors), bits if colors else None)
+
+
+FORMATS = {
+    '.gpl': 'gpl',
+    '.aco': 'aco',
+    '.json': 'json',
+}
+
+
+def save(palette: Palette, path: str | os.PathLike, format: str | None = None) -> None:
+    """
+    Save the palette to a file.
+
+    Parameters
+    ----------
+    palette: `Palette`
+        Palette to save.
+    path: `str` | `os.PathLike`
+        File path.
+    format: `str` | `None`
+        One of `binary`, `gpl`, `aco` and `json`.
+        Guessed from the file extension if not specified.
+
+    Raises
+    ------
+    `ValueError`
+        If the format is unknown.
+    """
+    format = format or FORMATS.get(os.path.splitext(path)[1].lower(), 'binary')
+
+    if format == 'binary':
+        data = dumps_binary(palette)
+    elif format == 'gpl':
+        data = dumps_gpl(palette).encode()
+    elif format == 'aco':
+        data = dumps_aco(palette)
+    elif format == 'json':
+        data = dumps_json(palette).encode()
+    else:
+        raise ValueError(f"Unknown palette format: {format}")
+
+    with open(path, 'wb') as f:
+        f.write(data)
+
+
+def load(
+    path: str | os.PathLike,
+    format: str | None = None,
+    *,
+    use_mmap: bool = True
+) -> Palette:
+    """
+    Load a palette from a file.
+
+    Parameters
+    ----------
+    path: `str` | `os.PathLike`
+        File path.
+    format: `str` | `None`
+        One of `binary`, `gpl`, `aco` and `json`.
+        Guessed from the file extension if not specified.
+    use_mmap: `bool`
+        Whether to memory-map binary palettes instead of reading them.
+
+    Raises
+    ------
+    `ValueError`
+        If the format is unknown or the file is invalid.
+    """
+    format = format or FORMATS.get(os.path.splitext(path)[1].lower(), 'binary')
+
+    if format not in {'binary', 'gpl', 'aco', 'json'}:
+        raise ValueError(f"Unknown palette format: {format}")
+
+    with open(path, 'rb') as f:
+        if format == 'binary' and use_mmap and os.fstat(f.fileno()).st_size > 0:
+            return loads_binary(mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ))
+
+        data = f.read()
+
+    if format == 'binary':
+        return loads_binary(data)
+    elif format == 'gpl':
+        return loads_gpl(data.decode())
+    elif format == 'aco':
+        return loads_aco(data)
+    else:
+        return loads_json(data.decode())
@@ -0,0 +1,228 @@
+from collections.abc import MutableSequence, Sequence
+from itertools import repeat
+from operator import add, mul
+
+from .blend import BlendMode
+from .palette import Palette
+from .parallel import map_chunks
+
+
+DEFAULT_MAX_CACHE = 1 << 16
+
+
+class CompositeResult:
+    """Composed values of index buffers and how much work was shared."""
+
+    __slots__ = ('values', 'pixels', 'pairs', 'computed')
+
+    def __init__(
+        self,
+        values: MutableSequence[int],
+        pixels: int,
+        pairs: int,
+        computed: int
+    ) -> None:
+        """
+        Parameters
+        ----------
+        values: `MutableSequence[int]`
+            Composed packed values.
+        pixels: `int`
+            Number of composed pixels.
+        pairs: `int`
+            Number of unique background and foreground pairs.
+        computed: `int`
+            Number of pairs that were not cached and had to be composed.
+        """
+        self.values = values
+        self.pixels = pixels
+        self.pairs = pairs
+        self.computed = computed
+
+    def __repr__(self) -> str:
+        return (
+            f"<CompositeResult pixels={self.pixels}, pairs={self.pairs}, "
+            f"computed={self.computed}, dedup_ratio={self.dedup_ratio:.1f}>"
+        )
+
+    @property
+    def dedup_ratio(self) -> float:
+        """Number of pixels per unique pair, `1.0` if nothing was composed."""
+        return self.pixels / self.pairs if self.pairs else 1.0
+
+
+class TileCompositor:
+    """
+    Compositor of index buffers into small palettes, like tiles of a sprite sheet.
+
+    Each unique pair of background and foreground colors is composed once
+    and scattered to all pixels that use it, so the work depends on the number
+    of color pairs instead of pixels. Composed pairs are cached between calls,
+    so tiles sharing colors reuse the results.
+    """
+
+    __slots__ = ('_mode', '_bits', '_max_cache', '_cache')
+
+    def __init__(
+        self,
+        mode: BlendMode,
+        bits: int = 8,
+        max_cache: int = DEFAULT_MAX_CACHE
+    ) -> None:
+        """
+        Parameters
+        ----------
+        mode: `BlendMode`
+            Blending mode.
+        bits: `int`
+            Number of bits per channel.
+        max_cache: `int`
+            Maximum number of cached pairs. The cache is cleared when it is full.
+
+        Raises
+        ------
+        `TypeError`
+            If blend mode is invalid.
+        """
+        if not isinstance(mode, BlendMode):
+            raise TypeError(
+                f"Mode must be {BlendMode.__name__}, not {type(mode).__name__}"
+            )
+
+        self._mode = mode
+        self._bits = bits
+        self._max_cache = max_cache
+        self._cache: dict[int, int] = {}
+
+    def __len__(self) -> int:
+        return len(self._cache)
+
+    @property
+    def mode(self) -> BlendMode:
+        return self._mode
+
+    @property
+    def bits(self) -> int:
+        return self._bits
+
+    def clear(self) -> None:
+        """Clear cached pairs."""
+        self._cache.clear()
+
+    def _values(self, palette: Palette | Sequence[int]) -> Sequence[int]:
+        if not isinstance(palette, Palette):
+            return palette
+
+        if palette.bits and palette.bits != self._bits:
+            raise ValueError("Palette must have same bit count as the compositor")
+        return list(palette._live())
+
+    def compose(
+        self,
+        bg: Sequence[int],
+        fg: Sequence[int],
+        palette: Palette | Sequence[int],
+        fg_palette: Palette | Sequence[int] | None = None,
+        out: MutableSequence[int] | None = None
+    ) -> CompositeResult:
+        """
+        Compose index buffers pixel by pixel.
+
+        Parameters
+        ----------
+        bg: `Sequence[int]`
+            Background indices, like `bytes` or an `array`.
+        fg: `Sequence[int]`
+            Foreground indices.
+        palette: `Palette` | `Sequence[int]`
+            Colors or packed values the background indices refer to.
+        fg_palette: `Palette` | `Sequence[int]` | `None`
+            Colors the foreground indices refer to. Defaults to `palette`.
+        out: `MutableSequence[int]` | `None`
+            List or array to write the composed values to
+            instead of creating a new list.
+
+        Raises
+        ------
+        `ValueError`
+            If the buffers or the output have different lengths, an index
+            is out of range, or the bit count of a palette does not match.
+        """
+        if len(bg) != len(fg):
+            raise ValueError("Cannot blend sequences of different length")
+
+        bg_values = self._values(palette)
+        fg_values = bg_values if fg_palette is None else self._values(fg_palette)
+
+        for indices, values in ((bg, bg_values), (fg, fg_values)):
+            if len(indices) and (min(indices) < 0 or max(indices) >= len(values)):
+                raise ValueError("Index is out of palette range")
+
+        # a single key per pair of indices
+        num = len(fg_values)
+        keys = list(map(add, map(mul, bg, repeat(num)), fg))
+        unique = dict.fromkeys(keys)
+
+        shift = self._bits * 4
+        cache = self._cache
+        missing: list[int] = []
+        missing_bg: list[int] = []
+        missing_fg: list[int] = []
+
+        for key in unique:
+            b = bg_values[key // num]
+            f = fg_values[key % num]
+            value = cache.get(b << shift | f)
+
+            if value is None:
+                missing.append(key)
+                missing_bg.append(b)
+                missing_fg.append(f)
+            else:
+                unique[key] = value
+
+        composed = self._mode.compose_packed(missing_bg, missing_fg, self._bits)
+        if len(cache) + len(composed) > self._max_cache:
+            cache.clear()
+
+        for key, b, f, value in zip(missing, missing_bg, missing_fg, composed):
+            unique[key] = value
+            if len(cache) < self._max_cache:
+                cache[b << shift | f] = value
+
+        values = map_chunks(lambda chunk: list(map(unique.__getitem__, chunk)), keys, out=out)
+        return CompositeResult(values, len(keys), len(unique), len(missing))
+
+
+def compose_indexed(
+    mode: BlendMode,
+    bg: Sequence[int],
+    fg: Sequence[int],
+    palette: Palette | Sequence[int],
+    fg_palette: Palette | Sequence[int] | None = None,
+    bits: int = 8,
+    out: MutableSequence[int] | None = None
+) -> CompositeResult:
+    """
+    Compose index buffers once, without keeping a cache.
+
+    See `TileCompositor.compose`.
+
+    Parameters
+    ----------
+    mode: `BlendMode`
+        Blending mode.
+    bg: `Sequence[int]`
+        Background indices.
+    fg: `Sequence[int]`
+        Foreground indices.
+    palette: `Palette` | `Sequence[int]`
+        Colors or packed values the background indices refer to.
+    fg_palette: `Palette` | `Sequence[int]` | `None`
+        Colors the foreground indices refer to. Defaults to `palette`.
+    bits: `int`
+        Number of bits per channel.
+    out: `MutableSequence[int]` | `None`
+        List or array to write the composed values to.
+    """
+    return TileCompositor(mode, bits).compose(bg, fg, palette, fg_palette, out)
@@ -1,16 +1,83 @@
 import math
-from typing import Sequence
+from array import array
+from collections.abc import Iterable
 
+# mypy and mypyc read this name as true, importing typing is too slow
+TYPE_CHECKING = False
+if TYPE_CHECKING:
+    from random import Random
+    from typing import Literal
 
-def distance(p1: Sequence, p2: Sequence, /) -> float:
+    from mypy_extensions import mypyc_attr as mypyc_attr
+
+    # typecodes of unsigned integers that `memoryview.cast` accepts
+    PackedTypecode = Literal['H', 'I', 'L', 'Q']
+else:
+    def mypyc_attr(*attrs, **kwattrs):
+        # mypyc reads the attributes at build time, the decorator does nothing
+        return lambda cls: cls
+
+
+def distance(p1: Iterable[float], p2: Iterable[float], /) -> float:
     """
-    Get the Euclidean distance for 2 sequences.
+    Get the Euclidean distance for 2 points.
 
     Parameters
     ----------
-    p1: `Sequence`
+    p1: `Iterable[float]`
         First point.
-    p2: `Sequence`
+    p2: `Iterable[float]`
         Second point.
     """
-    return math.sqrt(sum((a - b) ** 2 for a, b in zip(p1, p2)))
\ No newline at end of file
+    return math.sqrt(sum((a - b) ** 2 for a, b in zip(p1, p2)))
+
+
+_shared_rng: "Random | None" = None
+
+
+def rng(seed: "int | Random | None" = None, /) -> "Random":
+    """
+    Get a random number generator.
+
+    Parameters
+    ----------
+    seed: `int` | `random.Random` | `None`
+        Seed of a new generator or a generator to use as is.
+        If `None`, a generator shared by pinkie is used.
+    """
+    global _shared_rng
+
+    # random is imported on first use, it is slow to import
+    from random import Random
+
+    if seed is None:
+        if _shared_rng is None:
+            _shared_rng = Random()
+        return _shared_rng
+    if isinstance(seed, Random):
+        return seed
+    return Random(seed)
+
+
+_PACKED_TYPECODES: "tuple[PackedTypecode, ...]" = ('H', 'I', 'L', 'Q')
+
+
+def packed_typecode(bits: int, /) -> "PackedTypecode | None":
+    """
+    Get the smallest `array` typecode that fits a packed RGBA value.
+
+    Parameters
+    ----------
+    bits: `int`
+        Number of bits per channel.
+
+    Returns
+    -------
+    `str` | `None`
+        Typecode or `None` if the value does not fit into 64 bits.
+    """
+    for typecode in _PACKED_TYPECODES:
+        if array(typecode).itemsize * 8 >= bits * 4:
+            return typecode
+    
+    return None
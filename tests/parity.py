@@ -0,0 +1,75 @@
+"""
+Print whether pinkie is compiled and a digest of results of its color models.
+
+Run it with and without `PINKIE_PURE_PYTHON=1` to compare the backends,
+`test_compiled_parity.py` does it for pytest.
+"""
+import hashlib
+import os
+import random
+import sys
+
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+MODES = (
+    'Normal', 'Darken', 'Multiply', 'ColorBurn', 'Lighten', 'Screen', 'ColorDodge',
+    'Overlay', 'SoftLight', 'HardLight', 'Difference', 'Exclusion'
+)
+
+
+def _workload() -> list:
+    from pinkie import CMYK, HSLA, RGBA, blend
+
+    generator = random.Random(1)
+    modes = [getattr(blend, name)(linear=linear) for name in MODES for linear in (False, True)]
+    results: list = []
+
+    for _ in range(500):
+        bits = generator.choice((4, 8, 16))
+        max_one = (1 << bits) - 1
+        a = RGBA([generator.randint(0, max_one) for _ in range(4)], bits=bits)
+        b = RGBA([generator.randint(0, max_one) for _ in range(4)], bits=bits)
+
+        results.append((
+            a.rgba, a.hex, a.to_hsla().hsla, a.to_cmyk().cmyk, a.to_hsla(fast=True).hsla,
+            a.to_hsla().to_rgba().rgba, a.to_cmyk().to_rgba().rgba,
+            a.brightness(), a.luminance(), a.complementary().rgba,
+            [c.rgba for c in a.triadic()], a.closest(b, a).rgba
+        ))
+
+        for mode in modes:
+            try:
+                results.append(a.blend(b, mode).decimal)
+            except ZeroDivisionError:
+                results.append(None)
+
+        results.append([c.decimal for c in modes[-1].compose_many([a, b], [b, a])])
+
+    hsla = HSLA((10, 20, 30))
+    hsla.h += 400
+    cmyk = CMYK((10, 20, 30, 40))
+    cmyk.k = 90
+    results.append((hsla.hsla, hsla.decimal, cmyk.cmyk, cmyk.decimal))
+
+    # interpreted subclasses of compiled classes
+    class Custom(blend.BlendMode):
+        def blend(self, bg, fg):
+            return bg[0] * fg[0], bg[1], bg[2], self._alpha(bg, fg)
+
+    results.append(RGBA('FF00FF').blend(RGBA('808080'), Custom()).decimal)
+
+    average = blend.separable_blend(lambda cb, cs, ab, as_: (cb + cs * as_) / (1 + as_))
+    bg = [generator.getrandbits(24) << 8 | 0xFF for _ in range(5000)]
+    fg = [generator.getrandbits(24) << 8 | generator.choice((0xFF, 0x80)) for _ in range(5000)]
+    for kwargs in ({}, {'lut': True}, {'linear': True, 'lut': True}):
+        results.append(average(**kwargs).compose_packed(bg, fg))
+
+    return results
+
+
+if __name__ == '__main__':
+    sys.path.insert(0, ROOT)
+    import pinkie
+
+    print(pinkie.is_compiled(), hashlib.sha256(repr(_workload()).encode()).hexdigest())
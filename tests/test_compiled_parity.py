@@ -0,0 +1,41 @@
+"""
+Compiled and pure Python color models must give the same results.
+
+Build the package with mypyc first, otherwise the test is skipped:
+
+    python build.py && python -m pytest tests
+"""
+import os
+import subprocess
+import sys
+
+import pytest
+
+
+SCRIPT = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'parity.py')
+
+
+def _digest(pure: bool) -> tuple[bool, str]:
+    env = dict(os.environ)
+    env.pop('PINKIE_PURE_PYTHON', None)
+    if pure:
+        env['PINKIE_PURE_PYTHON'] = '1'
+
+    output = subprocess.run(
+        [sys.executable, SCRIPT],
+        env=env,
+        capture_output=True,
+        text=True,
+        check=True
+    ).stdout.split()
+    return output[0] == 'True', output[1]
+
+
+def test_compiled_parity() -> None:
+    compiled, compiled_digest = _digest(pure=False)
+    if not compiled:
+        pytest.skip("pinkie is not compiled, run build.py first")
+
+    pure, pure_digest = _digest(pure=True)
+    assert not pure
+    assert compiled_digest == pure_digest
@@ -0,0 +1,27 @@
+import random
+
+from pinkie import RGBA
+from pinkie.contrast import adjust_lightness, required_ratio
+
+
+def _colors(num: int) -> list[RGBA]:
+    gen = random.Random(1)
+    return [RGBA(gen.getrandbits(24) << 8 | 0xff) for _ in range(num)]
+
+
+def test_adjust_lightness_keeps_passing_colors() -> None:
+    black = RGBA(0x000000ff)
+    ratio = required_ratio('AA', False)
+
+    for color in _colors(500):
+        result = adjust_lightness(color, black)
+        if color.contrast_ratio(black) >= ratio:
+            assert result is color
+        else:
+            assert result is not None
+            assert result.contrast_ratio(black) >= ratio
+
+
+def test_adjust_lightness_impossible() -> None:
+    gray = RGBA(0x777777ff)
+    assert adjust_lightness(RGBA(0x787878ff), gray, level=21) is None
@@ -0,0 +1,78 @@
+"""
+Importing pinkie must stay cheap, command-line tools start it very often.
+
+Each statement runs in a fresh interpreter, which reports the modules
+it loaded. Slow standard modules are only imported on first use.
+"""
+import os
+import subprocess
+import sys
+
+import pytest
+
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+# modules that are slow to import and are not needed to work with colors
+FORBIDDEN = (
+    'asyncio',
+    'concurrent.futures',
+    'json',
+    'logging',
+    'mypy_extensions',
+    'random',
+    're',
+    'typing',
+)
+
+SCRIPT = """
+import sys
+before = set(sys.modules)
+{statement}
+print('\\n'.join(sorted(set(sys.modules) - before)))
+"""
+
+
+def _loaded(statement: str) -> set[str]:
+    env = dict(os.environ)
+    env['PYTHONPATH'] = os.pathsep.join(filter(None, (ROOT, env.get('PYTHONPATH'))))
+
+    output = subprocess.run(
+        [sys.executable, '-c', SCRIPT.format(statement=statement)],
+        env=env,
+        capture_output=True,
+        text=True,
+        check=True
+    ).stdout
+    return set(output.split())
+
+
+@pytest.mark.parametrize('statement', [
+    "import pinkie",
+    "from pinkie import Color",
+    "from pinkie import HSLA, CMYK",
+    "from pinkie import Palette",
+    "from pinkie import Multiply, BlendMode",
+    "from pinkie import generate",
+    "from pinkie import batch",
+    "from pinkie import ColorPool",
+    "Color = __import__('pinkie').Color; Color(0xff00ff).to_hsla().to_rgba()",
+])
+def test_import_is_lazy(statement: str) -> None:
+    loaded = _loaded(statement)
+    assert not [name for name in FORBIDDEN if name in loaded]
+
+
+@pytest.mark.parametrize('pure', [False, True])
+def test_import_pure_python(pure: bool) -> None:
+    env = "import os; os.environ.pop('PINKIE_PURE_PYTHON', None)"
+    if pure:
+        env = "import os; os.environ['PINKIE_PURE_PYTHON'] = '1'"
+
+    loaded = _loaded(f"{env}\nfrom pinkie import Color, Palette")
+    assert not [name for name in FORBIDDEN if name in loaded]
+
+
+def test_float_model_is_lazy() -> None:
+    loaded = _loaded("from pinkie import Color, Multiply; Color(0xff00ff).blend(Color(0xff), Multiply())")
+    assert 'pinkie.rgbaf' not in loaded
@@ -0,0 +1,70 @@
+"""
+Profiling stats must be complete or report what they do not cover.
+
+Each backend runs in a fresh interpreter, the compiled one
+is skipped when the package is not built.
+"""
+import json
+import os
+import subprocess
+import sys
+
+import pytest
+
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+SCRIPT = """
+import json
+from pinkie import Color, Palette, is_compiled, profiling
+from pinkie.blend import Multiply
+
+with profiling.profile():
+    Color(0xff0000ff).blend(Color(0x00ff00ff), Multiply())
+    Palette().add_color(Color(0x405060ff))
+    snapshot = profiling.stats()
+
+print(json.dumps({'compiled': is_compiled(), **snapshot}))
+"""
+
+
+def _stats(pure: bool) -> dict:
+    env = dict(os.environ)
+    env['PYTHONPATH'] = os.pathsep.join(filter(None, (ROOT, env.get('PYTHONPATH'))))
+    env.pop('PINKIE_PURE_PYTHON', None)
+    if pure:
+        env['PINKIE_PURE_PYTHON'] = '1'
+
+    output = subprocess.run(
+        [sys.executable, '-c', SCRIPT],
+        env=env,
+        capture_output=True,
+        text=True,
+        check=True
+    ).stdout
+    return json.loads(output)
+
+
+def test_pure_python_calls_are_counted() -> None:
+    snapshot = _stats(pure=True)
+
+    assert not snapshot['compiled']
+    assert snapshot['skipped'] == []
+    assert snapshot['calls']['RGBA.blend']['count'] == 1
+    # reached through `RGBA.blend`
+    assert snapshot['calls']['BlendMode.compose']['count'] == 1
+    assert snapshot['calls']['Palette.add_color']['count'] == 1
+
+
+def test_compiled_methods_are_skipped() -> None:
+    snapshot = _stats(pure=False)
+    if not snapshot['compiled']:
+        pytest.skip("pinkie is not compiled, run build.py first")
+
+    assert {'RGBA.blend', 'BlendMode.compose', 'HSLA.to_rgba'} <= set(snapshot['skipped'])
+    assert not [
+        name for name in snapshot['calls']
+        if name.partition('.')[0] in ('RGBA', 'HSLA', 'CMYK', 'BlendMode')
+    ]
+    # pure Python classes are still counted
+    assert snapshot['calls']['Palette.add_color']['count'] == 1
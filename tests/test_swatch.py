@@ -0,0 +1,135 @@
+import struct
+
+import pytest
+
+from pinkie import RGBA, Palette, swatch
+
+
+def _palette(bits: int, num: int = 20, opaque: bool = False) -> Palette:
+    max_one = (1 << bits) - 1
+    colors = []
+    for i in range(num):
+        value = (i * 0x9E3779B97F4A7C15) & ((1 << bits * 4) - 1)
+        colors.append(RGBA(value | max_one if opaque else value, bits))
+
+    return Palette(*colors)
+
+
+@pytest.mark.parametrize('bits', [4, 8, 12, 16, 20])
+def test_binary_round_trip(bits: int) -> None:
+    palette = _palette(bits)
+    loaded = swatch.loads_binary(swatch.dumps_binary(palette))
+
+    assert loaded.bits == bits
+    assert list(loaded._live()) == list(palette._live())
+
+
+def test_binary_empty() -> None:
+    assert len(swatch.loads_binary(swatch.dumps_binary(Palette()))) == 0
+
+
+def test_binary_invalid() -> None:
+    data = swatch.dumps_binary(_palette(8))
+    with pytest.raises(ValueError):
+        swatch.loads_binary(b'XXXX' + data[4:])
+    with pytest.raises(ValueError):
+        swatch.loads_binary(data[:-1])
+
+
+@pytest.mark.parametrize('use_mmap', [False, True])
+def test_file_round_trip(tmp_path, use_mmap: bool) -> None:
+    palette = _palette(8)
+    for name in ('colors.bin', 'colors.gpl', 'colors.aco', 'colors.json'):
+        path = tmp_path / name
+        swatch.save(palette, path)
+        loaded = swatch.load(path, use_mmap=use_mmap)
+
+        # GIMP and Adobe palettes drop alpha
+        if name.endswith(('.gpl', '.aco')):
+            assert [c.rgb for c in loaded] == [c.rgb for c in palette]
+        else:
+            assert list(loaded._live()) == list(palette._live())
+
+
+def test_gpl_round_trip() -> None:
+    palette = _palette(8, opaque=True)
+    text = swatch.dumps_gpl(palette, "Test")
+
+    assert text.startswith("GIMP Palette\nName: Test\n")
+    assert list(swatch.loads_gpl(text)._live()) == list(palette._live())
+
+
+def test_gpl_names_and_comments() -> None:
+    text = "GIMP Palette\nName: Test\nColumns: 4\n# comment\n\n255 0 0 Red\n0 255 0\t17\n"
+    assert [c.rgba for c in swatch.loads_gpl(text)] == [(255, 0, 0, 255), (0, 255, 0, 255)]
+
+
+@pytest.mark.parametrize('line', ["255 0", "255", "255 0 x", "red green blue"])
+def test_gpl_invalid_line(line: str) -> None:
+    with pytest.raises(ValueError):
+        swatch.loads_gpl(f"GIMP Palette\n{line}\n")
+
+
+def test_gpl_invalid_header() -> None:
+    with pytest.raises(ValueError):
+        swatch.loads_gpl("255 0 0\n")
+
+
+@pytest.mark.parametrize('bits', [8, 16])
+def test_aco_round_trip(bits: int) -> None:
+    palette = _palette(bits, opaque=True)
+    loaded = swatch.loads_aco(swatch.dumps_aco(palette), bits)
+    assert list(loaded._live()) == list(palette._live())
+
+
+def test_aco_version_2_only() -> None:
+    palette = Palette(RGBA(0xff0000ff), RGBA(0x00ff00ff))
+    data = swatch.dumps_aco(palette)
+    # skip the version 1 section, entries are 10 bytes each
+    loaded = swatch.loads_aco(data[4 + len(palette) * 10:])
+
+    assert [c.rgba for c in loaded] == [(255, 0, 0, 255), (0, 255, 0, 255)]
+
+
+def test_aco_grayscale() -> None:
+    data = struct.pack('>HH', 1, 2) + struct.pack('>5H', 8, 0, 0, 0, 0) + struct.pack('>5H', 8, 10000, 0, 0, 0)
+    assert [c.rgb for c in swatch.loads_aco(data)] == [(255, 255, 255), (0, 0, 0)]
+
+
+@pytest.mark.parametrize('data', [
+    b'',
+    struct.pack('>HH', 3, 0),
+    struct.pack('>HH', 1, 2) + bytes(10),
+    struct.pack('>HH', 2, 1) + bytes(10) + struct.pack('>I', 4) + bytes(2),
+    struct.pack('>HH', 1, 1) + struct.pack('>5H', 2, 0, 0, 0, 0),
+])
+def test_aco_invalid(data: bytes) -> None:
+    with pytest.raises(ValueError):
+        swatch.loads_aco(data)
+
+
+@pytest.mark.parametrize('bits', [4, 8, 12, 16, 20])
+def test_json_round_trip(bits: int) -> None:
+    palette = _palette(bits)
+    loaded = swatch.loads_json(swatch.dumps_json(palette))
+
+    assert loaded.bits == bits
+    assert list(loaded._live()) == list(palette._live())
+
+
+def test_json_empty() -> None:
+    assert len(swatch.loads_json(swatch.dumps_json(Palette()))) == 0
+
+
+@pytest.mark.parametrize('text', [
+    '[]',
+    '{"bits": 8}',
+    '{"bits": 2, "colors": ["FF"]}',
+    '{"bits": 6, "colors": ["FFFFFF"]}',
+    '{"bits": "8", "colors": ["FF0000FF"]}',
+    '{"bits": 8, "colors": ["FF0000"]}',
+    '{"bits": 8, "colors": [255]}',
+])
+def test_json_invalid(text: str) -> None:
+    with pytest.raises(ValueError):
+        swatch.loads_json(text)